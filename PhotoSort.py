@@ -2,21 +2,30 @@
 import ctypes
 import datetime
 import gc
+import hashlib
 import io
+import heapq
+import itertools
 import json
+import sqlite3
 import os
 import queue
 import shutil
+import struct
 import subprocess
 import sys
 import threading
 import time
+import types
+import atexit
 import logging
 import logging.handlers
-from functools import partial
+from functools import lru_cache, partial
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import Process, Queue, cpu_count, freeze_support
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait as wait_futures
+from concurrent.futures.thread import BrokenThreadPool, _WorkItem
+from multiprocessing import Process, Queue, cpu_count, freeze_support, shared_memory
 
 from pathlib import Path
 import platform
@@ -31,12 +40,14 @@ import pillow_heif
 
 # PySide6 - Qt framework imports
 from PySide6.QtCore import (Qt, QEvent, QMetaObject, QObject, QPoint, Slot,
-                           QThread, QTimer, QUrl, Signal, Q_ARG, QRect, QPointF,
-                           QMimeData, QAbstractListModel, QModelIndex, QSize, QSharedMemory)
+                           QThread, QTimer, QUrl, Signal, Q_ARG, QRect, QRectF, QPointF,
+                           QMimeData, QAbstractListModel, QModelIndex, QSize, QSharedMemory, QMargins,
+                           QBuffer, QIODevice)
 
 from PySide6.QtGui import (QAction, QColor, QDesktopServices, QFont, QGuiApplication, 
                           QImage, QImageReader, QKeyEvent, QMouseEvent, QPainter, QPalette, QIcon,
-                          QPen, QPixmap, QWheelEvent, QFontMetrics, QKeySequence, QDrag)
+                          QPen, QPixmap, QPixmapCache, QWheelEvent, QFontMetrics, QKeySequence, QDrag,
+                          QStaticText, QTransform)
 from PySide6.QtWidgets import (QApplication, QButtonGroup, QCheckBox, QComboBox,
                               QDialog, QFileDialog, QFrame, QGridLayout, 
                               QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
@@ -48,6 +59,18 @@ from PySide6.QtWidgets import (QApplication, QButtonGroup, QCheckBox, QComboBox,
 
 
 # 로깅 시스템 설정
+_log_listener = None  # 파일 쓰기를 담당하는 QueueListener (setup_logger에서 생성)
+
+def stop_log_listener():
+    """대기 중인 로그를 모두 파일에 기록하고 로그 리스너 스레드를 종료합니다 (여러 번 호출해도 안전)."""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
 def setup_logger():
     # 로그 디렉터리 생성 (실행 파일과 동일한 위치에 logs 폴더 생성)
     if getattr(sys, 'frozen', False):
@@ -90,13 +113,25 @@ def setup_logger():
     log_filename = datetime.now().strftime("photosort_%Y%m%d.log")
     log_path = log_dir / log_filename
     
+    # 디버그 모드 여부 (환경 변수 PHOTOSORT_DEBUG=1 로 활성화)
+    debug_mode = os.environ.get("PHOTOSORT_DEBUG", "").lower() in ("1", "true", "yes")
+
     # 로그 형식 설정
-    log_format = "%(asctime)s - %(levelname)s - %(name)s - %(filename)s:%(lineno)d - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
+    if debug_mode:
+        log_format = "%(asctime)s - %(levelname)s - %(name)s - %(filename)s:%(lineno)d - %(message)s"
+    else:
+        # 배포 환경: 로그 호출마다 스택 프레임을 탐색하는 filename/lineno 및 스레드/프로세스 정보 수집 생략
+        log_format = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
     
     # 루트 로거 설정
     logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)  # 개발 환경에서는 DEBUG, 배포 환경에서는 INFO 또는 WARNING
+    # 배포 환경에서는 INFO 미만 로그를 로거 단계에서 바로 걸러 포맷 비용을 없앰
+    logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
     
     # 파일 핸들러 설정 (로테이션 적용)
     # RotatingFileHandler의 backupCount는 동일한 실행 세션 내에서의 로테이션을 관리하므로,
@@ -104,9 +139,15 @@ def setup_logger():
     file_handler = logging.handlers.RotatingFileHandler(
         log_path, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8'
     )
-    file_handler.setLevel(logging.INFO)
+    file_handler.setLevel(logging.DEBUG if debug_mode else logging.INFO)
     file_handler.setFormatter(logging.Formatter(log_format, date_format))
-    logger.addHandler(file_handler)
+    # 파일 쓰기/로테이션은 백그라운드 리스너 스레드에서 처리하고, 로거에는 큐에 넣기만 하는 핸들러를 연결
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(stop_log_listener)
     
     # 콘솔 핸들러 설정 (디버깅용)
     console_handler = logging.StreamHandler()
@@ -121,19 +162,599 @@ def setup_logger():
 # 로거 초기화
 logger = setup_logger()
 
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+_DARK_MODE_ON = ctypes.c_int(1)  # DwmSetWindowAttribute에 넘기는 값 (읽기 전용이므로 공유)
+
+@lru_cache(maxsize=1)
+def _dwm_set_window_attribute():
+    """dwmapi.dll의 DwmSetWindowAttribute를 한 번만 로드/조회하여 재사용합니다 (Windows 전용).
+    대화상자를 열 때마다 DLL 로드와 함수 이름 조회를 반복하지 않습니다."""
+    return ctypes.WinDLL("dwmapi").DwmSetWindowAttribute
+
 def apply_dark_title_bar(widget):
     """주어진 위젯의 제목 표시줄에 다크 테마를 적용합니다 (Windows 전용)."""
     if sys.platform == "win32":
         try:
-            import ctypes
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            dwmapi = ctypes.WinDLL("dwmapi")
             hwnd = int(widget.winId())
-            value = ctypes.c_int(1)
-            dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(value), ctypes.sizeof(value))
+            _dwm_set_window_attribute()(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
+                                        ctypes.byref(_DARK_MODE_ON), ctypes.sizeof(_DARK_MODE_ON))
         except Exception as e:
             logging.error(f"{type(widget).__name__} 제목 표시줄 다크 테마 적용 실패: {e}")
 
+@lru_cache(maxsize=16)
+def cached_font(family, size, bold=False):
+    """(글꼴, 크기, 굵기)별로 QFont를 한 번만 만들어 재사용합니다. 반환된 객체는 수정하지 마세요."""
+    font = QFont(family, size)
+    font.setBold(bold)
+    return font
+
+@lru_cache(maxsize=16)
+def cached_font_metrics(family, size, bold=False):
+    """cached_font()에 대한 QFontMetrics를 재사용합니다 (레이블마다 글꼴 측정 반복 방지)."""
+    return QFontMetrics(cached_font(family, size, bold))
+
+def iter_photos(root, exts):
+    """os.scandir로 폴더 바로 아래의 지원 확장자 파일을 나열합니다 (하위 폴더는 탐색하지 않음).
+
+    DirEntry는 디렉터리 조회 시 받은 파일 종류 정보를 재사용하므로 Path.iterdir() + is_file()이나
+    확장자별 glob 반복보다 시스템 호출이 훨씬 적습니다. exts는 소문자 확장자 컬렉션입니다.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if os.path.splitext(entry.name)[1].lower() in exts and entry.is_file():
+                yield entry
+
+RAW_BUFFER_MAX_BYTES = 200 * 1024 * 1024  # 이보다 큰 RAW는 통째로 메모리에 올리지 않음
+
+def load_raw_buffered(path):
+    """RAW 파일을 한 번에 메모리로 읽어 rawpy로 엽니다.
+
+    파일 경로를 rawpy.imread()에 직접 넘기면 LibRaw가 작은 랜덤 읽기를 반복하므로
+    (특히 네트워크 드라이브에서 느림), 파일 전체를 한 번의 순차 읽기로 가져온 뒤
+    버퍼로 전달합니다. 반환값은 rawpy.imread()와 동일하게 with 문으로 사용합니다.
+    RAW_BUFFER_MAX_BYTES보다 큰 파일은 메모리 사용을 제한하기 위해 기존처럼 경로로 엽니다.
+    """
+    path = str(path)
+    try:
+        if os.path.getsize(path) > RAW_BUFFER_MAX_BYTES:
+            return rawpy.imread(path)
+    except OSError:
+        pass  # 크기를 알 수 없으면 아래에서 읽기 오류가 그대로 전달됨
+    with open(path, 'rb') as f:
+        data = f.read()
+    return rawpy.imread(io.BytesIO(data))
+
+def raw_postprocess_options(quality='full'):
+    """RAW 디코딩 품질에 맞는 rawpy.postprocess() 인자를 반환합니다.
+
+    - 'full': 확대/전체 화면용 원본 해상도 디코딩 (기본 디모자이크)
+    - 'thumbnail': 어차피 축소될 썸네일용. half_size는 2x2 픽셀을 묶어 디모자이크를 생략하므로
+      면적 1/4로 훨씬 빠르며, 보간 알고리즘도 가장 가벼운 LINEAR로 지정합니다.
+    자동 밝기와 카메라 방향 적용은 두 품질 모두 유지하여 축소 후 결과가 전체 디코딩과 같아 보이게 합니다.
+    """
+    options = {'use_camera_wb': True, 'output_bps': 8}
+    if quality == 'thumbnail':
+        options['half_size'] = True
+        options['demosaic_algorithm'] = rawpy.DemosaicAlgorithm.LINEAR
+    return options
+
+def decode_raw_preview(path):
+    """내장 미리보기가 없는 RAW 파일을 썸네일 품질(half_size)로 디코딩하여 PIL 이미지로 반환합니다.
+
+    결과에는 LibRaw가 카메라 방향을 이미 적용한 상태입니다.
+    """
+    with load_raw_buffered(path) as raw:
+        rgb = raw.postprocess(**raw_postprocess_options('thumbnail'))
+    return Image.fromarray(rgb)
+
+# EXIF 방향 -> 픽셀 배열(행, 열, 채널) 뷰 변환. 슬라이싱/축 교환은 복사 없이 뷰만 만듦
+_ORIENTATION_VIEWS = {
+    2: lambda a: a[:, ::-1],
+    3: lambda a: a[::-1, ::-1],
+    4: lambda a: a[::-1],
+    5: lambda a: a.swapaxes(0, 1),
+    6: lambda a: a.swapaxes(0, 1)[:, ::-1],
+    7: lambda a: a.swapaxes(0, 1)[::-1, ::-1],
+    8: lambda a: a.swapaxes(0, 1)[::-1],
+}
+
+def display_qimage(qimage):
+    """QImage를 QPixmap.fromImage가 변환/복사 없이 공유하는 포맷(RGB32/ARGB32_Premultiplied)으로 맞춥니다.
+
+    QPixmap은 GUI 스레드에서만 안전하므로 작업 스레드는 이 형태의 QImage까지만 만들고,
+    GUI 스레드의 fromImage는 픽셀을 공유하며 cacheKey()도 원본 QImage와 같게 유지됩니다.
+    포맷이 다르면 변환 결과는 픽셀을 직접 소유하는 새 QImage입니다.
+    """
+    target = QImage.Format_ARGB32_Premultiplied if qimage.hasAlphaChannel() else QImage.Format_RGB32
+    if qimage.format() == target:
+        return qimage
+    return qimage.convertToFormat(target)
+
+def qimage_from_pil(image, orientation=1):
+    """PIL 이미지를 EXIF 방향을 적용한, 픽셀을 직접 소유하는 QImage로 변환합니다.
+
+    방향 적용은 NumPy 뷰로 처리하므로 PIL transpose + tobytes처럼 전체 픽셀을 두 번 복사하지 않으며,
+    display_qimage 변환이 Qt 소유 메모리로의 복사를 겸하므로 중간 배열은 바로 해제됩니다.
+    """
+    pixels, img_format = _pil_pixels(image, orientation)
+    height, width = pixels.shape[:2]
+    return display_qimage(QImage(pixels.data, width, height, pixels.strides[0], img_format))
+
+def _pil_pixels(image, orientation):
+    """PIL 이미지를 QImage에 바로 넘길 수 있는 연속 배열과 QImage 포맷으로 변환합니다.
+
+    np.asarray가 PIL 내부 버퍼를 한 번 복사하며, 방향 적용은 뷰로 처리하므로
+    회전/반전이 있을 때만 연속 배열로 한 번 더 복사합니다.
+    """
+    if image.mode in ('P', 'RGBA'):
+        image = image.convert('RGBA')
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    img_format = QImage.Format_RGBA8888 if image.mode == 'RGBA' else QImage.Format_RGB888
+    pixels = np.asarray(image)
+    orient_view = _ORIENTATION_VIEWS.get(orientation)
+    if orient_view is not None:
+        pixels = np.ascontiguousarray(orient_view(pixels))
+    return pixels, img_format
+
+def decode_jpeg_bytes_to_qimage(data):
+    """메모리의 JPEG 바이트를 Qt로 바로 디코딩합니다 (EXIF 방향 자동 적용).
+
+    반환값: (QImage, 방향 적용 전 원본 너비, 원본 높이). 실패 시 QImage는 null입니다.
+    """
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer, b"jpeg")
+    reader.setAutoTransform(True)
+    size = reader.size()
+    qimage = reader.read()
+    buffer.close()
+    return qimage, size.width(), size.height()
+
+def load_jpeg_preview(source, target_w, target_h):
+    """축소 표시용 PIL 이미지를 빠르게 로드합니다.
+
+    JPEG의 경우 Image.draft()로 libjpeg가 DCT 단계에서 1/2~1/8 배율로 디코딩하도록 하여
+    전체 해상도 디코딩을 피합니다. (JPEG가 아닌 형식에서는 draft가 무시됩니다.)
+    source는 파일 경로 또는 파일 객체(BytesIO 등)입니다.
+    반환값: (PIL 이미지, EXIF 방향 값)
+    """
+    image = Image.open(source)
+    orientation = read_image_orientation(image)
+    # draft는 요청 크기 이상으로만 줄이므로, 품질을 위해 2배 크기로 요청 후 thumbnail로 마무리
+    image.draft('RGB', (target_w * 2, target_h * 2))
+    image.thumbnail((target_w, target_h), Image.Resampling.BICUBIC)
+    return image, orientation
+
+def read_image_orientation(image):
+    """열린 PIL 이미지의 EXIF 방향 값(1~8)을 반환합니다 (픽셀 디코딩 없음).
+
+    헤더를 열 때 PIL이 이미 꺼내 둔 EXIF 원본 바이트에서 방향 태그만 직접 읽고,
+    원본 바이트가 없을 때만 getexif()로 전체 IFD0를 파싱합니다.
+    """
+    orientation = _exif_orientation(image.info.get('exif'))
+    if orientation is not None:
+        return orientation
+    try:
+        exif = image.getexif()
+        if exif and 0x0112 in exif:
+            return exif[0x0112]
+    except Exception:
+        pass
+    return 1
+
+def _exif_orientation(exif_bytes):
+    """EXIF 원본 바이트(APP1의 b'Exif\\0\\0' + TIFF 헤더)에서 IFD0의 방향 태그(0x0112)만 읽습니다.
+    방향 태그가 없으면 1(기본 방향), 바이트가 없거나 형식이 올바르지 않으면 None을 반환합니다.
+    """
+    if not exif_bytes:
+        return None
+    base = 6 if exif_bytes[:6] == b'Exif\x00\x00' else 0
+    byte_order = exif_bytes[base:base + 2]
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        return None
+    try:
+        ifd0 = base + struct.unpack_from(endian + 'I', exif_bytes, base + 4)[0]
+        entry_count = struct.unpack_from(endian + 'H', exif_bytes, ifd0)[0]
+        for entry in range(ifd0 + 2, ifd0 + 2 + entry_count * 12, 12):
+            tag = struct.unpack_from(endian + 'H', exif_bytes, entry)[0]
+            if tag == 0x0112:
+                value = struct.unpack_from(endian + 'H', exif_bytes, entry + 8)[0]
+                return value if 1 <= value <= 8 else None
+    except struct.error:
+        return None
+    return 1
+
+def parse_exif_datetime(date_str):
+    """EXIF 날짜 문자열("YYYY:MM:DD HH:MM:SS")을 datetime으로 변환합니다.
+    가장 흔한 고정 폭 형식은 strptime 대신 슬라이싱으로 직접 변환하고,
+    그 외 형식만 strptime으로 처리합니다. 변환 실패 시 ValueError가 발생합니다.
+    """
+    if (len(date_str) == 19 and date_str[4] == ':' and date_str[7] == ':' and date_str[10] == ' '
+            and date_str[13] == ':' and date_str[16] == ':'):
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                            int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
+
+EXIF_HEAD_BYTES = 128 * 1024
+NO_EXIF_EXTENSIONS = {'.bmp', '.gif'}  # EXIF를 담지 않는 형식 (piexif 파싱 생략)
+
+def _empty_exif():
+    return {"0th": {}, "Exif": {}, "GPS": {}, "Interop": {}, "1st": {}, "thumbnail": None}
+
+def _read_jpeg_exif_segment(f):
+    """JPEG 마커를 따라가며 EXIF APP1 세그먼트의 페이로드("Exif\\0\\0" + TIFF)만 읽습니다.
+    다른 세그먼트는 길이만큼 건너뛰고, 영상 데이터(SOS) 이전에 APP1이 없으면 None을 반환합니다.
+    """
+    if f.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        while marker[1] == 0xFF:  # 채움 바이트
+            next_byte = f.read(1)
+            if not next_byte:
+                return None
+            marker = b"\xff" + next_byte
+        code = marker[1]
+        if code in (0xD9, 0xDA):  # EOI / SOS
+            return None
+        if code == 0x01 or 0xD0 <= code <= 0xD7:  # 길이 없는 마커
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = int.from_bytes(length_bytes, "big")
+        if length < 2:
+            return None
+        if code == 0xE1:
+            payload = f.read(length - 2)
+            if payload.startswith(b"Exif\x00\x00"):
+                return payload
+        else:
+            f.seek(length - 2, 1)
+
+def _read_png_exif_chunk(f):
+    """PNG 청크 헤더만 따라가며 eXIf 청크(TIFF 데이터)를 읽습니다. 없으면 None."""
+    if f.read(8) != b"\x89PNG\r\n\x1a\n":
+        return None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        length = int.from_bytes(header[:4], "big")
+        chunk_type = header[4:]
+        if chunk_type == b"eXIf":
+            return f.read(length)
+        if chunk_type in (b"IDAT", b"IEND"):  # eXIf는 IDAT보다 앞에 위치
+            return None
+        f.seek(length + 4, 1)  # 데이터 + CRC 건너뛰기
+
+def load_exif_fast(path):
+    """EXIF가 있는 부분만 읽어 piexif로 파싱합니다.
+
+    JPEG는 마커를 따라가 APP1 세그먼트만, PNG는 eXIf 청크만 읽고, EXIF가 없는 형식은
+    파일을 열지 않습니다. 그 밖의 형식(TIFF 기반 RAW 등)은 EXIF가 대부분 파일 앞쪽에 있으므로
+    앞부분(128KB)만 읽습니다. 부분 데이터로 파싱에 실패하면 기존처럼 파일 전체로 다시 시도합니다.
+    """
+    path = str(path)
+    ext = os.path.splitext(path)[1].lower()
+    if ext in NO_EXIF_EXTENSIONS:
+        return _empty_exif()
+    try:
+        with open(path, 'rb') as f:
+            if ext in ('.jpg', '.jpeg'):
+                data = _read_jpeg_exif_segment(f)
+                if data is None:
+                    return _empty_exif()
+            elif ext == '.png':
+                data = _read_png_exif_chunk(f)
+                if data is None:
+                    return _empty_exif()
+            else:
+                data = f.read(EXIF_HEAD_BYTES)
+        return piexif.load(data)
+    except Exception:
+        return piexif.load(path)
+
+def _exif_as_int(value):
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+def _exif_as_text(value):
+    return value.decode('utf-8', errors='ignore') if isinstance(value, bytes) else None
+
+def _exif_as_stripped_text(value):
+    text = _exif_as_text(value)
+    return text.strip() if text is not None else None
+
+def _exif_as_ratio(value):
+    if isinstance(value, tuple) and len(value) == 2 and value[1] != 0:
+        return value[0] / value[1]
+    return None
+
+def _exif_as_scalar(value):
+    """ISOSpeedRatings처럼 여러 값(tuple)으로 기록될 수 있는 태그는 첫 번째 값만 사용합니다."""
+    if isinstance(value, (tuple, list)):
+        return value[0] if value else None
+    return value
+
+# piexif 태그 -> (결과 키, 변환 함수). 변환 결과가 None이면 무시하고, 이미 값이 있는 키는 덮어쓰지 않음.
+# Exif IFD를 먼저 적용하므로 촬영 일시는 DateTimeOriginal이 0th IFD의 DateTime보다 우선함
+EXIF_IFD_FIELD_MAP = {
+    piexif.ExifIFD.DateTimeOriginal: ("exif_datetime", _exif_as_text),
+    piexif.ExifIFD.FocalLength: ("exif_focal_mm", _exif_as_ratio),
+    piexif.ExifIFD.FocalLengthIn35mmFilm: ("exif_focal_35mm", _exif_as_scalar),
+    piexif.ExifIFD.ExposureTime: ("exif_exposure_time", _exif_as_ratio),
+    piexif.ExifIFD.FNumber: ("exif_fnumber", _exif_as_ratio),
+    piexif.ExifIFD.ISOSpeedRatings: ("exif_iso", _exif_as_scalar),
+}
+IFD0_FIELD_MAP = {
+    piexif.ImageIFD.Orientation: ("exif_orientation", _exif_as_int),
+    piexif.ImageIFD.Make: ("exif_make", _exif_as_stripped_text),
+    piexif.ImageIFD.Model: ("exif_model", _exif_as_stripped_text),
+    piexif.ImageIFD.DateTime: ("exif_datetime", _exif_as_text),
+}
+
+def apply_exif_fields(result, exif_dict):
+    """piexif.load() 결과에서 필요한 태그만 골라 result의 비어 있는 항목을 채웁니다."""
+    for ifd_name, field_map in (("Exif", EXIF_IFD_FIELD_MAP), ("0th", IFD0_FIELD_MAP)):
+        ifd = exif_dict.get(ifd_name)
+        if not ifd:
+            continue
+        for tag, (key, convert) in field_map.items():
+            if result[key] is not None and result[key] != "":
+                continue
+            raw_value = ifd.get(tag)
+            if raw_value is None:
+                continue
+            value = convert(raw_value)
+            if value is not None:
+                result[key] = value
+
+class ThumbnailCache:
+    """썸네일을 디스크에 캐싱하여 폴더를 다시 열 때 디코딩을 생략하는 클래스 (스레드 안전)
+
+    키는 파일 앞부분 64KB + 파일 크기 + 수정 시간 + 썸네일 크기의 해시로 만들어,
+    파일 전체를 해싱하지 않으면서도 내용이 바뀌면 자동으로 무효화되도록 합니다.
+    투명도가 있는 썸네일은 PNG, 나머지는 JPG로 저장하며, 캐시 폴더 전체 용량은
+    앱 시작 시 prune()이 MAX_BYTES 이하로 유지합니다 (최근에 사용되지 않은 파일부터 삭제).
+    """
+    _cache_dir = Path.home() / ".cache" / "photosort" / "thumbs"
+    _HEAD_BYTES = 64 * 1024
+    _dir_ready = False
+    MAX_BYTES = 512 * 1024 * 1024  # 썸네일 캐시 폴더 최대 용량
+    PRUNE_TARGET = 0.8  # 상한 초과 시 이 비율까지 한 번에 비움
+    _EXTENSIONS = (".jpg", ".png")
+
+    @classmethod
+    def _make_key(cls, file_path, size):
+        stat = os.stat(file_path)
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            hasher.update(f.read(cls._HEAD_BYTES))
+        hasher.update(f"{stat.st_size}:{stat.st_mtime_ns}:{size}".encode())
+        return hasher.hexdigest()
+
+    @classmethod
+    def lookup(cls, file_path, size):
+        """캐시 키 경로(확장자 없음)와 캐시된 썸네일 QImage를 반환합니다.
+        반환값: (QImage 또는 None, 캐시 키 경로 또는 None)
+        """
+        try:
+            cache_key_path = cls._cache_dir / cls._make_key(file_path, size)
+        except OSError as e:
+            logging.debug(f"썸네일 캐시 키 생성 실패 ({Path(file_path).name}): {e}")
+            return None, None
+        for ext in cls._EXTENSIONS:
+            cache_path = cache_key_path.with_suffix(ext)
+            if cache_path.exists():
+                qimage = QImage(str(cache_path))
+                if not qimage.isNull():
+                    return qimage, cache_key_path
+        return None, cache_key_path
+
+    @classmethod
+    def store(cls, cache_key_path, qimage):
+        """썸네일 QImage를 캐시에 저장합니다. 이미 캐시된 경우 다시 저장하지 않습니다.
+        투명도가 있으면 JPG로 저장할 때 검은 배경으로 합쳐지므로 PNG로 저장합니다."""
+        if cache_key_path is None or qimage is None or qimage.isNull():
+            return
+        image_format = "PNG" if qimage.hasAlphaChannel() else "JPG"
+        cache_path = cache_key_path.with_suffix(f".{image_format.lower()}")
+        if cache_path.exists():
+            return
+        try:
+            if not cls._dir_ready:
+                cls._cache_dir.mkdir(parents=True, exist_ok=True)
+                cls._dir_ready = True
+            # 다른 스레드가 불완전한 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{threading.get_ident()}.tmp")
+            if qimage.save(str(tmp_path), image_format, 85 if image_format == "JPG" else -1):
+                os.replace(tmp_path, cache_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as e:
+            logging.debug(f"썸네일 캐시 저장 실패 ({cache_path.name}): {e}")
+
+    @classmethod
+    def prune(cls):
+        """캐시 폴더가 MAX_BYTES를 넘으면 가장 오래 사용되지 않은 파일부터 PRUNE_TARGET 비율까지 삭제합니다.
+        남아 있는 임시(.tmp) 파일도 함께 정리합니다. 반환값: 삭제한 파일 수
+        """
+        entries = []
+        total_bytes = 0
+        removed = 0
+        try:
+            with os.scandir(cls._cache_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.endswith(".tmp"):
+                        try:
+                            os.remove(entry.path)
+                            removed += 1
+                        except OSError:
+                            pass
+                        continue
+                    # atime은 noatime/relatime 설정에서 갱신되지 않을 수 있어 mtime과 함께 사용
+                    entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+                    total_bytes += stat.st_size
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logging.debug(f"썸네일 캐시 정리 실패: {e}")
+            return 0
+        if total_bytes > cls.MAX_BYTES:
+            target_bytes = cls.MAX_BYTES * cls.PRUNE_TARGET
+            for _, size, path in sorted(entries):
+                if total_bytes <= target_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total_bytes -= size
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logging.info(f"썸네일 캐시 정리: {removed}개 파일 삭제")
+        return removed
+
+class ExifDiskCache:
+    """ExifWorker의 추출 결과를 SQLite에 저장하여 폴더를 다시 열 때 EXIF 추출을 생략하는 클래스 (스레드 안전)
+
+    (절대 경로, 수정 시간, 파일 크기)가 모두 같을 때만 캐시를 사용하므로 파일이 편집되면 자동으로 다시 추출합니다.
+    추출 로직이나 결과 형식이 바뀌면 SCHEMA_VERSION을 올려 이전 버전으로 저장된 항목을 모두 무효화합니다.
+    """
+    SCHEMA_VERSION = 2
+    _db_path = Path.home() / ".cache" / "photosort" / "exif_cache.sqlite3"
+    _conn = None
+    _lock = threading.Lock()
+    _disabled = False
+
+    @classmethod
+    def _connection(cls):
+        if cls._conn is None and not cls._disabled:
+            try:
+                cls._db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(cls._db_path), check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != cls.SCHEMA_VERSION:
+                    # 다른 버전의 추출 로직으로 저장된 항목은 사용하지 않음
+                    conn.execute("DROP TABLE IF EXISTS exif")
+                    conn.execute(f"PRAGMA user_version = {int(cls.SCHEMA_VERSION)}")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS exif ("
+                    "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, data TEXT)"
+                )
+                cls._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"EXIF 디스크 캐시를 사용할 수 없습니다: {e}")
+                cls._disabled = True
+        return cls._conn
+
+    @staticmethod
+    def _file_key(image_path):
+        stat = os.stat(image_path)
+        return os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def lookup(cls, image_path):
+        """캐시된 EXIF 결과 딕셔너리를 반환합니다. 없거나 파일이 바뀌었으면 None."""
+        try:
+            path, mtime_ns, size = cls._file_key(image_path)
+            with cls._lock:
+                conn = cls._connection()
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT data FROM exif WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (path, mtime_ns, size)
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logging.debug(f"EXIF 캐시 조회 실패 ({Path(image_path).name}): {e}")
+            return None
+        if row is None:
+            return None
+        result = json.loads(row[0])
+        # JSON은 tuple을 list로 저장하므로 새로 추출한 결과와 같은 형식(tuple)으로 되돌림
+        for key, value in result.items():
+            if isinstance(value, list):
+                result[key] = tuple(value)
+        result["image_path"] = image_path
+        return result
+
+    @staticmethod
+    def _json_default(value):
+        """JSON으로 바로 저장할 수 없는 값 변환 (bytes는 "b'...'"가 아닌 디코딩된 문자열로)"""
+        if isinstance(value, bytes):
+            return value.decode('utf-8', errors='ignore').strip('\x00 ')
+        return str(value)
+
+    @classmethod
+    def store(cls, image_path, result):
+        """EXIF 결과를 현재 파일 상태(수정 시간/크기)와 함께 저장합니다."""
+        try:
+            path, mtime_ns, size = cls._file_key(image_path)
+            data = json.dumps(result, default=cls._json_default)
+            with cls._lock:
+                conn = cls._connection()
+                if conn is None:
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO exif (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+                    (path, mtime_ns, size, data)
+                )
+                conn.commit()
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+            logging.debug(f"EXIF 캐시 저장 실패 ({Path(image_path).name}): {e}")
+
+class ScaledPixmapCache:
+    """SmoothTransformation으로 축소한 QPixmap을 (원본 cacheKey, 너비, 높이) 단위로 캐싱하는 클래스 (GUI 스레드 전용)
+
+    같은 이미지를 같은 크기로 반복해서 그리는 경우(썸네일 델리게이트, 그리드 셀, 미니맵)
+    고품질 스케일링을 한 번만 수행합니다. 메모리는 픽셀 바이트 기준으로 제한합니다.
+    """
+    _cache = OrderedDict()
+    _max_bytes = 128 * 1024 * 1024
+    _current_bytes = 0
+
+    @classmethod
+    def get(cls, pixmap, width, height):
+        """pixmap을 (width, height) 안에 비율 유지로 맞춘 고품질 축소본을 반환합니다."""
+        if pixmap is None or pixmap.isNull():
+            return QPixmap()
+        key = (pixmap.cacheKey(), width, height)
+        scaled = cls._cache.get(key)
+        if scaled is not None:
+            cls._cache.move_to_end(key)
+            return scaled
+        scaled = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        cls._cache[key] = scaled
+        cls._current_bytes += scaled.width() * scaled.height() * 4
+        while cls._current_bytes > cls._max_bytes and len(cls._cache) > 1:
+            _, old = cls._cache.popitem(last=False)
+            cls._current_bytes -= old.width() * old.height() * 4
+        return scaled
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+        cls._current_bytes = 0
+
 class UIScaleManager:
     """해상도와 화면 비율에 따라 UI 크기를 동적으로 관리하는 클래스"""
 
@@ -254,7 +875,7 @@ class UIScaleManager:
             screen = QGuiApplication.primaryScreen()
             if not screen:
                 cls._current_settings = cls.NORMAL_SETTINGS.copy()
-                return
+                return  # finally에서 UI 네임스페이스 갱신
 
             geo = screen.geometry()
             width, height = geo.width(), geo.height()
@@ -285,6 +906,16 @@ class UIScaleManager:
         except Exception as e:
             logging.error(f"UIScaleManager 초기화 중 오류: {e}. 기본 UI 스케일을 사용합니다.")
             cls._current_settings = cls.NORMAL_SETTINGS.copy()
+        finally:
+            cls._publish()
+
+    @classmethod
+    def _publish(cls):
+        """현재 설정을 모듈 전역 UI 네임스페이스에 반영합니다 (UI.font_size 형태의 빠른 속성 접근용)."""
+        UI.__dict__.clear()
+        UI.__dict__.update(cls._current_settings)
+        # 레이아웃 여백은 QMargins로 한 번만 변환해 둠
+        UI.control_panel_qmargins = QMargins(*cls._current_settings["control_panel_margins"])
 
     @classmethod
     def is_compact_mode(cls):
@@ -292,12 +923,17 @@ class UIScaleManager:
 
     @classmethod
     def get(cls, key, default=None):
+        """하위 호환용 조회 함수. 자주 호출되는 경로에서는 UI.<key> 속성 접근을 사용합니다."""
         return cls._current_settings.get(key, default)
 
     @classmethod
     def get_margins(cls):
         return cls._current_settings.get("control_panel_margins")
 
+# 현재 UI 스케일 설정 (UIScaleManager.initialize() 시 갱신). 예: UI.font_size, UI.thumbnail_padding
+UI = types.SimpleNamespace()
+UIScaleManager._publish()
+
 class ThemeManager:
 
     _UI_COLORS_DEFAULT = {
@@ -460,7 +1096,53 @@ class ThemeManager:
     }
     
     _current_theme = "default"  # 현재 테마
+    _current_colors = THEMES["default"]  # 현재 테마 색상표 (get_color가 테마 이름 조회 없이 바로 사용)
     _theme_change_callbacks = []  # 테마 변경 시 호출할 콜백 함수 목록
+
+    # 색상만 들어가는 위젯 스타일시트 템플릿 ({색상키}는 현재 테마 색상으로 치환, 중괄호는 {{ }}로 표기)
+    _STYLESHEET_TEMPLATES = {
+        "file_list": """
+            QListWidget {{
+                background-color: {bg_secondary};
+                color: {text};
+                border: 1px solid {border};
+                border-radius: 4px;
+                padding: 5px;
+            }}
+            QListWidget::item {{
+                padding: 2px 0px;
+            }}
+            QListWidget::item:selected {{
+                background-color: {accent};
+                color: {bg_primary};
+            }}
+        """,
+        "session_list": """
+            QListWidget {{
+                background-color: {bg_secondary};
+                color: {text};
+                border: 1px solid {border};
+                border-radius: 3px; padding: 5px;
+            }}
+            QListWidget::item {{ padding: 3px 2px; }}
+            QListWidget::item:selected {{
+                background-color: {accent};
+                color: white; /* 선택 시 텍스트 색상 */
+            }}
+        """,
+        "section_label": "color: {text}; margin-top: 10px;",
+    }
+    _stylesheet_cache = {}  # (템플릿 이름, 테마 이름) -> 완성된 스타일시트
+
+    @classmethod
+    def get_stylesheet(cls, kind):
+        """_STYLESHEET_TEMPLATES의 스타일시트를 현재 테마 색상으로 채워 반환합니다 (테마별로 한 번만 생성)."""
+        key = (kind, cls._current_theme)
+        stylesheet = cls._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = cls._STYLESHEET_TEMPLATES[kind].format_map(cls._current_colors)
+            cls._stylesheet_cache[key] = stylesheet
+        return stylesheet
     
     @classmethod
     def generate_radio_button_style(cls):
@@ -468,24 +1150,24 @@ class ThemeManager:
         return f"""
             QRadioButton {{
                 color: {cls.get_color('text')};
-                padding: {UIScaleManager.get("radiobutton_padding")}px;
+                padding: {UI.radiobutton_padding}px;
             }}
             QRadioButton::indicator {{
-                width: {UIScaleManager.get("radiobutton_size")}px;
-                height: {UIScaleManager.get("radiobutton_size")}px;
+                width: {UI.radiobutton_size}px;
+                height: {UI.radiobutton_size}px;
             }}
             QRadioButton::indicator:checked {{
                 background-color: {cls.get_color('accent')};
-                border: {UIScaleManager.get("radiobutton_border")}px solid {cls.get_color('accent')};
-                border-radius: {UIScaleManager.get("radiobutton_border_radius")}px;
+                border: {UI.radiobutton_border}px solid {cls.get_color('accent')};
+                border-radius: {UI.radiobutton_border_radius}px;
             }}
             QRadioButton::indicator:unchecked {{
                 background-color: {cls.get_color('bg_primary')};
-                border: {UIScaleManager.get("radiobutton_border")}px solid {cls.get_color('border')};
-                border-radius: {UIScaleManager.get("radiobutton_border_radius")}px;
+                border: {UI.radiobutton_border}px solid {cls.get_color('border')};
+                border-radius: {UI.radiobutton_border_radius}px;
             }}
             QRadioButton::indicator:unchecked:hover {{
-                border: {UIScaleManager.get("radiobutton_border")}px solid {cls.get_color('text_disabled')};
+                border: {UI.radiobutton_border}px solid {cls.get_color('text_disabled')};
             }}
         """
 
@@ -495,31 +1177,31 @@ class ThemeManager:
         return f"""
             QCheckBox {{
                 color: {cls.get_color('text')};
-                padding: {UIScaleManager.get("checkbox_padding")}px;
+                padding: {UI.checkbox_padding}px;
             }}
             QCheckBox:disabled {{
                 color: {cls.get_color('text_disabled')};
             }}
             QCheckBox::indicator {{
-                width: {UIScaleManager.get("checkbox_size")}px;
-                height: {UIScaleManager.get("checkbox_size")}px;
+                width: {UI.checkbox_size}px;
+                height: {UI.checkbox_size}px;
             }}
             QCheckBox::indicator:checked {{
                 background-color: {cls.get_color('accent')};
-                border: {UIScaleManager.get("checkbox_border")}px solid {cls.get_color('accent')};
-                border-radius: {UIScaleManager.get("checkbox_border_radius")}px;
+                border: {UI.checkbox_border}px solid {cls.get_color('accent')};
+                border-radius: {UI.checkbox_border_radius}px;
             }}
             QCheckBox::indicator:unchecked {{
                 background-color: {cls.get_color('bg_primary')};
-                border: {UIScaleManager.get("checkbox_border")}px solid {cls.get_color('border')};
-                border-radius: {UIScaleManager.get("checkbox_border_radius")}px;
+                border: {UI.checkbox_border}px solid {cls.get_color('border')};
+                border-radius: {UI.checkbox_border_radius}px;
             }}
             QCheckBox::indicator:unchecked:hover {{
-                border: {UIScaleManager.get("checkbox_border")}px solid {cls.get_color('text_disabled')};
+                border: {UI.checkbox_border}px solid {cls.get_color('text_disabled')};
             }}
             QCheckBox::indicator:disabled {{
                 background-color: {cls.get_color('bg_disabled')};
-                border: {UIScaleManager.get("checkbox_border")}px solid {cls.get_color('text_disabled')};
+                border: {UI.checkbox_border}px solid {cls.get_color('text_disabled')};
             }}
         """
 
@@ -531,7 +1213,7 @@ class ThemeManager:
                 background-color: {cls.get_color('bg_secondary')};
                 color: {cls.get_color('text')};
                 border: none;
-                padding: {UIScaleManager.get("button_padding")}px;
+                padding: {UI.button_padding}px;
                 border-radius: 1px;
                 min-height: {UIScaleManager.get("button_min_height")}px;
             }}
@@ -551,7 +1233,7 @@ class ThemeManager:
     @classmethod
     def generate_dynamic_height_button_style(cls):
         """수직 패딩이 없고 수평 패딩만 있는 버튼 스타일을 생성합니다."""
-        horizontal_padding = UIScaleManager.get("button_padding")
+        horizontal_padding = UI.button_padding
         return f"""
             QPushButton {{
                 background-color: {cls.get_color('bg_secondary')};
@@ -600,17 +1282,147 @@ class ThemeManager:
             }}
         """
 
+    @classmethod
+    def generate_combobox_style(cls):
+        """현재 테마에 맞는 콤보박스 스타일 생성"""
+        return f"""
+            QComboBox {{
+                background-color: {cls.get_color('bg_secondary')};
+                color: {cls.get_color('text')};
+                border: none;
+                padding: {UI.combobox_padding}px;
+                border-radius: 1px;
+            }}
+            QComboBox:hover {{
+                background-color: #555555;
+            }}
+            QComboBox QAbstractItemView {{
+                background-color: {cls.get_color('bg_secondary')};
+                color: {cls.get_color('text')};
+                selection-background-color: #505050;
+                selection-color: {cls.get_color('text')};
+                border: 1px solid {cls.get_color('border')};
+                padding: 0px; /* 메뉴 자체의 내부 여백 */
+            }}
+            /* 드롭다운 메뉴의 각 항목(item)에 대한 스타일 */
+            QComboBox QAbstractItemView::item {{
+                /* padding-top과 padding-bottom으로 상하 간격을 조절합니다. */
+                padding: 6px 10px; /* 6px 상하, 10px 좌우 여백 */
+                min-height: 25px; /* 최소 높이를 지정하여 너무 좁아지지 않게 함 */
+            }}
+        """
+
+    @classmethod
+    def generate_settings_controls_style(cls):
+        """설정 창 라디오 버튼/체크박스/버튼 스타일 (메인 패널보다 여백이 넓음)을 생성합니다."""
+        return f"""
+            QRadioButton[themeRole="settingsRadio"] {{ color: {cls.get_color('text')}; padding: 5px 10px; }}
+            QRadioButton[themeRole="settingsRadio"]::indicator {{ width: {UI.radiobutton_size}px; height: {UI.radiobutton_size}px; }}
+            QRadioButton[themeRole="settingsRadio"]::indicator:checked {{ background-color: {cls.get_color('accent')}; border: {UI.radiobutton_border}px solid {cls.get_color('accent')}; border-radius: {UI.radiobutton_border_radius}px; }}
+            QRadioButton[themeRole="settingsRadio"]::indicator:unchecked {{ background-color: {cls.get_color('bg_primary')}; border: {UI.radiobutton_border}px solid {cls.get_color('border')}; border-radius: {UI.radiobutton_border_radius}px; }}
+            QRadioButton[themeRole="settingsRadio"]::indicator:unchecked:hover {{ border: {UI.radiobutton_border}px solid {cls.get_color('text_disabled')}; }}
+            QCheckBox[themeRole="settingsToggle"] {{ color: {cls.get_color('text')}; padding: 3px 5px; }}
+            QCheckBox[themeRole="settingsToggle"]::indicator {{ width: {UI.checkbox_size}px; height: {UI.checkbox_size}px; }}
+            QCheckBox[themeRole="settingsToggle"]::indicator:checked {{ background-color: {cls.get_color('accent')}; border: {UI.checkbox_border}px solid {cls.get_color('accent')}; border-radius: {UI.checkbox_border_radius}px; }}
+            QCheckBox[themeRole="settingsToggle"]::indicator:unchecked {{ background-color: {cls.get_color('bg_primary')}; border: {UI.checkbox_border}px solid {cls.get_color('border')}; border-radius: {UI.checkbox_border_radius}px; }}
+            QCheckBox[themeRole="settingsToggle"]::indicator:unchecked:hover {{ border: {UI.checkbox_border}px solid {cls.get_color('text_disabled')}; }}
+            QPushButton[themeRole="settingsAction"] {{
+                background-color: {cls.get_color('bg_secondary')}; color: {cls.get_color('text')};
+                border: none; padding: 8px 12px; border-radius: 4px;
+            }}
+            QPushButton[themeRole="settingsAction"]:hover {{ background-color: {cls.get_color('bg_hover')}; }}
+            QPushButton[themeRole="settingsAction"]:pressed {{ background-color: {cls.get_color('bg_pressed')}; }}
+        """
+
+    @staticmethod
+    def set_theme_role(widget, role):
+        """전역 스타일시트 선택자(QPushButton[themeRole="..."])로 스타일을 받도록 위젯 역할을 지정합니다."""
+        widget.setProperty("themeRole", role)
+
+    @staticmethod
+    def _scope_to_role(style, widget_type, role):
+        """위젯 단위 스타일시트를 특정 themeRole 위젯에만 적용되는 선택자로 바꿉니다."""
+        return style.replace(widget_type, f'{widget_type}[themeRole="{role}"]')
+
+    @classmethod
+    def build_global_stylesheet(cls):
+        """현재 테마로 앱 전체 스타일시트를 한 번에 생성합니다."""
+        settings_button_size = UI.settings_button_size
+        parts = [
+            f"""
+            QToolTip {{
+                color: {cls.get_color('text')};
+                background-color: {cls.get_color('bg_secondary')};
+                border: 1px solid {cls.get_color('border')};
+            }}
+            QSplitter::handle {{
+                background-color: {cls.get_color('bg_primary')};
+            }}
+            QSplitter::handle:horizontal {{
+                width: 1px;
+            }}
+            QFrame#HorizontalLine {{
+                background-color: {cls.get_color('border')};
+            }}
+            QLabel[themeRole="infoLabel"] {{
+                color: {cls.get_color('text')};
+            }}
+            QPushButton#settingsButton {{
+                background-color: {cls.get_color('bg_secondary')};
+                color: {cls.get_color('text')};
+                border: none;
+                border-radius: 3px;
+                font-size: {settings_button_size - 15}px;
+                padding: 0px;
+            }}
+            QPushButton#settingsButton:hover {{
+                background-color: {cls.get_color('accent_hover')};
+            }}
+            QPushButton#settingsButton:pressed {{
+                background-color: {cls.get_color('accent_pressed')};
+            }}
+            """,
+            cls._scope_to_role(cls.generate_main_button_style(), "QPushButton", "mainButton"),
+            cls._scope_to_role(cls.generate_dynamic_height_button_style(), "QPushButton", "dynamicButton"),
+            cls._scope_to_role(cls.generate_action_button_style(), "QPushButton", "actionButton"),
+            cls._scope_to_role(cls.generate_checkbox_style(), "QCheckBox", "toggle"),
+            cls._scope_to_role(cls.generate_radio_button_style(), "QRadioButton", "radio"),
+            cls._scope_to_role(cls.generate_combobox_style(), "QComboBox", "combo"),
+            cls.generate_settings_controls_style(),
+            f"""
+            QRadioButton[themeRole="radio"]:disabled {{
+                color: {cls.get_color('text_disabled')};
+            }}
+            """,
+        ]
+        return "\n".join(parts)
+
+    @classmethod
+    def apply_global_stylesheet(cls):
+        """앱 전체 스타일시트를 QApplication에 한 번만 설정합니다 (위젯별 재파싱 방지).
+        UI 스케일은 시작 시 한 번 정해지므로 완성된 문자열은 테마별로 캐시하여, 이전 테마로 돌아갈 때 다시 조립하지 않습니다."""
+        app = QApplication.instance()
+        if app is not None:
+            key = ("global", cls._current_theme)
+            stylesheet = cls._stylesheet_cache.get(key)
+            if stylesheet is None:
+                stylesheet = cls._stylesheet_cache[key] = cls.build_global_stylesheet()
+            app.setStyleSheet(stylesheet)
+
     @classmethod
     def get_color(cls, color_key):
         """현재 테마에서 색상 코드 가져오기"""
-        return cls.THEMES[cls._current_theme][color_key]
+        return cls._current_colors[color_key]
     
     @classmethod
     def set_theme(cls, theme_name):
         """테마 변경하고 모든 콜백 함수 호출"""
         if theme_name in cls.THEMES:
             cls._current_theme = theme_name
-            # 모든 콜백 함수 호출
+            cls._current_colors = cls.THEMES[theme_name]
+            # 역할 기반 위젯들은 전역 스타일시트 한 번으로 갱신
+            cls.apply_global_stylesheet()
+            # 나머지(QPainter 색상 등)는 콜백으로 처리
             for callback in cls._theme_change_callbacks:
                 callback()
             return True
@@ -757,6 +1569,7 @@ class LanguageManager:
     
     _current_language = "en"  # 기본 언어
     _language_change_callbacks = []  # 언어 변경 시 호출할 콜백 함수 목록
+    translate = None  # translate(text_id): 텍스트 ID의 번역 반환 (번역 없으면 원본). _bind_translate()가 현재 언어에 맞게 설정
     
     @classmethod
     def initialize_translations(cls, translations_data):
@@ -766,19 +1579,23 @@ class LanguageManager:
             cls._translations["en"][ko_text] = en_text
     
     @classmethod
-    def translate(cls, text_id):
-        """텍스트 ID에 해당하는 번역 반환"""
+    def _bind_translate(cls):
+        """현재 언어에 맞는 번역 함수를 translate에 미리 바인딩합니다.
+        UI 갱신 시 매우 자주 호출되므로, 호출마다의 언어 분기와 이중 dict 조회를 없앱니다.
+        """
         if cls._current_language == "ko":
-            return text_id  # 한국어는 원래 ID 그대로 사용
-        
-        translations = cls._translations.get(cls._current_language, {})
-        return translations.get(text_id, text_id)  # 번역 없으면 원본 반환
+            cls.translate = staticmethod(lambda text_id: text_id)  # 한국어는 원래 ID 그대로 사용
+        else:
+            # 번역 dict 객체 자체를 바인딩하므로 initialize_translations 이후 추가된 항목도 반영됨
+            lookup = cls._translations.get(cls._current_language, {}).get
+            cls.translate = staticmethod(lambda text_id: lookup(text_id, text_id))
     
     @classmethod
     def set_language(cls, language_code):
         """언어 설정 변경"""
         if language_code in cls.LANGUAGES:
             cls._current_language = language_code
+            cls._bind_translate()
             # 언어 변경 시 콜백 함수 호출
             for callback in cls._language_change_callbacks:
                 callback()
@@ -806,6 +1623,8 @@ class LanguageManager:
         """언어 코드에 해당하는 언어 이름 반환"""
         return cls.LANGUAGES.get(language_code, language_code)
 
+LanguageManager._bind_translate()
+
 class DateFormatManager:
     """날짜 형식 설정을 관리하는 클래스"""
     
@@ -824,6 +1643,7 @@ class DateFormatManager:
     }
     
     _current_format = "yyyy-mm-dd"  # 기본 형식
+    _current_pattern = _format_patterns["yyyy-mm-dd"]  # 현재 형식의 변환 패턴 (set_date_format에서 갱신)
     _format_change_callbacks = []  # 형식 변경 시 호출할 콜백 함수
     
     @classmethod
@@ -831,19 +1651,22 @@ class DateFormatManager:
         """날짜 문자열을 현재 설정된 형식으로 변환"""
         if not date_str:
             return "▪ -"
-        
+        # 같은 촬영분의 날짜는 반복되는 경우가 많으므로 (날짜, 패턴) 단위로 캐싱
+        return cls._format_date_cached(date_str, cls._current_pattern)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_date_cached(date_str, pattern):
         # 기존 형식(YYYY:MM:DD HH:MM:SS)에서 datetime 객체로 변환
         try:
             # EXIF 날짜 형식 파싱 (콜론 포함)
             if ":" in date_str:
-                dt = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+                dt = parse_exif_datetime(date_str)
             else:
                 # 콜론 없는 형식 시도 (다른 포맷의 가능성)
                 dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
             
-            # 현재 설정된 형식으로 변환하여 반환
-            pattern = cls._format_patterns.get(cls._current_format, "%Y-%m-%d")
-            # 시간 정보 추가
+            # 현재 설정된 형식으로 변환하여 반환 (시간 정보 추가)
             return f"▪ {dt.strftime(pattern)} {dt.strftime('%H:%M:%S')}"
         except (ValueError, TypeError) as e:
             # 다른 형식 시도 (날짜만 있는 경우)
@@ -852,7 +1675,6 @@ class DateFormatManager:
                     dt = datetime.strptime(date_str.split()[0], "%Y:%m:%d")
                 else:
                     dt = datetime.strptime(date_str.split()[0], "%Y-%m-%d")
-                pattern = cls._format_patterns.get(cls._current_format, "%Y-%m-%d")
                 return f"▪ {dt.strftime(pattern)}"
             except (ValueError, TypeError):
                 # 형식이 맞지 않으면 원본 반환
@@ -863,6 +1685,7 @@ class DateFormatManager:
         """날짜 형식 설정 변경"""
         if format_code in cls.DATE_FORMATS:
             cls._current_format = format_code
+            cls._current_pattern = cls._format_patterns.get(format_code, "%Y-%m-%d")
             # 형식 변경 시 콜백 함수 호출
             for callback in cls._format_change_callbacks:
                 callback()
@@ -905,19 +1728,32 @@ class QRLinkLabel(QLabel):
         self.hover_color = "#FFFFFF" # 또는 ThemeManager 사용
 
         # --- 스타일 및 커서 설정 ---
-        self.setStyleSheet(f"""
+        # 마우스 이동마다 문자열을 새로 만들지 않도록 일반/호버 스타일을 미리 생성
+        self._normal_ss = f"""
             color: {self.normal_color};
             text-decoration: none; /* 링크 밑줄 제거 원하면 */
             font-weight: normal;
-        """)
+        """
+        self._hover_ss = f"""
+            color: {self.hover_color};
+            text-decoration: none;
+            font-weight: bold;
+        """
+        self.setStyleSheet(self._normal_ss)
         self.setCursor(Qt.PointingHandCursor)
 
         # --- macOS가 아닌 경우에만 사용할 QR 팝업 멤버 ---
+        # 팝업은 처음 마우스를 올렸을 때 생성합니다 (시작 시 QR 이미지 로딩/스케일링 비용 제거)
         self.qr_popup_widget = None # 실제 팝업 QLabel 위젯 (macOS에서는 사용 안 함)
 
-        # --- macOS가 아닌 경우, 팝업 생성 (필요하다면) ---
-        if platform.system() != "Darwin" and self._qr_path:
-            self._create_non_mac_qr_popup()
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _get_scaled_qr_pixmap(qr_path, display_size):
+        """QR 이미지를 표시 크기로 스케일링한 QPixmap을 반환합니다 (같은 QR 파일/크기는 공유)."""
+        qr_pixmap = QPixmap(qr_path)
+        if qr_pixmap.isNull():
+            return qr_pixmap
+        return qr_pixmap.scaled(display_size, display_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
     def _create_non_mac_qr_popup(self):
         """macOS가 아닌 환경에서 사용할 QR 코드 팝업 QLabel을 생성합니다."""
@@ -932,10 +1768,8 @@ class QRLinkLabel(QLabel):
             "background-color: white; border-radius: 5px; padding: 5px; border: 1px solid #CCCCCC;"
         )
 
-        qr_pixmap = QPixmap(self._qr_path)
-        if not qr_pixmap.isNull():
-            scaled_pixmap = qr_pixmap.scaled(self._qr_display_size, self._qr_display_size,
-                                             Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled_pixmap = self._get_scaled_qr_pixmap(str(self._qr_path), self._qr_display_size)
+        if not scaled_pixmap.isNull():
             self.qr_popup_widget.setPixmap(scaled_pixmap)
             self.qr_popup_widget.adjustSize() # 콘텐츠 크기에 맞게 조절
         else:
@@ -943,11 +1777,7 @@ class QRLinkLabel(QLabel):
 
     def enterEvent(self, event):
         """마우스가 위젯에 들어왔을 때 스타일 변경 및 QR 코드/툴팁 표시"""
-        self.setStyleSheet(f"""
-            color: {self.hover_color};
-            text-decoration: none;
-            font-weight: bold;
-        """)
+        self.setStyleSheet(self._hover_ss)
 
         if platform.system() == "Darwin":
             if self._qr_path and Path(self._qr_path).exists():
@@ -958,7 +1788,9 @@ class QRLinkLabel(QLabel):
                 QToolTip.showText(self.mapToGlobal(event.pos()), html, self) # 세 번째 인자로 위젯 전달
             # else: macOS이지만 qr_path가 없으면 아무것도 안 함 (또는 기본 툴팁)
         else:
-            # 다른 OS: 생성된 팝업 위젯 표시
+            # 다른 OS: 팝업 위젯 표시 (처음 호버 시 생성)
+            if self.qr_popup_widget is None and self._qr_path:
+                self._create_non_mac_qr_popup()
             if self.qr_popup_widget and self.qr_popup_widget.pixmap() and not self.qr_popup_widget.pixmap().isNull():
                 # 팝업 위치 계산 (마우스 커서 근처 또는 라벨 위 등)
                 global_pos = self.mapToGlobal(QPoint(0, self.height())) # 라벨 하단 중앙 기준
@@ -992,11 +1824,7 @@ class QRLinkLabel(QLabel):
 
     def leaveEvent(self, event):
         """마우스가 위젯을 벗어났을 때 스타일 복원 및 QR 코드/툴팁 숨김"""
-        self.setStyleSheet(f"""
-            color: {self.normal_color};
-            text-decoration: none;
-            font-weight: normal;
-        """)
+        self.setStyleSheet(self._normal_ss)
 
         if platform.system() == "Darwin":
             QToolTip.hideText() # macOS HTML 툴팁 숨김
@@ -1022,8 +1850,7 @@ class QRLinkLabel(QLabel):
                 self.qr_popup_widget.hide()
                 # self.qr_popup_widget.deleteLater() # 필요시 이전 팝업 삭제
                 self.qr_popup_widget = None
-            if self._qr_path:
-                self._create_non_mac_qr_popup()
+            # 새 팝업은 다음 enterEvent에서 생성됨
         # macOS에서는 enterEvent에서 바로 처리하므로 별도 업데이트 불필요
 
 class InfoFolderPathLabel(QLabel):
@@ -1044,10 +1871,8 @@ class InfoFolderPathLabel(QLabel):
         
         self.setCursor(Qt.PointingHandCursor)
         self.setToolTip(LanguageManager.translate("더블클릭하면 해당 폴더가 열립니다 (전체 경로 표시)"))
-        font = QFont("Arial", UIScaleManager.get("font_size"))
-        self.setFont(font)
-        fm = QFontMetrics(font)
-        line_height = fm.height()
+        self.setFont(cached_font("Arial", UI.font_size))
+        line_height = cached_font_metrics("Arial", UI.font_size).height()
         default_height = (line_height * 2) + fixed_height_padding
         self.setFixedHeight(default_height)
         self.setWordWrap(True)
@@ -1085,21 +1910,23 @@ class InfoFolderPathLabel(QLabel):
             """
         self.setStyleSheet(style)
         self.original_style = style
+        # 드래그 호버 스타일도 함께 미리 생성
+        self._drag_hover_style = f"""
+            QLabel {{
+                color: #AAAAAA;
+                padding: 5px;
+                background-color: {ThemeManager.get_color('bg_primary')};
+                border: 2px solid {ThemeManager.get_color('accent')};
+                border-radius: 1px;
+            }}
+        """
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
             if len(urls) == 1 and Path(urls[0].toLocalFile()).is_dir():
                 event.acceptProposedAction()
-                self.setStyleSheet(f"""
-                    QLabel {{
-                        color: #AAAAAA;
-                        padding: 5px;
-                        background-color: {ThemeManager.get_color('bg_primary')};
-                        border: 2px solid {ThemeManager.get_color('accent')};
-                        border-radius: 1px;
-                    }}
-                """)
+                self.setStyleSheet(self._drag_hover_style)
                 return
         event.ignore()
 
@@ -1119,24 +1946,20 @@ class InfoFolderPathLabel(QLabel):
     def setText(self, text: str):
         self.full_path = text
         self.setToolTip(text)
-        
-        # 긴 경로 생략 로직
-        max_length = 60
-        prefix_length = 20
-        suffix_length = 35
-        # QGuiApplication.primaryScreen()을 사용하여 현재 화면의 비율을 얻는 것이 더 안정적입니다.
-        screen = QGuiApplication.primaryScreen()
-        if screen:
-            geometry = screen.geometry()
-            aspect_ratio = geometry.width() / geometry.height() if geometry.height() else 0
-            if abs(aspect_ratio - 1.6) < 0.1: # 대략 16:10 비율
-                max_length=30; prefix_length=12; suffix_length=15
+        self._update_elided_text()
+
+    def _update_elided_text(self):
+        """현재 레이블 너비(픽셀)에 맞춰 경로 가운데를 생략하여 표시합니다."""
+        available_width = self.width() - 20  # 좌우 padding 고려
+        if available_width <= 0:
+            # 아직 레이아웃 전이면 전체 경로를 두고 resizeEvent에서 다시 생략
+            super().setText(self.full_path)
+            return
+        super().setText(self.fontMetrics().elidedText(self.full_path, Qt.ElideMiddle, available_width))
 
-        if len(text) > max_length:
-            display_text = text[:prefix_length] + "..." + text[-suffix_length:]
-        else:
-            display_text = text
-        super().setText(display_text)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_elided_text()
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         if self.full_path and self.full_path != LanguageManager.translate("폴더 경로"):
@@ -1170,8 +1993,7 @@ class EditableFolderPathLabel(QLineEdit):
 
     def set_folder_index(self, index):
         self.folder_index = index
-        fm = QFontMetrics(self.font())
-        line_height = fm.height()
+        line_height = self.fontMetrics().height()  # 위젯이 보관한 글꼴 측정값 재사용
         padding = UIScaleManager.get("sort_folder_label_padding")
         single_line_height = line_height + padding
         self.setFixedHeight(single_line_height)
@@ -1353,12 +2175,8 @@ class FilenameLabel(QLabel):
         self.setCursor(Qt.PointingHandCursor)
         self.setAlignment(Qt.AlignCenter)
 
-        font = QFont("Arial", UIScaleManager.get("filename_font_size"))
-        font.setBold(True)
-        self.setFont(font)
-
-        fm = QFontMetrics(font)
-        line_height = fm.height()
+        self.setFont(cached_font("Arial", UI.filename_font_size, True))
+        line_height = cached_font_metrics("Arial", UI.filename_font_size, True).height()
         fixed_height = line_height + fixed_height_padding
         self.setFixedHeight(fixed_height)
 
@@ -1376,23 +2194,29 @@ class FilenameLabel(QLabel):
         self._actual_filename_for_opening = actual_filename # 아이콘 없는 순수 파일명
 
         self.setToolTip(self._raw_display_text) # 툴팁에는 전체 표시 텍스트
-
-        # 화면 표시용 텍스트 생략 처리 (아이콘 포함된 _raw_display_text 기준)
-        if len(self._raw_display_text) > 17: # 아이콘 길이를 고려하여 숫자 조정 필요 가능성
-            # 아이콘이 있다면 아이콘은 유지하면서 앞부분만 생략
-            if "🔗" in self._raw_display_text:
-                name_part = self._raw_display_text.replace("🔗", "")
-                if len(name_part) > 15: # 아이콘 제외하고 15자 초과 시
-                    display_text_for_label = name_part[:6] + "..." + name_part[-7:] + "🔗"
-                else:
-                    display_text_for_label = self._raw_display_text
-            else: # 아이콘 없을 때
-                display_text_for_label = self._raw_display_text[:6] + "..." + self._raw_display_text[-10:]
+        self._update_elided_text()
+
+    def _update_elided_text(self):
+        """현재 레이블 너비(픽셀)에 맞춰 파일명 가운데를 생략하여 표시합니다 (🔗 아이콘은 유지)."""
+        available_width = self.width() - 20
+        if available_width <= 0:
+            # 아직 레이아웃 전이면 전체 텍스트를 두고 resizeEvent에서 다시 생략
+            super().setText(self._raw_display_text)
+            return
+        fm = self.fontMetrics()
+        if "🔗" in self._raw_display_text:
+            # 아이콘은 생략 대상에서 제외하고 뒤에 다시 붙임
+            name_part = self._raw_display_text.replace("🔗", "")
+            name_width = available_width - fm.horizontalAdvance("🔗")
+            display_text_for_label = fm.elidedText(name_part, Qt.ElideMiddle, name_width) + "🔗"
         else:
-            display_text_for_label = self._raw_display_text
-
+            display_text_for_label = fm.elidedText(self._raw_display_text, Qt.ElideMiddle, available_width)
         super().setText(display_text_for_label)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_elided_text()
+
     # setText는 이제 set_display_and_actual_filename을 사용하도록 유도하거나,
     # 이전 setText의 역할을 유지하되 내부적으로 _actual_filename_for_opening을 관리해야 함.
     # 여기서는 set_display_and_actual_filename을 주 사용 메서드로 가정.
@@ -1421,7 +2245,7 @@ class HorizontalLine(QFrame):
         super().__init__(parent)
         self.setFrameShape(QFrame.HLine)
         self.setFrameShadow(QFrame.Sunken)
-        self.setStyleSheet(f"background-color: {ThemeManager.get_color('border')};")
+        self.setObjectName("HorizontalLine") # 색상은 전역 스타일시트(QFrame#HorizontalLine)에서 적용
         self.setFixedHeight(1)
 
 class ZoomScrollArea(QScrollArea):
@@ -1517,6 +2341,13 @@ class ZoomScrollArea(QScrollArea):
 
 
 class GridCellWidget(QWidget):
+    # 그리기에 쓰는 색/펜은 셀마다 매번 만들지 않고 한 번만 생성 (글꼴은 cached_font 사용)
+    _COLOR_BACKGROUND = QColor(0, 0, 0)
+    _COLOR_TEXT = QColor(255, 255, 255)
+    _COLOR_TEXT_BG = QColor(0, 0, 0, 150)  # 파일명 배경 반투명 검정 (alpha 150)
+    _PEN_SELECTED = QPen(QColor(255, 255, 255), 1)
+    _PEN_UNSELECTED = QPen(QColor(0x55, 0x55, 0x55), 1)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pixmap = QPixmap()
@@ -1525,6 +2356,34 @@ class GridCellWidget(QWidget):
         self._is_selected = False
         self.setMinimumSize(1, 1) # 최소 크기 설정 중요
 
+        # 셀 전체를 직접 그리므로 Qt의 배경 지우기 생략
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        # 합성된 셀 이미지 캐시 (내용/크기/선택 상태가 바뀔 때만 다시 그림)
+        self._render_cache = None
+        self._render_cache_key = None
+        # 현재 셀 크기에 맞춘 고품질 축소본 (전역 LRU에서 밀려나도 보이는 셀은 다시 스케일링하지 않도록 직접 보관)
+        self._scaled_pixmap = None
+        self._scaled_key = None
+        # 축약된 파일명과 그 너비 캐시 (파일명/선택 상태/셀 너비가 같으면 elidedText 재계산 생략)
+        self._cached_elided = None
+        self._cached_elided_key = None
+        # 셰이핑/레이아웃이 끝난 파일명 텍스트 캐시 (축약된 파일명/굵기/크기가 바뀔 때만 다시 생성)
+        self._static_text = None
+        self._static_text_key = None
+
+        # 창 크기 조절 중에는 빠른 스케일링을 사용하고, 조절이 끝나면 고품질로 한 번 다시 그림
+        self._live_resize = False
+        self._resize_settle_timer = QTimer(self)
+        self._resize_settle_timer.setSingleShot(True)
+        self._resize_settle_timer.setInterval(150)
+        self._resize_settle_timer.timeout.connect(self._on_resize_settled)
+
+        # 한 이벤트 루프 틱 안에서 여러 setter가 호출되어도 update()는 한 번만 요청
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update)
+
         # 드래그 앤 드롭 관련 변수
         self.drag_start_pos = QPoint(0, 0)
         self.is_potential_drag = False
@@ -1533,26 +2392,37 @@ class GridCellWidget(QWidget):
         # 마우스 추적 활성화
         self.setMouseTracking(True)
 
+    def _schedule_update(self):
+        """다음 이벤트 루프 틱에 한 번만 다시 그리도록 예약합니다."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
     def setPixmap(self, pixmap):
         if pixmap is None:
-            self._pixmap = QPixmap()
-        else:
-            self._pixmap = pixmap
-        self.update() # 위젯을 다시 그리도록 요청
+            pixmap = QPixmap()
+        # 같은 픽스맵(또는 빈 픽스맵)이 다시 설정되면 캐시를 유지하고 다시 그리지 않음
+        if pixmap.cacheKey() == self._pixmap.cacheKey() or (pixmap.isNull() and self._pixmap.isNull()):
+            return
+        self._pixmap = pixmap
+        self._scaled_pixmap = None
+        self._scaled_key = None
+        self._schedule_update() # 위젯을 다시 그리도록 요청
 
     def setText(self, text):
         if self._filename != text: # 텍스트가 실제로 변경될 때만 업데이트
             self._filename = text
-            self.update() # 변경 시 다시 그리기
+            self._schedule_update() # 변경 시 다시 그리기
 
     def setShowFilename(self, show):
         if self._show_filename != show: # 상태가 실제로 변경될 때만 업데이트
             self._show_filename = show
-            self.update() # 변경 시 다시 그리기
+            self._schedule_update() # 변경 시 다시 그리기
 
     def setSelected(self, selected):
-        self._is_selected = selected
-        self.update()
+        selected = bool(selected)
+        if self._is_selected != selected: # 상태가 실제로 변경될 때만 업데이트
+            self._is_selected = selected
+            self._schedule_update()
 
     def pixmap(self):
         return self._pixmap
@@ -1560,6 +2430,16 @@ class GridCellWidget(QWidget):
     def text(self):
         return self._filename
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.isVisible() and event.oldSize().isValid() and event.oldSize() != event.size():
+            self._live_resize = True
+            self._resize_settle_timer.start()
+
+    def _on_resize_settled(self):
+        self._live_resize = False
+        self.update()
+
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트 처리 - 드래그 시작 준비"""
         try:
@@ -1648,35 +2528,65 @@ class GridCellWidget(QWidget):
             logging.error(f"get_parent_app 오류: {e}")
             return None
 
-    # 그리드 파일명 상단 좌측
     def paintEvent(self, event):
+        """합성된 셀 이미지를 캐시해 두고, 상태가 바뀌지 않았으면 그대로 복사만 합니다."""
+        dpr = self.devicePixelRatioF()
+        size = self.size()
+        cache_key = (size.width(), size.height(), dpr, self._pixmap.cacheKey(),
+                     self._filename, self._show_filename, self._is_selected, self._live_resize)
+        if self._render_cache is None or self._render_cache_key != cache_key:
+            cache = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+            cache.setDevicePixelRatio(dpr)
+            cache.fill(self._COLOR_BACKGROUND)  # 배경은 QPainter 경로 대신 픽스맵 채우기로 한 번에 지움
+            cache_painter = QPainter(cache)
+            self._render_cell(cache_painter, self.rect())
+            cache_painter.end()
+            self._render_cache = cache
+            self._render_cache_key = cache_key
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._render_cache)
+        painter.end()
+
+    # 그리드 파일명 상단 좌측
+    def _render_cell(self, painter, rect):
+        """셀 내용(이미지, 파일명, 테두리)을 검정으로 채워진 painter 장치 위에 그립니다."""
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
 
-        rect = self.rect()
-
-        painter.fillRect(rect, QColor("black"))
-
         if not self._pixmap.isNull():
-            scaled_pixmap = self._pixmap.scaled(rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            x = (rect.width() - scaled_pixmap.width()) / 2
-            y = (rect.height() - scaled_pixmap.height()) / 2
-            painter.drawPixmap(int(x), int(y), scaled_pixmap)
+            # 장치 픽셀 크기로 한 번만 축소해 두고, 그릴 때는 1:1로 복사만 함 (HiDPI에서도 선명)
+            dpr = painter.device().devicePixelRatioF()
+            target_w = max(1, round(rect.width() * dpr))
+            target_h = max(1, round(rect.height() * dpr))
+            if self._live_resize:
+                scaled_pixmap = self._pixmap.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.FastTransformation)
+            else:
+                scaled_key = (self._pixmap.cacheKey(), target_w, target_h)
+                if self._scaled_key != scaled_key:
+                    self._scaled_pixmap = ScaledPixmapCache.get(self._pixmap, target_w, target_h)
+                    self._scaled_key = scaled_key
+                scaled_pixmap = self._scaled_pixmap
+            draw_w = scaled_pixmap.width() / dpr
+            draw_h = scaled_pixmap.height() / dpr
+            x = round((rect.width() - draw_w) / 2 * dpr) / dpr # 장치 픽셀 경계에 맞춰 재샘플링 방지
+            y = round((rect.height() - draw_h) / 2 * dpr) / dpr
+            painter.drawPixmap(QRectF(x, y, draw_w, draw_h), scaled_pixmap, QRectF(scaled_pixmap.rect()))
 
         if self._show_filename and self._filename:
-            font = QFont("Arial", UIScaleManager.get("font_size", 10)) # 파일명 폰트 먼저 설정
-            if self._is_selected:
-                font.setBold(True)  # 선택된 셀이면 볼드체 적용
-            else:
-                font.setBold(False) # 선택되지 않았으면 볼드체 해제
-            painter.setFont(font)   # painter에 (볼드체가 적용되거나 해제된) 폰트 적용
-            font_metrics = QFontMetrics(painter.font()) # painter에 적용된 폰트로 metrics 가져오기
+            # 선택된 셀이면 볼드체 적용 (글꼴/메트릭은 캐시에서 재사용)
+            painter.setFont(cached_font("Arial", UI.font_size, self._is_selected))
+            font_metrics = cached_font_metrics("Arial", UI.font_size, self._is_selected)
             
             # 파일명 축약 (elidedText 사용)
             # 셀 너비에서 좌우 패딩(예: 각 5px)을 뺀 값을 기준으로 축약
-            available_text_width = rect.width() - 10 
-            elided_filename_for_paint = font_metrics.elidedText(self._filename, Qt.ElideRight, available_text_width)
+            elided_key = (self._filename, self._is_selected, rect.width(), UI.font_size)
+            if self._cached_elided_key != elided_key:
+                available_text_width = rect.width() - 10 
+                elided = font_metrics.elidedText(self._filename, Qt.ElideRight, available_text_width)
+                self._cached_elided = (elided, font_metrics.horizontalAdvance(elided))
+                self._cached_elided_key = elided_key
+            elided_filename_for_paint, elided_text_width = self._cached_elided
 
             text_height = font_metrics.height()
             
@@ -1686,34 +2596,213 @@ class GridCellWidget(QWidget):
             
             # 배경 너비: 축약된 텍스트 너비 + 좌우 패딩, 또는 셀 너비의 일정 비율 등
             # 여기서는 축약된 텍스트 너비 + 약간의 패딩으로 설정
-            bg_rect_width = min(font_metrics.horizontalAdvance(elided_filename_for_paint) + 10, rect.width() - 4)
+            bg_rect_width = min(elided_text_width + 10, rect.width() - 4)
             bg_rect_x = 2 # 좌측에서 약간의 패딩 (테두리 두께 1px + 여백 1px)
             
             text_bg_rect = QRect(int(bg_rect_x), bg_rect_y, int(bg_rect_width), bg_rect_height)
-            painter.fillRect(text_bg_rect, QColor(0, 0, 0, 150)) # 반투명 검정 (alpha 150)
+            painter.fillRect(text_bg_rect, self._COLOR_TEXT_BG)
 
-            painter.setPen(QColor("white"))
+            painter.setPen(self._COLOR_TEXT)
             # 텍스트를 배경 사각형의 좌측 상단에 (약간의 내부 패딩을 주어) 그리기
-            # Qt.AlignLeft | Qt.AlignVCenter 를 사용하면 배경 사각형 내에서 세로 중앙, 가로 좌측 정렬
             text_draw_x = bg_rect_x + 3 # 배경 사각형 내부 좌측 패딩
-            text_draw_y = bg_rect_y + 2 # 배경 사각형 내부 상단 패딩 (텍스트 baseline 고려)
-            
-            # drawText는 QPointF와 문자열을 받을 수 있습니다.
-            # 또는 QRectF와 정렬 플래그를 사용할 수 있습니다.
-            # 여기서는 QRectF를 사용하여 정렬 플래그로 제어합니다.
-            text_paint_rect = QRect(int(text_draw_x), int(text_draw_y),
-                                    int(bg_rect_width - 6), # 좌우 패딩 제외한 너비
-                                    text_height)
-            painter.drawText(text_paint_rect, Qt.AlignLeft | Qt.AlignVCenter, elided_filename_for_paint)
+            text_draw_y = bg_rect_y + 2 # 배경 사각형 내부 상단 패딩 (텍스트 높이 = 줄 높이)
+
+            # QStaticText는 셰이핑된 글리프를 보관하므로 같은 파일명은 다시 레이아웃하지 않음
+            static_key = (elided_filename_for_paint, self._is_selected, UI.font_size)
+            if self._static_text_key != static_key:
+                static_text = QStaticText(elided_filename_for_paint)
+                static_text.setTextFormat(Qt.PlainText)
+                static_text.prepare(QTransform(), painter.font())
+                self._static_text = static_text
+                self._static_text_key = static_key
+            painter.drawStaticText(int(text_draw_x), int(text_draw_y), self._static_text)
 
 
-        pen_color = QColor("white") if self._is_selected else QColor("#555555")
-        pen = QPen(pen_color)
-        pen.setWidth(1)
-        painter.setPen(pen)
+        painter.setPen(self._PEN_SELECTED if self._is_selected else self._PEN_UNSELECTED)
         painter.drawRect(rect.adjusted(0, 0, -1, -1))
 
-        painter.end()
+class ExifBatchReader:
+    """ExifTool을 -stay_open 모드로 상주시켜 여러 파일의 메타데이터를 읽는 클래스
+
+    파일마다 exiftool을 새로 실행하면 매번 Perl 인터프리터 시작 비용이 발생하므로,
+    하나의 프로세스에 인자 파일(-@ -)로 명령을 보내고 {readyN} 표시까지 출력을 읽습니다.
+    여러 스레드에서 호출할 수 있도록 명령 단위로 잠금을 사용합니다.
+    """
+    BATCH_SIZE = 500  # 한 번의 -execute에 넘길 최대 파일 수
+
+    def __init__(self, exiftool_path):
+        self.exiftool_path = exiftool_path
+        self._process = None
+        self._lock = threading.Lock()
+        self._execute_id = 0
+
+    def start(self):
+        """ExifTool 프로세스를 미리 실행합니다 (Perl 로딩이 백그라운드에서 진행됨)."""
+        with self._lock:
+            return self._ensure_process()
+
+    def _ensure_process(self):
+        if self._process is not None and self._process.poll() is None:
+            return True
+        try:
+            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            self._process = subprocess.Popen(
+                [self.exiftool_path, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                creationflags=creationflags
+            )
+            logging.info("ExifTool stay_open 프로세스 시작됨")
+            return True
+        except Exception as e:
+            logging.error(f"ExifTool stay_open 프로세스 시작 실패: {e}")
+            self._process = None
+            return False
+
+    def _kill_process(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+            except Exception:
+                pass
+            self._process = None
+
+    def execute(self, args):
+        """인자 목록을 한 번 실행하고 JSON 결과 리스트를 반환합니다. 실패 시 빈 리스트."""
+        with self._lock:
+            if not self._ensure_process():
+                return []
+            self._execute_id += 1
+            sentinel = f"{{ready{self._execute_id}}}".encode()
+            command = "\n".join(["-charset", "filename=utf8", *args, f"-execute{self._execute_id}"]) + "\n"
+            chunks = []
+            try:
+                self._process.stdin.write(command.encode("utf-8"))
+                self._process.stdin.flush()
+                stdout = self._process.stdout
+                while True:
+                    line = stdout.readline()
+                    if not line:
+                        raise EOFError("ExifTool 프로세스가 예기치 않게 종료됨")
+                    if line.rstrip() == sentinel:
+                        break
+                    chunks.append(line)
+            except Exception as e:
+                logging.error(f"ExifTool stay_open 명령 실패: {e}")
+                self._kill_process()
+                return []
+        output = b"".join(chunks)
+        if not output.strip():
+            return []
+        try:
+            data = json.loads(output.decode("utf-8", errors="replace"))
+            return data if isinstance(data, list) else []
+        except json.JSONDecodeError:
+            return []
+
+    @staticmethod
+    def _normalize_path(path):
+        return os.path.normcase(os.path.normpath(path))
+
+    def read_many(self, paths, tags=()):
+        """여러 파일의 메타데이터를 읽어 {원본 경로 문자열: 태그 딕셔너리}로 반환합니다.
+        tags에는 "-DateTimeOriginal"처럼 ExifTool 인자 형식으로 읽을 태그를 지정합니다 (비우면 전체).
+        """
+        paths = [str(p) for p in paths]
+        lookup = {self._normalize_path(p): p for p in paths}
+        results = {}
+        for start in range(0, len(paths), self.BATCH_SIZE):
+            batch = paths[start:start + self.BATCH_SIZE]
+            for entry in self.execute(["-json", *tags, *batch]):
+                source = entry.get("SourceFile")
+                original = lookup.get(self._normalize_path(source)) if source else None
+                if original is not None:
+                    results[original] = entry
+        return results
+
+    def close(self):
+        """ExifTool 프로세스를 정상 종료합니다."""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                if self._process.poll() is None:
+                    self._process.stdin.write(b"-stay_open\nFalse\n")
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=2)
+            except Exception:
+                self._kill_process()
+            self._process = None
+            logging.info("ExifTool stay_open 프로세스 종료됨")
+
+class ExifToolPool:
+    """여러 개의 상주 ExifTool 프로세스(ExifBatchReader)에 메타데이터 읽기를 나누어 실행하는 풀
+
+    ExifTool 한 프로세스는 한 번에 한 명령만 처리하므로, 큰 폴더는 CHUNK_SIZE 단위로 나눠
+    리더들에 돌아가며 배정하고 스레드로 동시에 보냅니다. 실제 작업은 각 Perl 프로세스가 병렬로 수행합니다.
+    ExifBatchReader와 같은 read_many() 인터페이스를 제공합니다.
+    """
+    CHUNK_SIZE = 100  # 리더 하나에 한 번에 보낼 파일 수
+
+    def __init__(self, exiftool_path, num_processes=None):
+        if num_processes is None:
+            num_processes = max(1, min(cpu_count() // 2, 4))
+        self.readers = [ExifBatchReader(exiftool_path) for _ in range(num_processes)]
+        self._executor = ThreadPoolExecutor(max_workers=num_processes, thread_name_prefix="ExifTool")
+        # 다른 스레드에서 진행 중인 read_many가 끝난 뒤에 닫기 위한 상태
+        self._state_lock = threading.Lock()
+        self._active_reads = 0
+        self._closing = False
+        logging.info(f"ExifToolPool 초기화: 최대 {num_processes}개 ExifTool 프로세스")
+
+    def start(self):
+        """첫 번째 리더만 미리 실행합니다 (나머지는 필요할 때 실행)."""
+        return self.readers[0].start()
+
+    def read_many(self, paths, tags=()):
+        """여러 파일의 메타데이터를 리더들에 나누어 읽고 {원본 경로 문자열: 태그 딕셔너리}로 반환합니다.
+        close()가 요청된 뒤에는 빈 결과를 반환합니다."""
+        with self._state_lock:
+            if self._closing:
+                return {}
+            self._active_reads += 1
+        try:
+            return self._read_many(paths, tags)
+        finally:
+            with self._state_lock:
+                self._active_reads -= 1
+                close_now = self._closing and self._active_reads == 0
+            if close_now:
+                self._close_now()
+
+    def _read_many(self, paths, tags):
+        paths = [str(p) for p in paths]
+        if len(paths) <= self.CHUNK_SIZE:
+            return self.readers[0].read_many(paths, tags)
+        futures = []
+        for i, start in enumerate(range(0, len(paths), self.CHUNK_SIZE)):
+            reader = self.readers[i % len(self.readers)]
+            futures.append(self._executor.submit(reader.read_many, paths[start:start + self.CHUNK_SIZE], tags))
+        results = {}
+        for future in as_completed(futures):
+            try:
+                results.update(future.result())
+            except Exception as e:
+                logging.error(f"ExifToolPool 읽기 오류: {e}")
+        return results
+
+    def close(self):
+        """모든 ExifTool 프로세스를 종료합니다.
+        다른 스레드에서 read_many가 진행 중이면, 마지막 호출이 끝날 때 그 스레드에서 종료합니다."""
+        with self._state_lock:
+            self._closing = True
+            if self._active_reads:
+                return
+        self._close_now()
+
+    def _close_now(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for reader in self.readers:
+            reader.close()
 
 class ExifWorker(QObject):
     """백그라운드 스레드에서 EXIF 데이터를 처리하는 워커 클래스"""
@@ -1721,94 +2810,268 @@ class ExifWorker(QObject):
     finished = Signal(dict, str)  # (EXIF 결과 딕셔너리, 이미지 경로)
     error = Signal(str, str)      # (오류 메시지, 이미지 경로)
     request_process = Signal(str)
+    request_probe = Signal()          # ExifTool 실행 가능 여부 확인 요청 (워커 스레드에서 실행)
+    exiftoolProbed = Signal(bool)     # 확인 결과 (사용 가능 여부)
     
-    def __init__(self, raw_extensions, exiftool_path, exiftool_available):
+    def __init__(self, raw_extensions, exiftool_path, exiftool_available=False, batch_reader=None):
         super().__init__()
         self.raw_extensions = raw_extensions
         self.exiftool_path = exiftool_path
         self.exiftool_available = exiftool_available
         self._running = True  # 작업 중단 플래그
+        # 이 워커 전용 상주 ExifTool 프로세스 (폴더 정렬용 리더와 잠금을 다투지 않도록 분리, 첫 사용 시 실행)
+        self.exif_reader = ExifBatchReader(exiftool_path) if exiftool_available else None
+        # 폴더 단위 배치 추출에 사용할 공유 리더/ExifToolPool (없으면 전용 리더 사용)
+        self.batch_reader = batch_reader
 
         # 자신의 시그널을 슬롯에 연결
         self.request_process.connect(self.process_image)
+        self.request_probe.connect(self.probe_exiftool)
+
+    def probe_exiftool(self):
+        """[워커 스레드] exiftool -ver로 ExifTool 실행 가능 여부를 확인하고 결과를 exiftoolProbed로 알림
+
+        프로세스 실행/Perl 시작을 기다리는 동안 UI 스레드(앱 시작)를 막지 않도록 워커 스레드에서 실행합니다.
+        process_image와 같은 스레드 이벤트 큐에서 처리되므로, 확인 전에 들어온 EXIF 요청은 확인이 끝난 뒤 처리됩니다.
+        """
+        available = False
+        try:
+            if Path(self.exiftool_path).exists():
+                result = subprocess.run([self.exiftool_path, "-ver"], capture_output=True, text=True, check=False)
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+                    logging.info(f"ExifTool 버전 {version} 사용 가능")
+                    available = True
+                else:
+                    logging.warning("ExifTool을 찾았지만 실행할 수 없습니다. 제한된 메타데이터 추출만 사용됩니다.")
+            else:
+                logging.warning(f"ExifTool을 찾을 수 없습니다: {self.exiftool_path}")
+        except Exception as e:
+            logging.error(f"ExifTool 확인 중 오류: {e}")
+        self.exiftool_available = available
+        if available and self.exif_reader is None:
+            self.exif_reader = ExifBatchReader(self.exiftool_path)
+        self.exiftoolProbed.emit(available)
     
     def stop(self):
         """워커의 실행을 중지"""
         self._running = False
+        if self.exif_reader is not None:
+            self.exif_reader.close()
     
     def get_exif_with_exiftool(self, image_path):
-        """ExifTool을 사용하여 이미지 메타데이터 추출"""
-        if not self.exiftool_available or not self._running:
+        """ExifTool을 사용하여 이미지 메타데이터 추출 (상주 프로세스 사용, 이미지마다 exiftool을 새로 실행하지 않음)"""
+        if not self.exiftool_available or not self._running or self.exif_reader is None:
             return {}
             
         try:
-            # 중요: -g1 옵션 제거하고 일반 태그로 변경
-            cmd = [self.exiftool_path, "-json", "-a", "-u", str(image_path)]
-            # Windows에서 콘솔창 숨기기 위한 플래그 추가
-            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-            process = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", 
-                                    errors="replace", check=False, creationflags=creationflags)
-            
-            if process.returncode == 0 and process.stdout:
+            # 중요: -g1 옵션 제거하고 일반 태그로 변경. -fast2: 파일 끝 트레일러/메이커노트 스캔 생략
+            exif_data = self.exif_reader.execute(["-json", "-a", "-u", "-fast2", str(image_path)])
+            # ExifTool은 결과를 항상 리스트로 반환
+            return exif_data[0] if exif_data else {}
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _new_result(image_path):
+        """빈 EXIF 결과 딕셔너리를 생성합니다."""
+        return {
+            "exif_resolution": None,
+            "exif_make": "",
+            "exif_model": "",
+            "exif_datetime": None,
+            "exif_focal_mm": None,
+            "exif_focal_35mm": None,
+            "exif_exposure_time": None,
+            "exif_fnumber": None,
+            "exif_iso": None,
+            "exif_orientation": None,
+            "image_path": image_path
+        }
+
+    def _merge_exiftool_data(self, result, exif_data_tool):
+        """ExifTool JSON 결과로 result의 비어 있는 항목을 채웁니다."""
+        # 해상도 정보
+        if not result["exif_resolution"]:
+            width = exif_data_tool.get("ImageWidth") or exif_data_tool.get("ExifImageWidth")
+            height = exif_data_tool.get("ImageHeight") or exif_data_tool.get("ExifImageHeight")
+            if width and height:
+                try:
+                    result["exif_resolution"] = (int(width), int(height))
+                except (ValueError, TypeError):
+                    pass
+        
+        # Orientation
+        if result["exif_orientation"] is None:
+            orientation_val = exif_data_tool.get("Orientation")
+            if orientation_val:
+                try:
+                    result["exif_orientation"] = int(orientation_val)
+                except (ValueError, TypeError):
+                    pass
+        
+        # 카메라 정보
+        if not (result["exif_make"] or result["exif_model"]):
+            result["exif_make"] = exif_data_tool.get("Make", "")
+            result["exif_model"] = exif_data_tool.get("Model", "")
+        
+        # 날짜 정보
+        if not result["exif_datetime"]:
+            date_str = (exif_data_tool.get("DateTimeOriginal") or
+                    exif_data_tool.get("CreateDate") or
+                    exif_data_tool.get("FileModifyDate"))
+            if date_str:
+                result["exif_datetime"] = date_str
+        
+        # 초점 거리
+        if result["exif_focal_mm"] is None:
+            focal_val = exif_data_tool.get("FocalLength")
+            if focal_val:
+                try:
+                    result["exif_focal_mm"] = float(str(focal_val).lower().replace(" mm", ""))
+                except (ValueError, TypeError):
+                    result["exif_focal_mm"] = str(focal_val)
+        
+        if result["exif_focal_35mm"] is None:
+            focal_35_val = exif_data_tool.get("FocalLengthIn35mmFormat")
+            if focal_35_val:
+                try:
+                    result["exif_focal_35mm"] = float(str(focal_35_val).lower().replace(" mm", ""))
+                except (ValueError, TypeError):
+                    result["exif_focal_35mm"] = str(focal_35_val)
+
+        # 노출 시간
+        if result["exif_exposure_time"] is None:
+            exposure_val = exif_data_tool.get("ExposureTime")
+            if exposure_val:
+                try:
+                    result["exif_exposure_time"] = float(exposure_val)
+                except (ValueError, TypeError):
+                    result["exif_exposure_time"] = str(exposure_val)
+        
+        # 조리개값
+        if result["exif_fnumber"] is None:
+            fnumber_val = exif_data_tool.get("FNumber")
+            if fnumber_val:
+                try:
+                    result["exif_fnumber"] = float(fnumber_val)
+                except (ValueError, TypeError):
+                    result["exif_fnumber"] = str(fnumber_val)
+        
+        # ISO
+        if result["exif_iso"] is None:
+            iso_val = exif_data_tool.get("ISO")
+            if iso_val:
                 try:
-                    exif_data = json.loads(process.stdout)
-                    # ExifTool은 결과를 항상 리스트로 반환
-                    if exif_data and isinstance(exif_data, list):
-                        return exif_data[0]
-                    return {}
-                except json.JSONDecodeError:
-                    return {}
+                    result["exif_iso"] = int(iso_val)
+                except (ValueError, TypeError):
+                    result["exif_iso"] = str(iso_val)
+
+    def process_batch(self, image_paths):
+        """폴더 최초 로드 시 여러 이미지의 EXIF를 ExifTool 배치 호출로 한 번에 추출합니다.
+
+        디스크 캐시(ExifDiskCache)에 있는 파일은 바로 결과를 보내고, 나머지는
+        BATCH_SIZE개씩 한 번의 -execute로 읽어 파일마다 finished 시그널을 보냅니다.
+        RAW 파일은 process_image와 마찬가지로 rawpy 정보를 먼저 채운 뒤 ExifTool 결과로 보완합니다.
+        배치에서 결과를 얻지 못한 파일은 이후 개별 요청(process_image) 시 처리됩니다.
+        """
+        reader = self.batch_reader or self.exif_reader
+        paths = []
+        for image_path in map(str, image_paths):
+            cached_result = ExifDiskCache.lookup(image_path)
+            if cached_result is not None:
+                self.finished.emit(cached_result, image_path)
             else:
-                return {}
+                paths.append(image_path)
+        if reader is None:
+            return
+        for start in range(0, len(paths), ExifBatchReader.BATCH_SIZE):
+            if not self._running:
+                return
+            batch = paths[start:start + ExifBatchReader.BATCH_SIZE]
+            try:
+                # -n: Orientation 등을 숫자 값으로 받아 개별 경로와 같은 형식으로 변환되도록 함
+                tool_results = reader.read_many(batch, ("-a", "-u", "-fast2", "-n"))
+            except Exception as e:
+                logging.error(f"EXIF 배치 추출 오류: {e}")
+                return
+            for image_path in batch:
+                if not self._running:  # 파일마다 확인하여 RAW 헤더 읽기 중에도 빨리 중단
+                    return
+                exif_data_tool = tool_results.get(image_path)
+                if not exif_data_tool:
+                    continue
+                result = self._new_result(image_path)
+                # process_image와 같은 순서: RAW는 rawpy 정보(실제 센서 해상도 등)를 먼저 채우고,
+                # ExifTool은 비어 있는 항목만 채움 (임베디드 미리보기 크기가 해상도로 저장되는 것 방지)
+                # _fill_from_rawpy는 경로로 열어 헤더만 읽으므로 파일 전체를 읽지 않음
+                if Path(image_path).suffix.lower() in self.raw_extensions:
+                    self._fill_from_rawpy(result, image_path)
+                self._merge_exiftool_data(result, exif_data_tool)
+                ExifDiskCache.store(image_path, result)
+                self.finished.emit(result, image_path)
+
+    @staticmethod
+    def _fill_from_rawpy(result, image_path):
+        """RAW 파일의 해상도(raw.sizes), 카메라, 촬영 일시를 rawpy로 읽어 result에 채웁니다."""
+        try:
+            # 헤더 정보만 읽으므로 파일 전체를 버퍼로 읽지 않고 경로로 엽니다
+            with rawpy.imread(str(image_path)) as raw:
+                result["exif_resolution"] = (raw.sizes.raw_width, raw.sizes.raw_height)
+                if hasattr(raw, 'camera_manufacturer'):
+                    result["exif_make"] = raw.camera_manufacturer.strip() if raw.camera_manufacturer else ""
+                if hasattr(raw, 'model'):
+                    result["exif_model"] = raw.model.strip() if raw.model else ""
+                if hasattr(raw, 'timestamp') and raw.timestamp:
+                    dt_obj = datetime.datetime.fromtimestamp(raw.timestamp)
+                    result["exif_datetime"] = dt_obj.strftime('%Y:%m:%d %H:%M:%S')
         except Exception:
-            return {}
+            pass
+
+    @staticmethod
+    def _has_required_info(result):
+        """해상도, 카메라(제조사/모델), 촬영 일시 중 2개 이상이 채워졌는지 확인"""
+        required_info_count = sum([
+            result["exif_resolution"] is not None,
+            bool(result["exif_make"] or result["exif_model"]),
+            result["exif_datetime"] is not None
+        ])
+        return required_info_count >= 2
 
     def process_image(self, image_path):
         """백그라운드에서 이미지의 EXIF 데이터 처리"""
         try:
             if not self._running:
                 return
+
+            # 디스크 캐시에 같은 파일(수정 시간/크기 동일)의 결과가 있으면 추출 생략
+            cached_result = ExifDiskCache.lookup(image_path)
+            if cached_result is not None:
+                self.finished.emit(cached_result, image_path)
+                return
                 
             file_path_obj = Path(image_path)
             suffix = file_path_obj.suffix.lower()
             is_raw = file_path_obj.suffix.lower() in self.raw_extensions
             is_heic = file_path_obj.suffix.lower() in {'.heic', '.heif'} 
 
-            skip_piexif_formats = {'.heic', '.heif', '.png', '.webp', '.bmp'} # piexif 시도를 건너뛸 포맷 목록
+            skip_piexif_formats = {'.heic', '.heif', '.webp', '.bmp'} # piexif 시도를 건너뛸 포맷 목록 (PNG는 eXIf 청크만 읽음)
             
             # 결과를 저장할 딕셔너리 초기화
-            result = {
-                "exif_resolution": None,
-                "exif_make": "",
-                "exif_model": "",
-                "exif_datetime": None,
-                "exif_focal_mm": None,
-                "exif_focal_35mm": None,
-                "exif_exposure_time": None,
-                "exif_fnumber": None,
-                "exif_iso": None,
-                "exif_orientation": None,
-                "image_path": image_path
-            }
+            result = self._new_result(image_path)
             
             # PHASE 0: RAW 파일인 경우 rawpy로 정보 추출
             if is_raw and self._running:
-                try:
-                    with rawpy.imread(image_path) as raw:
-                        result["exif_resolution"] = (raw.sizes.raw_width, raw.sizes.raw_height)
-                        if hasattr(raw, 'camera_manufacturer'):
-                            result["exif_make"] = raw.camera_manufacturer.strip() if raw.camera_manufacturer else ""
-                        if hasattr(raw, 'model'):
-                            result["exif_model"] = raw.model.strip() if raw.model else ""
-                        if hasattr(raw, 'timestamp') and raw.timestamp:
-                            dt_obj = datetime.datetime.fromtimestamp(raw.timestamp)
-                            result["exif_datetime"] = dt_obj.strftime('%Y:%m:%d %H:%M:%S')
-                except Exception:
-                    pass
+                self._fill_from_rawpy(result, image_path)
 
             # PHASE 1: Piexif로 EXIF 정보 추출 시도
             piexif_success = False
-            if self._running and suffix not in skip_piexif_formats: # HEIC 파일이면 piexif 시도 건너뛰기
+            # RAW는 rawpy가 필수 정보를 채웠다면 piexif(대용량 RAW 컨테이너 파싱, 실패도 잦음)를 건너뜀.
+            # 방향 등 나머지 정보는 어차피 아래 ExifTool 단계에서 함께 읽음
+            skip_piexif_for_raw = is_raw and self.exiftool_available and self._has_required_info(result)
+            if skip_piexif_for_raw:
+                piexif_success = True
+            elif self._running and suffix not in skip_piexif_formats: # HEIC 파일이면 piexif 시도 건너뛰기
                 try:
                     # JPG 이미지 크기 (RAW는 위에서 추출)
                     if not is_raw and not result["exif_resolution"]:
@@ -1818,61 +3081,10 @@ class ExifWorker(QObject):
                         except Exception:
                             pass
                     
-                    exif_dict = piexif.load(image_path)
-                    ifd0 = exif_dict.get("0th", {})
-                    exif_ifd = exif_dict.get("Exif", {})
-
-                    # Orientation
-                    if piexif.ImageIFD.Orientation in ifd0:
-                        try:
-                            result["exif_orientation"] = int(ifd0.get(piexif.ImageIFD.Orientation))
-                        except (ValueError, TypeError):
-                            pass
-
-                    # 카메라 정보
-                    if not result["exif_make"] and piexif.ImageIFD.Make in ifd0:
-                        result["exif_make"] = ifd0.get(piexif.ImageIFD.Make, b'').decode('utf-8', errors='ignore').strip()
-                    if not result["exif_model"] and piexif.ImageIFD.Model in ifd0:
-                        result["exif_model"] = ifd0.get(piexif.ImageIFD.Model, b'').decode('utf-8', errors='ignore').strip()
-
-                    # 날짜 정보
-                    if not result["exif_datetime"]:
-                        if piexif.ExifIFD.DateTimeOriginal in exif_ifd:
-                            result["exif_datetime"] = exif_ifd.get(piexif.ExifIFD.DateTimeOriginal, b'').decode('utf-8', errors='ignore')
-                        elif piexif.ImageIFD.DateTime in ifd0:
-                            result["exif_datetime"] = ifd0.get(piexif.ImageIFD.DateTime, b'').decode('utf-8', errors='ignore')
-
-                    # 초점 거리
-                    if result["exif_focal_mm"] is None and piexif.ExifIFD.FocalLength in exif_ifd:
-                        val = exif_ifd.get(piexif.ExifIFD.FocalLength)
-                        if isinstance(val, tuple) and len(val) == 2 and val[1] != 0:
-                            result["exif_focal_mm"] = val[0] / val[1]
-                    if result["exif_focal_35mm"] is None and piexif.ExifIFD.FocalLengthIn35mmFilm in exif_ifd:
-                        result["exif_focal_35mm"] = exif_ifd.get(piexif.ExifIFD.FocalLengthIn35mmFilm)
-
-                    # 노출 시간
-                    if result["exif_exposure_time"] is None and piexif.ExifIFD.ExposureTime in exif_ifd:
-                        val = exif_ifd.get(piexif.ExifIFD.ExposureTime)
-                        if isinstance(val, tuple) and len(val) == 2 and val[1] != 0:
-                            result["exif_exposure_time"] = val[0] / val[1]
-                    
-                    # 조리개값
-                    if result["exif_fnumber"] is None and piexif.ExifIFD.FNumber in exif_ifd:
-                        val = exif_ifd.get(piexif.ExifIFD.FNumber)
-                        if isinstance(val, tuple) and len(val) == 2 and val[1] != 0:
-                            result["exif_fnumber"] = val[0] / val[1]
-                    
-                    # ISO
-                    if result["exif_iso"] is None and piexif.ExifIFD.ISOSpeedRatings in exif_ifd:
-                        result["exif_iso"] = exif_ifd.get(piexif.ExifIFD.ISOSpeedRatings)
+                    apply_exif_fields(result, load_exif_fast(image_path))
 
                     # 필수 정보 확인
-                    required_info_count = sum([
-                        result["exif_resolution"] is not None,
-                        bool(result["exif_make"] or result["exif_model"]),
-                        result["exif_datetime"] is not None
-                    ])
-                    piexif_success = required_info_count >= 2
+                    piexif_success = self._has_required_info(result)
                 except Exception:
                     piexif_success = False
 
@@ -1888,90 +3100,17 @@ class ExifWorker(QObject):
                     needs_exiftool = True
                 elif not result["exif_resolution"]:
                     needs_exiftool = True
-                elif not piexif_success:
-                    needs_exiftool = True
-
-            if needs_exiftool and self._running:
-                exif_data_tool = self.get_exif_with_exiftool(image_path)
-                if exif_data_tool:
-                    # 해상도 정보
-                    if not result["exif_resolution"]:
-                        width = exif_data_tool.get("ImageWidth") or exif_data_tool.get("ExifImageWidth")
-                        height = exif_data_tool.get("ImageHeight") or exif_data_tool.get("ExifImageHeight")
-                        if width and height:
-                            try:
-                                result["exif_resolution"] = (int(width), int(height))
-                            except (ValueError, TypeError):
-                                pass
-                    
-                    # Orientation
-                    if result["exif_orientation"] is None:
-                        orientation_val = exif_data_tool.get("Orientation")
-                        if orientation_val:
-                            try:
-                                result["exif_orientation"] = int(orientation_val)
-                            except (ValueError, TypeError):
-                                pass
-                    
-                    # 카메라 정보
-                    if not (result["exif_make"] or result["exif_model"]):
-                        result["exif_make"] = exif_data_tool.get("Make", "")
-                        result["exif_model"] = exif_data_tool.get("Model", "")
-                    
-                    # 날짜 정보
-                    if not result["exif_datetime"]:
-                        date_str = (exif_data_tool.get("DateTimeOriginal") or
-                                exif_data_tool.get("CreateDate") or
-                                exif_data_tool.get("FileModifyDate"))
-                        if date_str:
-                            result["exif_datetime"] = date_str
-                    
-                    # 초점 거리
-                    if result["exif_focal_mm"] is None:
-                        focal_val = exif_data_tool.get("FocalLength")
-                        if focal_val:
-                            try:
-                                result["exif_focal_mm"] = float(str(focal_val).lower().replace(" mm", ""))
-                            except (ValueError, TypeError):
-                                result["exif_focal_mm"] = str(focal_val)
-                    
-                    if result["exif_focal_35mm"] is None:
-                        focal_35_val = exif_data_tool.get("FocalLengthIn35mmFormat")
-                        if focal_35_val:
-                            try:
-                                result["exif_focal_35mm"] = float(str(focal_35_val).lower().replace(" mm", ""))
-                            except (ValueError, TypeError):
-                                result["exif_focal_35mm"] = str(focal_35_val)
-
-                    # 노출 시간
-                    if result["exif_exposure_time"] is None:
-                        exposure_val = exif_data_tool.get("ExposureTime")
-                        if exposure_val:
-                            try:
-                                result["exif_exposure_time"] = float(exposure_val)
-                            except (ValueError, TypeError):
-                                result["exif_exposure_time"] = str(exposure_val)
-                    
-                    # 조리개값
-                    if result["exif_fnumber"] is None:
-                        fnumber_val = exif_data_tool.get("FNumber")
-                        if fnumber_val:
-                            try:
-                                result["exif_fnumber"] = float(fnumber_val)
-                            except (ValueError, TypeError):
-                                result["exif_fnumber"] = str(fnumber_val)
-                    
-                    # ISO
-                    if result["exif_iso"] is None:
-                        iso_val = exif_data_tool.get("ISO")
-                        if iso_val:
-                            try:
-                                result["exif_iso"] = int(iso_val)
-                            except (ValueError, TypeError):
-                                result["exif_iso"] = str(iso_val)
+                elif not piexif_success:
+                    needs_exiftool = True
+
+            if needs_exiftool and self._running:
+                exif_data_tool = self.get_exif_with_exiftool(image_path)
+                if exif_data_tool:
+                    self._merge_exiftool_data(result, exif_data_tool)
 
             # 작업 완료, 결과 전송
             if self._running:
+                ExifDiskCache.store(image_path, result)
                 self.finished.emit(result, image_path)
             
         except Exception as e:
@@ -1979,86 +3118,203 @@ class ExifWorker(QObject):
             if self._running:
                 self.error.emit(str(e), image_path)
 
+class _PriorityWorkQueue(queue.PriorityQueue):
+    """ThreadPoolExecutor의 작업 큐를 대체하는 우선순위 큐
+
+    submit_with_priority()는 (우선순위, 작업) 튜플을, 기본 submit()은 작업만 넣습니다.
+    내부적으로 제출 순서를 붙여 같은 우선순위는 먼저 들어온 작업부터 꺼내고, 작업자 스레드에는
+    ThreadPoolExecutor가 기대하는 대로 작업 객체(또는 종료 신호 None)만 돌려줍니다.
+    """
+    DEFAULT_RANK = 1      # 우선순위 없이 submit()된 작업
+    SHUTDOWN_RANK = 99    # 종료 신호는 남은 작업 뒤에 처리 (기존 FIFO 큐와 같은 종료 순서)
+
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self._sequence = itertools.count()
+
+    def _put(self, item):
+        if item is None:
+            rank, work_item = self.SHUTDOWN_RANK, None
+        elif isinstance(item, tuple):
+            rank, work_item = item
+        else:
+            rank, work_item = self.DEFAULT_RANK, item
+        super()._put((rank, next(self._sequence), work_item))
+
+    def _get(self):
+        return super()._get()[2]
+
+    def put_many(self, items):
+        """여러 작업을 큐 잠금 한 번으로 추가합니다 (항목 형식은 put()과 같음)."""
+        with self.mutex:
+            count = 0
+            for item in items:
+                self._put(item)
+                count += 1
+            self.unfinished_tasks += count
+            self.not_empty.notify(count)
+
+    def purge_cancelled(self):
+        """취소된 작업을 큐에서 바로 제거합니다 (작업자가 하나씩 꺼내 버릴 때까지 남겨두지 않음).
+
+        반환값: 제거된 작업 수
+        """
+        with self.mutex:
+            kept = []
+            purged = []
+            for entry in self.queue:
+                if entry[2] is None or not entry[2].future.cancelled():
+                    kept.append(entry)
+                else:
+                    purged.append(entry)
+            if purged:
+                heapq.heapify(kept)
+                self.queue[:] = kept
+                self.unfinished_tasks -= len(purged)
+        # 작업자가 꺼냈을 때와 같이 CANCELLED_AND_NOTIFIED로 전환 (wait()/as_completed()가 멈추지 않도록)
+        for entry in purged:
+            entry[2].future.set_running_or_notify_cancel()
+        return len(purged)
+
 class PriorityThreadPoolExecutor(ThreadPoolExecutor):
-    """우선순위를 지원하는 스레드 풀"""
+    """우선순위를 지원하는 스레드 풀
+
+    작업자 스레드가 읽는 내부 작업 큐 자체를 우선순위 큐로 바꿔, 별도의 디스패처 스레드 없이
+    작업자가 비는 즉시 가장 높은 우선순위의 작업을 가져갑니다.
+    """
+    PRIORITY_RANKS = {
+        'high': 0,    # 현재 보는 이미지
+        'medium': 1,  # 다음/인접 이미지
+        'low': 2      # 나머지 이미지
+    }
     
     def __init__(self, max_workers=None, thread_name_prefix=''):
         super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
-        
-        # 우선순위별 작업 큐
-        self.task_queues = {
-            'high': queue.Queue(),    # 현재 보는 이미지
-            'medium': queue.Queue(),  # 다음/인접 이미지
-            'low': queue.Queue()      # 나머지 이미지
-        }
-        
+        # 작업자 스레드가 생성되기 전에 작업 큐 교체
+        self._work_queue = _PriorityWorkQueue()
         self.shutdown_flag = False
-        self.queue_processor_thread = threading.Thread(
-            target=self._process_priority_queues,
-            daemon=True,
-            name=f"{thread_name_prefix}-QueueProcessor"
-        )
-        self.queue_processor_thread.start()
-    
-    def _process_priority_queues(self):
-        """우선순위 큐를 처리하는 스레드 함수"""
-        while not self.shutdown_flag:
-            task_info = None
-            
-            try:
-                # 1. 높은 우선순위 큐 먼저 확인
-                task_info = self.task_queues['high'].get_nowait()
-            except queue.Empty:
-                try:
-                    # 2. 중간 우선순위 큐 확인
-                    task_info = self.task_queues['medium'].get_nowait()
-                except queue.Empty:
-                    try:
-                        # 3. 낮은 우선순위 큐 확인
-                        task_info = self.task_queues['low'].get_nowait()
-                    except queue.Empty:
-                        # 모든 큐가 비어있으면 잠시 대기
-                        time.sleep(0.05)
-                        continue  # 루프의 처음으로 돌아가 다시 확인
-
-            # task_info가 성공적으로 가져와졌다면 작업 제출
-            if task_info:
-                # task_info는 (wrapper_function, args, kwargs) 튜플
-                try:
-                    super().submit(task_info[0], *task_info[1], **task_info[2])
-                except Exception as e:
-                    logging.error(f"작업 제출 실패: {e}")
     
     def submit_with_priority(self, priority, fn, *args, **kwargs):
         """우선순위와 함께 작업 제출"""
-        if priority not in self.task_queues:
-            priority = 'low'  # 기본값
-        
-        from concurrent.futures import Future
-        future = Future()
+        rank = self.PRIORITY_RANKS.get(priority, self.PRIORITY_RANKS['low'])  # 알 수 없으면 low
+        with self._shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+            if self._shutdown:
+                raise RuntimeError("종료된 스레드 풀에는 작업을 제출할 수 없습니다.")
+            future = Future()
+            self._work_queue.put((rank, _WorkItem(future, fn, args, kwargs)))
+            self._adjust_thread_count()
+        return future
 
-        # 실제 실행될 함수를 래핑하여 future 결과를 설정하도록 함
-        def wrapper():
-            try:
-                result = fn(*args, **kwargs)
-                future.set_result(result)
-            except Exception as e:
-                future.set_exception(e)
+    def submit_many_with_priority(self, priority, tasks):
+        """같은 우선순위의 여러 작업을 한 번에 제출
 
-        # 큐에 (래핑된 함수, 빈 인자, 빈 키워드 인자, future 객체)를 추가
-        self.task_queues[priority].put((wrapper, (), {}))
-        return future
+        tasks: (fn, args, kwargs) 튜플의 반복 가능 객체. 제출 순서대로 Future 목록을 반환합니다.
+        폴더 로딩처럼 수백 개의 작업을 연달아 넣을 때 큐 잠금을 작업마다 잡지 않도록 합니다.
+        """
+        rank = self.PRIORITY_RANKS.get(priority, self.PRIORITY_RANKS['low'])
+        with self._shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+            if self._shutdown:
+                raise RuntimeError("종료된 스레드 풀에는 작업을 제출할 수 없습니다.")
+            futures = []
+            work_items = []
+            for fn, args, kwargs in tasks:
+                future = Future()
+                futures.append(future)
+                work_items.append((rank, _WorkItem(future, fn, args, kwargs)))
+            self._work_queue.put_many(work_items)
+            # 작업 수만큼(최대 작업자 수까지) 유휴 작업자를 깨우거나 새 작업자 생성
+            for _ in range(min(len(work_items), self._max_workers)):
+                self._adjust_thread_count()
+        return futures
     
+    def purge_cancelled(self):
+        """취소된 대기 작업을 작업 큐에서 제거하고 제거된 수를 반환"""
+        return self._work_queue.purge_cancelled()
+
     def shutdown(self, wait=True, cancel_futures=False):
         """스레드 풀 종료"""
         self.shutdown_flag = True
         super().shutdown(wait=wait, cancel_futures=cancel_futures)
 
+def iter_until_empty(q):
+    """큐에 지금 남아 있는 항목을 블록 없이 꺼내며, 큐가 비면 멈춥니다."""
+    while True:
+        try:
+            yield q.get_nowait()
+        except queue.Empty:
+            return
+
+# Windows에서는 이름 있는 공유 메모리가 마지막 핸들이 닫히는 즉시 사라지므로,
+# 디코더 프로세스가 핸들을 닫은 뒤 메인 프로세스가 붙을 수 없습니다. 이 경우 픽셀을 bytes로 큐에 전달합니다.
+SHARED_RGB_SUPPORTED = sys.platform != "win32"
+
+def put_rgb_in_shared_memory(rgb):
+    """RGB 배열을 새 공유 메모리 블록에 한 번 복사하고 블록 이름을 반환합니다 (큐에는 이름만 전달)."""
+    shm = shared_memory.SharedMemory(create=True, size=rgb.nbytes)
+    try:
+        np.ndarray(rgb.shape, dtype=np.uint8, buffer=shm.buf)[:] = rgb
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()  # 블록은 메인 프로세스가 결과를 처리한 뒤 release_shared_rgb()로 해제
+    return shm.name
+
+def qimage_from_shared_rgb(shm_name, shape):
+    """공유 메모리의 RGB 데이터를 중간 bytes 복사 없이 표시용 QImage(display_qimage)로 변환합니다.
+
+    변환된 QImage가 픽셀을 복사해 가진 뒤에는 블록이 더 필요 없으므로 바로 해제(unlink)합니다.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        height, width, _ = shape
+        shared_image = QImage(shm.buf, width, height, width * 3, QImage.Format_RGB888)
+        qimage = display_qimage(shared_image)
+        del shared_image  # shm.close() 전에 버퍼 참조 해제
+        return qimage
+    finally:
+        shm.close()
+        try:
+            shm.unlink()  # 캐시 저장/화면 갱신 동안 원본 RGB 블록을 붙잡고 있지 않도록 즉시 해제
+        except FileNotFoundError:
+            pass
+
+def qimage_from_decoded_rgb(result):
+    """RAW 디코딩 결과(공유 메모리 블록 이름 또는 bytes)를 표시용 QImage로 변환합니다."""
+    shape = result.get('shape')
+    if not shape:
+        raise ValueError("디코딩 결과 형태 정보 누락")
+    shm_name = result.get('shm_name')
+    if shm_name:
+        return qimage_from_shared_rgb(shm_name, shape)
+    data = result.get('data')
+    if data is None:
+        raise ValueError("디코딩 결과 데이터 누락")
+    height, width, _ = shape
+    return display_qimage(QImage(data, width, height, width * 3, QImage.Format_RGB888))
+
+def release_shared_rgb(result):
+    """디코딩 결과가 가리키는 공유 메모리 블록을 해제합니다 (이미 해제된 경우 무시)."""
+    shm_name = result.get('shm_name') if isinstance(result, dict) else None
+    if not shm_name:
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"공유 메모리 해제 실패 ({shm_name}): {e}")
+
 def decode_raw_in_process(input_queue, output_queue):
     """별도 프로세스에서 RAW 디코딩 처리"""
     logging.info(f"RAW 디코더 프로세스 시작됨 (PID: {os.getpid()})")
     try:
-        import rawpy
         import numpy as np
     except ImportError as e:
         logging.error(f"RAW 디코더 프로세스 초기화 오류 (모듈 로드 실패): {e}")
@@ -2067,6 +3323,9 @@ def decode_raw_in_process(input_queue, output_queue):
     memory_warning_shown = False
     last_memory_log_time = 0  # 마지막 메모리 경고 로그 시간
     memory_log_cooldown = 60  # 메모리 경고 로그 출력 간격 (초)
+    memory_check_interval = 2.0  # 메모리 사용량 재조회 간격 (초) - 매 작업마다 조회하지 않음
+    last_memory_check = 0.0
+    memory_percent = 0
     
     while True:
         try:
@@ -2075,11 +3334,15 @@ def decode_raw_in_process(input_queue, output_queue):
                 logging.info(f"RAW 디코더 프로세스 종료 신호 수신 (PID: {os.getpid()})")
                 break
                 
-            file_path, task_id = task
+            file_path, task_id = task[0], task[1]
+            quality = task[2] if len(task) > 2 else 'full'
             
             # 작업 시작 전 메모리 확인
             try:
-                memory_percent = psutil.virtual_memory().percent
+                now = time.monotonic()
+                if now - last_memory_check > memory_check_interval:
+                    memory_percent = psutil.virtual_memory().percent
+                    last_memory_check = now
                 current_time = time.time()
                 
                 # 메모리 경고 로그는 일정 간격으로만 출력
@@ -2094,23 +3357,16 @@ def decode_raw_in_process(input_queue, output_queue):
                 if memory_percent > 95:
                     logging.warning(f"심각한 메모리 부족 ({memory_percent}%): RAW 디코딩 작업 {os.path.basename(file_path)} 연기")
                     # 작업을 큐에 다시 넣고 잠시 대기
-                    input_queue.put((file_path, task_id))
+                    input_queue.put((file_path, task_id, quality))
                     time.sleep(5)  # 조금 더 길게 대기
                     continue
             except:
                 pass  # psutil 사용 불가 시 무시
             
             try:
-                with rawpy.imread(file_path) as raw:
-                    # 이미지 처리 전 가비지 컬렉션 실행
-                    try:
-                        import gc
-                        gc.collect()
-                    except:
-                        pass
-                        
+                with load_raw_buffered(file_path) as raw:
                     # 이미지 처리
-                    rgb = raw.postprocess(use_camera_wb=True, output_bps=8)
+                    rgb = raw.postprocess(**raw_postprocess_options(quality))
                     
                     # 결과 메타데이터 준비
                     result = {
@@ -2123,13 +3379,16 @@ def decode_raw_in_process(input_queue, output_queue):
                     
                     # 데이터 형태 확인하고 전송 준비
                     if rgb.dtype == np.uint8 and rgb.ndim == 3:
-                        # 메모리 공유를 위해 numpy 배열을 바이트로 직렬화
-                        result['data'] = rgb.tobytes()
+                        # 픽셀 데이터는 공유 메모리에 두고 큐에는 블록 이름과 형태만 전달 (pickle/파이프 복사 방지)
+                        if SHARED_RGB_SUPPORTED:
+                            result['shm_name'] = put_rgb_in_shared_memory(rgb)
+                        else:
+                            result['data'] = rgb.tobytes()
                         result['shape'] = rgb.shape
                         result['dtype'] = str(rgb.dtype)
                         
                         # 큰 데이터는 로그에 출력하지 않음
-                        data_size_mb = len(result['data']) / (1024*1024)
+                        data_size_mb = rgb.nbytes / (1024*1024)
                         logging.info(f"RAW 디코딩 완료: {os.path.basename(file_path)} - {rgb.shape}, {data_size_mb:.2f}MB")
                     else:
                         # 예상치 못한 데이터 형식인 경우
@@ -2137,15 +3396,8 @@ def decode_raw_in_process(input_queue, output_queue):
                         result['success'] = False
                         result['error'] = f"Unexpected data format: {rgb.dtype}, shape={rgb.shape}"
                     
-                    # 처리 결과 전송 전 메모리에서 큰 객체 제거
-                    rgb = None
-                    
-                    # 명시적 가비지 컬렉션
-                    try:
-                        import gc
-                        gc.collect()
-                    except:
-                        pass
+                    # 처리 결과 전송 전 메모리에서 큰 객체 제거 (참조 카운트로 즉시 해제됨)
+                    del rgb
                     
                     output_queue.put(result)
                     
@@ -2168,8 +3420,28 @@ def decode_raw_in_process(input_queue, output_queue):
 
     logging.info(f"RAW 디코더 프로세스 종료 (PID: {os.getpid()})")
 
+class _RawResultRelay(QObject):
+    """결과 수신 스레드에서 받은 디코딩 결과를 메인 스레드로 전달하는 중계 객체"""
+    result_ready = Signal(object)
+
+    def __init__(self, dispatch):
+        super().__init__()
+        self._dispatch = dispatch
+        # 수신 스레드에서 emit해도 슬롯은 이 객체가 속한 메인 스레드에서 실행됨
+        self.result_ready.connect(self._deliver, Qt.QueuedConnection)
+
+    @Slot(object)
+    def _deliver(self, result):
+        self._dispatch(result)
+
 class RawDecoderPool:
-    """RAW 디코더 프로세스 풀"""
+    """RAW 디코더 프로세스 풀
+
+    결과 큐는 전용 수신 스레드가 블로킹으로 기다리다가 결과가 도착하는 즉시
+    메인 스레드로 전달하므로, 주기적인 폴링 없이 콜백이 메인 스레드에서 호출됩니다.
+    """
+    RESULT_WAIT_TIMEOUT = 0.5  # 수신 스레드가 종료 플래그를 확인하는 간격 (초)
+
     def __init__(self, num_processes=None):
         if num_processes is None:
         # 코어 수에 비례하되 상한선 설정
@@ -2196,9 +3468,17 @@ class RawDecoderPool:
         self.next_task_id = 0
         self.tasks = {}  # task_id -> callback
         self._running = True
+
+        # 결과 수신 스레드 (메인 스레드에서 생성된 중계 객체를 통해 콜백 실행)
+        self._result_relay = _RawResultRelay(self._dispatch_result)
+        self._consumer = threading.Thread(target=self._consume_loop, daemon=True, name="RawResultConsumer")
+        self._consumer.start()
     
-    def decode_raw(self, file_path, callback):
-        """RAW 디코딩 요청 (비동기)"""
+    def decode_raw(self, file_path, callback, quality='full'):
+        """RAW 디코딩 요청 (비동기)
+
+        quality: 'full'(확대/전체 화면용) 또는 'thumbnail'(축소 표시용 half_size 디코딩)
+        """
         if not self._running:
             print("RawDecoderPool이 이미 종료됨")
             return None
@@ -2208,39 +3488,56 @@ class RawDecoderPool:
         self.tasks[task_id] = callback
         
         print(f"RAW 디코딩 요청: {os.path.basename(file_path)} (task_id: {task_id})")
-        self.input_queue.put((file_path, task_id))
+        self.input_queue.put((file_path, task_id, quality))
         return task_id
     
-    def process_results(self, max_results=5):
-        """완료된 결과 처리 (메인 스레드에서 주기적으로 호출)"""
-        if not self._running:
-            return 0
-            
-        processed = 0
-        while processed < max_results:
+    def _consume_loop(self):
+        """결과 큐를 블로킹으로 기다렸다가 도착한 결과를 메인 스레드로 전달 (수신 스레드)"""
+        while self._running:
             try:
-                # non-blocking 확인
-                if self.output_queue.empty():
-                    break
-                    
-                result = self.output_queue.get_nowait()
-                task_id = result['task_id']
-                
-                if task_id in self.tasks:
-                    callback = self.tasks.pop(task_id)
-                    # 성공 여부와 관계없이 콜백 호출
-                    callback(result)
-                else:
-                    logging.warning(f"경고: task_id {task_id}에 대한 콜백을 찾을 수 없음")
-                
-                processed += 1
-                
+                result = self.output_queue.get(timeout=self.RESULT_WAIT_TIMEOUT)
+            except queue.Empty:
+                continue
             except Exception as e:
-                logging.error(f"결과 처리 중 오류: {e}")
+                if self._running:
+                    logging.error(f"RAW 디코딩 결과 수신 중 오류: {e}")
+                    time.sleep(self.RESULT_WAIT_TIMEOUT)
+                continue
+            if not self._running:
+                release_shared_rgb(result)
                 break
-                
-        return processed
+            self._result_relay.result_ready.emit(result)
+
+    def _dispatch_result(self, result):
+        """완료된 결과 하나를 해당 콜백에 전달 (메인 스레드)"""
+        try:
+            task_id = result['task_id']
+            if not self._running:
+                return
+            if task_id in self.tasks:
+                callback = self.tasks.pop(task_id)
+                # 성공 여부와 관계없이 콜백 호출
+                callback(result)
+            else:
+                logging.warning(f"경고: task_id {task_id}에 대한 콜백을 찾을 수 없음")
+        except Exception as e:
+            logging.error(f"결과 처리 중 오류: {e}")
+        finally:
+            # 콜백이 QPixmap으로 복사를 마쳤으므로 공유 메모리 블록 해제
+            release_shared_rgb(result)
     
+    def discard_pending(self):
+        """대기 중인 작업과 아직 전달되지 않은 결과를 버리고 작업 추적 정보를 비웁니다.
+
+        multiprocessing.Queue는 내부 버퍼를 한 번에 비울 수 없으므로 get_nowait()로 꺼내되,
+        empty() 확인과 꺼내기 사이의 경쟁을 피하도록 queue.Empty가 날 때까지만 반복합니다.
+        """
+        for _ in iter_until_empty(self.input_queue):
+            pass
+        for result in iter_until_empty(self.output_queue):
+            release_shared_rgb(result)  # 버려지는 결과의 공유 메모리 블록 해제
+        self.tasks.clear()
+
     def shutdown(self):
         """프로세스 풀 종료"""
         if not self._running:
@@ -2263,11 +3560,15 @@ class RawDecoderPool:
                 
         self.processes.clear()
         self.tasks.clear()
+        if self._consumer.is_alive():
+            self._consumer.join(self.RESULT_WAIT_TIMEOUT * 2)
         logging.info("RawDecoderPool 종료 완료")
 
 class ResourceManager:
     """스레드 풀과 프로세스 풀을 통합 관리하는 싱글톤 클래스"""
     _instance = None
+    SHUTDOWN_WAIT_TIMEOUT = 3.0  # 종료 시 실행 중인 이미징 작업을 기다리는 최대 시간(초)
+    TASK_REAP_THRESHOLD = 256    # 추적 중인 작업이 이 수를 넘으면 제출 시점에 완료된 작업을 정리
     
     @classmethod
     def instance(cls):
@@ -2309,6 +3610,7 @@ class ResourceManager:
         """시스템 리소스 사용량 모니터링 및 필요시 조치"""
         if not self._running:
             return
+        self._reap_finished_tasks()
             
         try:
             # 현재 메모리 사용량 확인
@@ -2319,9 +3621,6 @@ class ResourceManager:
                 print(f"심각한 메모리 부족 감지 ({memory_percent}%): 긴급 조치 수행")
                 # 우선순위 낮은 작업 취소
                 self.cancel_low_priority_tasks()
-                
-                # 가비지 컬렉션 명시적 호출
-                gc.collect()
         except:
             pass  # psutil 사용 불가 등의 예외 상황 무시
 
@@ -2354,8 +3653,7 @@ class ResourceManager:
             
             future = self.imaging_thread_pool.submit_with_priority(priority, fn, *args, **kwargs)
             if future: # 반환된 future가 유효한지 확인 (선택적이지만 안전함)
-                self.active_tasks.add(future)
-                future.add_done_callback(lambda f: self.active_tasks.discard(f))
+                self._track_tasks((future,))
             return future
 
         else:
@@ -2363,56 +3661,60 @@ class ResourceManager:
             return self.submit_imaging_task(fn, *args, **kwargs)
 
 
+    def submit_imaging_tasks_batch(self, priority, tasks):
+        """같은 우선순위의 이미지 처리 작업 여러 개를 한 번에 제출
+
+        tasks: (fn, args, kwargs) 튜플 목록. 제출된 Future 목록을 반환합니다.
+        """
+        if not self._running:
+            return []
+        futures = self.imaging_thread_pool.submit_many_with_priority(priority, tasks)
+        self._track_tasks(futures)
+        return futures
+
     def submit_imaging_task(self, fn, *args, **kwargs):
         """이미지 처리 작업 제출 (일반)"""
         if not self._running:
             return None
             
         future = self.imaging_thread_pool.submit(fn, *args, **kwargs)
-        self.active_tasks.add(future)
-        future.add_done_callback(lambda f: self.active_tasks.discard(f))
+        self._track_tasks((future,))
         return future
+
+    def _track_tasks(self, futures):
+        """제출한 작업을 취소/종료 대상으로 추적합니다.
+
+        작업마다 완료 콜백을 붙이지 않고, 추적 수가 많아질 때와 주기 모니터링에서 완료된 작업을 한꺼번에 정리합니다.
+        """
+        self.active_tasks.update(futures)
+        if len(self.active_tasks) > self.TASK_REAP_THRESHOLD:
+            self._reap_finished_tasks()
+
+    def _reap_finished_tasks(self):
+        """완료(또는 취소)된 작업을 추적 목록에서 제거"""
+        self.active_tasks = {future for future in self.active_tasks if not future.done()}
     
-    def submit_raw_decoding(self, file_path, callback):
-        """RAW 디코딩 작업 제출"""
+    def submit_raw_decoding(self, file_path, callback, quality='full'):
+        """RAW 디코딩 작업 제출 (quality: 'full' 또는 'thumbnail')"""
         if not self._running:
             return None
-        return self.raw_decoder_pool.decode_raw(file_path, callback)
-    
-    def process_raw_results(self, max_results=5):
-        """RAW 디코딩 결과 처리"""
-        if not self._running:
-            return 0
-        return self.raw_decoder_pool.process_results(max_results)
+        return self.raw_decoder_pool.decode_raw(file_path, callback, quality)
     
     def cancel_all_tasks(self):
         """모든 활성 작업 취소"""
         print("ResourceManager: 모든 작업 취소 중...")
         
-        # 1. 활성 스레드 풀 작업 취소
+        # 1. 활성 스레드 풀 작업 취소 (대기 중이던 작업은 큐에서도 바로 제거)
         for future in list(self.active_tasks):
             future.cancel()
         self.active_tasks.clear()
+        if isinstance(self.imaging_thread_pool, PriorityThreadPoolExecutor):
+            self.imaging_thread_pool.purge_cancelled()
         
         # 2. RAW 디코더 풀 작업 취소 (input_queue 비우기 추가)
         if hasattr(self, 'raw_decoder_pool') and self.raw_decoder_pool:
             try:
-                # 입력 큐 비우기 시도 (가능한 경우)
-                while not self.raw_decoder_pool.input_queue.empty():
-                    try:
-                        self.raw_decoder_pool.input_queue.get_nowait()
-                    except:
-                        break
-                
-                # 출력 큐 비우기 시도 (가능한 경우)
-                while not self.raw_decoder_pool.output_queue.empty():
-                    try:
-                        self.raw_decoder_pool.output_queue.get_nowait()
-                    except:
-                        break
-                        
-                # 작업 추적 정보 비우기
-                self.raw_decoder_pool.tasks.clear()
+                self.raw_decoder_pool.discard_pending()
                 print("RAW 디코더 작업 큐 및 작업 추적 정보 초기화됨")
             except Exception as e:
                 logging.error(f"RAW 디코더 풀 작업 취소 중 오류: {e}")
@@ -2427,12 +3729,19 @@ class ResourceManager:
         print("ResourceManager: 리소스 종료 중...")
         self._running = False # 종료 플래그 설정
         
-        # 활성 작업 취소 (기존 로직 유지)
-        self.cancel_all_tasks() 
-        
-        # 스레드 풀 종료
-        logging.info("ResourceManager: 이미징 스레드 풀 종료 시도 (wait=True)...")
-        self.imaging_thread_pool.shutdown(wait=True, cancel_futures=True)
+        # 활성 작업 취소 (취소되지 않은 = 이미 실행 중인 작업은 아래에서 제한 시간 동안만 대기)
+        tracked_tasks = list(self.active_tasks)
+        self.cancel_all_tasks()
+        
+        # 스레드 풀 종료 (멈춘 RAW 디코딩 하나 때문에 UI 종료가 무한정 막히지 않도록 대기 시간 제한)
+        logging.info("ResourceManager: 이미징 스레드 풀 종료 시도...")
+        self.imaging_thread_pool.shutdown(wait=False, cancel_futures=True)
+        running_tasks = [f for f in tracked_tasks if not f.done()]
+        if running_tasks:
+            _, not_done = wait_futures(running_tasks, timeout=self.SHUTDOWN_WAIT_TIMEOUT)
+            if not_done:
+                # 파이썬 스레드는 강제 종료할 수 없으므로 기록만 하고 진행
+                logging.warning(f"ResourceManager: {len(not_done)}개 이미징 작업이 {self.SHUTDOWN_WAIT_TIMEOUT}초 내에 끝나지 않아 기다리지 않고 종료를 계속합니다.")
         logging.info("ResourceManager: 이미징 스레드 풀 종료 완료.")
         
         # RAW 디코더 풀 종료 (기존 로직 유지)
@@ -2626,44 +3935,118 @@ class ThumbnailModel(QAbstractListModel):
                 self._loading_set.add(file_path)
                 self.thumbnailRequested.emit(file_path, i)
 
+def image_nbytes(image):
+    """QImage/QPixmap이 차지하는 픽셀 메모리 크기(바이트)를 추정합니다."""
+    return image.width() * image.height() * image.depth() // 8
+
+class ImageLRUCache(OrderedDict):
+    """항목별 픽셀 메모리 크기를 함께 추적하는 LRU용 OrderedDict
+
+    값은 그대로 QImage이므로 기존 dict 방식 접근(get, [], del, clear 등)을 유지합니다.
+    변경 연산과 total_bytes 계산은 lock(ImageLoader.cache_lock)으로 보호되어 이미징 스레드와
+    GUI 스레드가 동시에 접근해도 용량이 어긋나지 않습니다. 확인 후 삭제처럼 여러 단계로 이루어진
+    작업은 호출하는 쪽에서 같은 lock을 잡고 수행해야 합니다.
+    """
+    def __init__(self, lock=None):
+        super().__init__()
+        self._lock = lock or threading.RLock()
+        self._sizes = {}
+        self.total_bytes = 0
+
+    def __setitem__(self, key, image):
+        nbytes = image_nbytes(image)
+        with self._lock:
+            self.total_bytes += nbytes - self._sizes.get(key, 0)
+            self._sizes[key] = nbytes
+            super().__setitem__(key, image)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self.total_bytes -= self._sizes.pop(key, 0)
+
+    def pop(self, key, *default):
+        with self._lock:
+            if key in self:
+                self.total_bytes -= self._sizes.pop(key, 0)
+            return super().pop(key, *default)
+
+    def popitem(self, last=True):
+        with self._lock:
+            key, image = super().popitem(last=last)
+            self.total_bytes -= self._sizes.pop(key, 0)
+            return key, image
+
+    def move_to_end(self, key, last=True):
+        with self._lock:
+            super().move_to_end(key, last=last)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
 class ImageLoader(QObject):
-    """이미지 로딩 및 캐싱을 관리하는 클래스"""
+    """이미지 로딩 및 캐싱을 관리하는 클래스
+
+    작업 스레드에서 실행되는 로드 경로는 QPixmap을 만들지 않고 display_qimage 형태의 QImage만
+    반환/캐시합니다. QPixmap 변환은 시그널을 받은 GUI 스레드에서 QPixmap.fromImage로 수행합니다.
+    """
 
-    imageLoaded = Signal(int, QPixmap, str)  # 인덱스, 픽스맵, 이미지 경로
-    loadCompleted = Signal(QPixmap, str, int)  # pixmap, image_path, requested_index
+    imageLoaded = Signal(int, QImage, str)  # 인덱스, 이미지, 이미지 경로
+    loadCompleted = Signal(QImage, str, int)  # image, image_path, requested_index
     loadFailed = Signal(str, str, int)  # error_message, image_path, requested_index
     decodingFailedForFile = Signal(str) # 디코딩 실패 시 PhotoSortApp에 알리기 위한 새 시그널(실패한 파일 경로 전달)
 
      # 클래스 변수로 전역 전략 설정 (스레드 간 공유)
     _global_raw_strategy = "undetermined"
     _strategy_initialized = False  # 전략 초기화 여부 플래그 추가
+    CACHE_MEMORY_FRACTION = 0.15  # 이미지 캐시에 쓸 시스템 메모리 비율
+    CACHE_EVICT_TARGET = 0.9  # 상한 초과 시 이 비율까지 한 번에 비움
+    # 메모리 압박 단계별 재정리 최소 간격 (초). 심각할수록 더 자주 정리
+    CACHE_PRESSURE_COOLDOWNS = {"caution": 60, "warning": 10, "danger": 2}
+    DANGER_CACHE_LIMIT_FACTOR = 0.75  # danger 단계에서는 정상 상태로 돌아올 때까지 캐시 상한을 임시로 축소
+    THUMBNAIL_READ_QUALITY = 90  # load_thumbnail_with_orientation의 QImageReader 품질 (50 이상 = 부드러운 축소)
+    _DECODE_PENDING_PLACEHOLDER = None  # 최근 디코딩한 RAW 재요청 시 돌려줄 공용 플레이스홀더 QImage (첫 인스턴스 생성 시 만듦)
 
     def __init__(self, parent=None, raw_extensions=None):
         super().__init__(parent)
-        self.raw_extensions = raw_extensions or set()
+        if ImageLoader._DECODE_PENDING_PLACEHOLDER is None:
+            placeholder = QImage(100, 100, QImage.Format_RGB32)
+            placeholder.fill(QColor(40, 40, 40))
+            ImageLoader._DECODE_PENDING_PLACEHOLDER = placeholder
+        # 확장자 비교는 소문자 기준이므로 미리 소문자 frozenset으로 고정 (로드마다 해시 조회 한 번)
+        self.raw_extensions = frozenset(ext.lower() for ext in (raw_extensions or ()))
         
         # 시스템 메모리 기반 캐시 크기 조정
         self.system_memory_gb = self.get_system_memory_gb()
-        self.cache_limit = self.calculate_adaptive_cache_size()
-        self.cache = self.create_lru_cache(self.cache_limit)
+        self.cache_limit = self.calculate_adaptive_cache_size()  # 미리 로드할 이미지 수 계획용
+        self.base_cache_byte_limit = int(self.system_memory_gb * 1024 ** 3 * self.CACHE_MEMORY_FRACTION)
+        self.cache_byte_limit = self.base_cache_byte_limit  # 실제 캐시 상한 (메모리 부족 시 임시로 축소됨)
+        # 캐시 변경/용량 계산은 이미징 스레드 풀과 GUI 스레드에서 동시에 일어나므로 하나의 lock으로 보호
+        self.cache_lock = threading.RLock()
+        self.cache = self.create_lru_cache()
 
         # 디코딩 이력 추적 (중복 디코딩 방지용)
-        self.recently_decoded = {}  # 파일명 -> 마지막 디코딩 시간
+        self.recently_decoded = OrderedDict()  # 파일명 -> 마지막 디코딩 시간 (오래된 순서 유지)
         self.decoding_cooldown = 30  # 초 단위 (이 시간 내 중복 디코딩 방지)
 
         # 주기적 캐시 건전성 확인 타이머 추가
         self.cache_health_timer = QTimer()
-        self.cache_health_timer.setInterval(30000)  # 30초마다 캐시 건전성 확인
+        self.cache_health_timer.setInterval(5000)  # 5초마다 캐시 건전성 확인 (정상 상태면 즉시 반환)
         self.cache_health_timer.timeout.connect(self.check_cache_health)
         self.cache_health_timer.start()
         
-        # 마지막 캐시 동적 조정 시간 저장
-        self.last_cache_adjustment = time.time()
+        # 압박 단계별 마지막 캐시 정리 시간 (단계마다 쿨다운을 따로 적용)
+        self.last_cache_adjustment = {level: 0.0 for level in self.CACHE_PRESSURE_COOLDOWNS}
 
         self.resource_manager = ResourceManager.instance()
         self.active_futures = []  # 현재 활성화된 로딩 작업 추적
         self.last_requested_page = -1  # 마지막으로 요청된 페이지
         self._raw_load_strategy = "preview" # PhotoSortApp에서 명시적으로 설정하기 전까지의 기본값
+        # RAW 처리 방식별 로드 메서드 (load_image_with_orientation에서 조회)
+        self._raw_loaders = {"preview": self._load_raw_preview, "decode": self._load_raw_decode}
         self.load_executor = self.resource_manager.imaging_thread_pool
         
         # RAW 디코딩 보류 중인 파일 추적 
@@ -2672,13 +4055,29 @@ class ImageLoader(QObject):
         # 전략 결정을 위한 락 추가
         self._strategy_lock = threading.Lock()
 
+        # 스레드 풀 안에서 동시에 진행되는 RAW 직접 디코딩 수 제한 (메모리 대역폭/캐시 경합 방지)
+        # JPG 등 가벼운 로딩은 제한하지 않아 스레드 풀은 계속 활용됨
+        self._raw_decode_sem = threading.BoundedSemaphore(min(4, max(2, cpu_count() // 2)))
+
+        # 진행 중인 로드 작업 ((경로, 전략, 목표 크기) -> Future). 같은 이미지를 중복 디코딩하지 않도록 공유
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
     def cancel_loading(self):
         """진행 중인 모든 이미지 로딩 작업을 취소합니다."""
-        for future in self.active_futures:
-            future.cancel()
-        self.active_futures.clear()
+        self._cancel_queued_loads()
         logging.info("ImageLoader: 활성 로딩 작업이 취소되었습니다.")
 
+    def _cancel_queued_loads(self):
+        """아직 시작하지 않은 로딩 작업을 취소하고 스레드 풀 큐에서도 바로 제거합니다.
+
+        이미 실행 중인 작업은 중단할 수 없으므로 그대로 두며, 그 결과는 셀 경로 확인 단계에서 걸러집니다.
+        """
+        cancelled = sum(1 for future in self.active_futures if future.cancel())
+        self.active_futures.clear()
+        if cancelled and isinstance(self.load_executor, PriorityThreadPoolExecutor):
+            self.load_executor.purge_cancelled()
+
     def get_system_memory_gb(self):
         """시스템 메모리 크기 확인 (GB)"""
         try:
@@ -2695,10 +4094,9 @@ class ImageLoader(QObject):
         logging.info(f"ImageLoader: 캐시 크기 설정 -> {size}개 이미지 ({HardwareProfileManager.get_current_profile_name()} 프로필)")
         return size
     
-    def create_lru_cache(self, max_size): # 이 함수는 OrderedDict를 반환하며, 실제 크기 제한은 _add_to_cache에서 self.cache_limit을 사용하여 관리됩니다.
-        """LRU 캐시 생성 (OrderedDict 기반)"""
-        from collections import OrderedDict
-        return OrderedDict()
+    def create_lru_cache(self):
+        """LRU 캐시 생성 (용량 제한은 _add_to_cache에서 self.cache_byte_limit 기준으로 관리)"""
+        return ImageLRUCache(self.cache_lock)
     
     def check_cache_health(self):
         """캐시 상태 확인 및 시스템 프로필에 따라 동적으로 축소"""
@@ -2710,34 +4108,41 @@ class ImageLoader(QObject):
             thresholds = HardwareProfileManager.get("memory_thresholds")
             ratios = HardwareProfileManager.get("cache_clear_ratios")
             
-            # 임시 쿨다운 (향후 프로필에 추가 가능)
-            cooldowns = {"danger": 5, "warning": 10, "caution": 30}
-
             level = None
             if memory_percent > thresholds["danger"]: level = "danger"
             elif memory_percent > thresholds["warning"]: level = "warning"
             elif memory_percent > thresholds["caution"]: level = "caution"
 
-            if level and (current_time - self.last_cache_adjustment > cooldowns[level]):
-                reduction_count = max(1, int(len(self.cache) * ratios[level]))
-                removed_count = self._remove_oldest_items_from_cache(reduction_count)
+            if level is None:
+                # 정상 상태: 임시로 줄였던 캐시 상한만 복원하고 종료
+                self.cache_byte_limit = self.base_cache_byte_limit
+                return
+
+            if current_time - self.last_cache_adjustment[level] > self.CACHE_PRESSURE_COOLDOWNS[level]:
+                bytes_to_free = int(self.cache.total_bytes * ratios[level])
+                removed_count = self._remove_oldest_items_from_cache(bytes_to_free)
                 
                 log_level_map = {"danger": logging.CRITICAL, "warning": logging.WARNING, "caution": logging.INFO}
                 logging.log(
                     log_level_map[level],
-                    f"메모리 사용량 {level.upper()} 수준 ({memory_percent}%): 캐시 {ratios[level]*100:.0f}% 정리 ({removed_count}개 항목 제거)"
+                    f"메모리 사용량 {level.upper()} 수준 ({memory_percent}%): 캐시 {ratios[level]*100:.0f}% 정리 ({removed_count}개 항목, {bytes_to_free / (1024 ** 2):.0f}MB 제거)"
                 )
                 
-                self.last_cache_adjustment = current_time
-                gc.collect()
+                self.last_cache_adjustment[level] = current_time
+                if level == "danger":
+                    # 새로 채워지는 캐시도 작게 유지하고, 순환 참조까지 전체 수집
+                    self.cache_byte_limit = int(self.base_cache_byte_limit * self.DANGER_CACHE_LIMIT_FACTOR)
+                    gc.collect()
+                elif level == "warning":
+                    gc.collect(0)  # 가장 어린 세대만 수집 (전체 수집보다 훨씬 가벼움)
 
         except Exception as e:
             if "psutil" not in str(e):
                 logging.warning(f"check_cache_health에서 예외 발생: {e}")
 
-    def _remove_oldest_items_from_cache(self, count):
-        """캐시에서 가장 오래된 항목 제거하되, 현재 이미지와 인접 이미지는 보존"""
-        if not self.cache or count <= 0:
+    def _remove_oldest_items_from_cache(self, bytes_to_free):
+        """캐시에서 가장 오래된 항목부터 bytes_to_free 이상을 비우되, 현재 이미지와 인접 이미지는 보존"""
+        if not self.cache or bytes_to_free <= 0:
             return 0
             
         # 현재 이미지 경로 및 인접 이미지 경로 확인 (보존 대상)
@@ -2758,20 +4163,15 @@ class ImageLoader(QObject):
                         preserved_paths.add(str(self.image_files[idx]))
         
         # 2. 가장 오래된 항목부터 제거하되, 보존 대상은 제외
-        items_to_remove = []
         items_removed = 0
-        
-        for key in list(self.cache.keys()):
-            if items_removed >= count:
-                break
-                
-            if key not in preserved_paths:
-                items_to_remove.append(key)
-                items_removed += 1
-        
-        # 3. 실제 캐시에서 제거
-        for key in items_to_remove:
-            del self.cache[key]
+        with self.cache_lock:
+            target_bytes = self.cache.total_bytes - bytes_to_free
+            for key in list(self.cache.keys()):
+                if self.cache.total_bytes <= target_bytes:
+                    break
+                if key not in preserved_paths:
+                    self.cache.pop(key, None)
+                    items_removed += 1
             
         return items_removed  # 실제 제거된 항목 수 반환
 
@@ -2785,49 +4185,50 @@ class ImageLoader(QObject):
         self._raw_load_strategy = "preview"
         logging.info("모든 RAW 디코딩 작업 취소됨, 인스턴스 전략 초기화됨")
 
-    def check_decoder_results(self):
-        """멀티프로세스 RAW 디코더의 결과를 주기적으로 확인"""
-        # 리소스 매니저를 통한 접근으로 변경
-        self.resource_manager.process_raw_results(10)
-
-    def _add_to_cache(self, file_path, pixmap):
-        """PixMap을 LRU 방식으로 캐시에 추가"""
-        if pixmap and not pixmap.isNull():
-            # 캐시 크기 제한 확인
-            while len(self.cache) >= self.cache_limit:
-                # 가장 오래전에 사용된 항목 제거 (OrderedDict의 첫 번째 항목)
-                try:
-                    self.cache.popitem(last=False)
-                except:
-                    break  # 캐시가 비어있는 경우 예외 처리
-                    
-            # 새 항목 추가 또는 기존 항목 갱신 (최근 사용됨으로 표시)
-            self.cache[file_path] = pixmap
-            # 항목을 맨 뒤로 이동 (최근 사용)
-            self.cache.move_to_end(file_path)
+    def _add_to_cache(self, file_path, image):
+        """QImage를 LRU 방식으로 캐시에 추가"""
+        if image and not image.isNull():
+            # 캐시/진행 중 목록/시그널이 같은 경로 문자열 객체를 공유하도록 intern
+            file_path = sys.intern(file_path)
+            nbytes = image_nbytes(image)
+            with self.cache_lock:
+                # 같은 파일의 이전 항목은 먼저 빼서 용량 계산에서 제외
+                self.cache.pop(file_path, None)
+                # 용량(바이트) 제한을 넘게 되면 한 번에 상한의 CACHE_EVICT_TARGET까지 비워,
+                # 연속으로 추가될 때 매번 한두 개씩 제거하지 않도록 함
+                if self.cache.total_bytes + nbytes > self.cache_byte_limit:
+                    target_bytes = self.cache_byte_limit * self.CACHE_EVICT_TARGET - nbytes
+                    while self.cache and self.cache.total_bytes > target_bytes:
+                        self.cache.popitem(last=False)
+
+                # 새 항목 추가 (맨 뒤 = 최근 사용)
+                self.cache[file_path] = image
       
-    def _load_raw_preview_with_orientation(self, file_path):
+    def _load_raw_preview_with_orientation(self, file_path, max_size=None):
+        """RAW 파일의 내장 미리보기를 로드합니다.
+        max_size가 주어지면 내장 JPEG를 draft 모드로 축소 디코딩합니다 (썸네일용).
+        반환되는 크기는 항상 내장 미리보기의 원본 크기입니다.
+        """
         try:
-            with rawpy.imread(file_path) as raw:
+            with load_raw_buffered(file_path) as raw:
                 try:
                     thumb = raw.extract_thumb()
                     thumb_image = None
                     preview_width, preview_height = None, None
                     orientation = 1  # 기본 방향
 
-                    if thumb.format == rawpy.ThumbFormat.JPEG:
-                        # JPEG 썸네일 처리
-                        thumb_data = thumb.data
-                        thumb_image = Image.open(io.BytesIO(thumb_data))
-                        preview_width, preview_height = thumb_image.size
-
-                        # EXIF 방향 정보 추출 시도
-                        try:
-                            exif_data = thumb_image._getexif()
-                            if exif_data and 274 in exif_data:  # 274는 Orientation 태그
-                                orientation = exif_data[274]
-                        except:
-                            orientation = 1  # 실패 시 기본값
+                    if thumb.format == rawpy.ThumbFormat.JPEG and max_size:
+                        # 썸네일 용도: 전체 해상도 디코딩 없이 축소 디코딩
+                        thumb_image, orientation = load_jpeg_preview(io.BytesIO(thumb.data), max_size, max_size)
+                        # 원본 크기는 헤더만 읽어 확인 (디코딩 없음)
+                        preview_width, preview_height = Image.open(io.BytesIO(thumb.data)).size
+                    elif thumb.format == rawpy.ThumbFormat.JPEG:
+                        # 전체 크기 JPEG 미리보기: PIL 변환/복사 없이 Qt가 바로 디코딩하고 EXIF 방향도 Qt가 적용
+                        qimage, preview_width, preview_height = decode_jpeg_bytes_to_qimage(thumb.data)
+                        if qimage.isNull():
+                            raise ValueError("미리보기 JPEG 디코딩 실패")
+                        logging.info(f"내장 미리보기 로드 성공 ({Path(file_path).name})")
+                        return display_qimage(qimage), preview_width, preview_height
 
                     elif thumb.format == rawpy.ThumbFormat.BITMAP:
                         # 비트맵 썸네일 처리
@@ -2835,49 +4236,14 @@ class ImageLoader(QObject):
                         preview_width, preview_height = thumb_image.size
                     
                     if thumb_image:
-                        # 방향에 따라 이미지 회전
-                        if orientation > 1:
-                            rotation_methods = {
-                                2: Image.FLIP_LEFT_RIGHT,
-                                3: Image.ROTATE_180,
-                                4: Image.FLIP_TOP_BOTTOM,
-                                5: Image.TRANSPOSE,
-                                6: Image.ROTATE_270,
-                                7: Image.TRANSVERSE,
-                                8: Image.ROTATE_90
-                            }
-                            if orientation in rotation_methods:
-                                thumb_image = thumb_image.transpose(rotation_methods[orientation])
-                        
-                        # PIL Image를 QImage로 수동 변환 (ImageQt 사용하지 않음)
-                        if thumb_image.mode == 'P' or thumb_image.mode == 'RGBA':
-                            thumb_image = thumb_image.convert('RGBA')
-                            img_format = QImage.Format_RGBA8888
-                            bytes_per_pixel = 4
-                        elif thumb_image.mode != 'RGB':
-                            thumb_image = thumb_image.convert('RGB')
-                            img_format = QImage.Format_RGB888
-                            bytes_per_pixel = 3
-                        else:
-                            img_format = QImage.Format_RGB888
-                            bytes_per_pixel = 3
-                        
-                        data = thumb_image.tobytes('raw', thumb_image.mode)
-                        qimage = QImage(
-                            data,
-                            thumb_image.width,
-                            thumb_image.height,
-                            thumb_image.width * bytes_per_pixel,
-                            img_format
-                        )
-                        
-                        pixmap = QPixmap.fromImage(qimage)
+                        # 방향 적용과 QImage 변환 (PIL transpose/tobytes 대신 NumPy 뷰 + 한 번의 복사)
+                        qimage = qimage_from_pil(thumb_image, orientation)
                         
-                        if pixmap and not pixmap.isNull():
+                        if not qimage.isNull():
                             logging.info(f"내장 미리보기 로드 성공 ({Path(file_path).name})")
-                            return pixmap, preview_width, preview_height  # Return pixmap and dimensions
+                            return qimage, preview_width, preview_height  # Return image and dimensions
                         else:
-                            raise ValueError("미리보기 QPixmap 변환 실패")
+                            raise ValueError("미리보기 QImage 변환 실패")
                     else:
                         raise rawpy.LibRawUnsupportedThumbnailError(f"지원하지 않는 미리보기 형식: {thumb.format}")
 
@@ -2895,125 +4261,176 @@ class ImageLoader(QObject):
         # Should not be reached, but as fallback
         return None, None, None
     
-    def load_image_with_orientation(self, file_path, strategy_override=None):
+    def load_image_with_orientation(self, file_path, strategy_override=None, target_long_edge=None):
         """EXIF 방향 정보를 고려하여 이미지를 올바른 방향으로 로드 (RAW 로딩 방식은 _raw_load_strategy 따름)
            RAW 디코딩은 ResourceManager를 통해 요청하고, 이 메서드는 디코딩된 데이터 또는 미리보기를 반환합니다.
-           실제 디코딩 작업은 비동기로 처리될 수 있으며, 이 함수는 즉시 QPixmap을 반환하지 않을 수 있습니다.
+           실제 디코딩 작업은 비동기로 처리될 수 있으며, 이 함수는 즉시 QImage를 반환하지 않을 수 있습니다.
            대신 PhotoSortApp의 _load_image_task 에서 이 함수를 호출하고 콜백으로 결과를 받습니다.
+           target_long_edge: 그리드처럼 작게 표시할 때의 긴 변 픽셀 수. RAW 'decode' 방식에서 절반 해상도로도
+           충분하면 half_size로 빠르게 디코딩하며, 이 축소 결과는 원본 캐시에 저장하지 않습니다.
+           실제 로드는 형식/방식별 메서드(_load_regular_image, _raw_loaders)가 담당합니다.
+           작업 스레드에서 호출되므로 QPixmap이 아닌 QImage를 반환합니다 (GUI 스레드에서 QPixmap.fromImage로 변환).
         """
         logging.debug(f"ImageLoader ({id(self)}): load_image_with_orientation 호출됨. 파일: {Path(file_path).name}, 내부 전략: {self._raw_load_strategy}, 오버라이드: {strategy_override}")
         if not ResourceManager.instance()._running:
             logging.info(f"ImageLoader.load_image_with_orientation: ResourceManager 종료 중, 로드 중단 ({Path(file_path).name})")
-            return QPixmap()
+            return QImage()
         # strategy_override가 사용된 경우 캐시를 건너뛰지 않도록 캐시 확인 로직 유지
-        if strategy_override is None and file_path in self.cache:
-            self.cache.move_to_end(file_path)
-            return self.cache[file_path]
+        if strategy_override is None:
+            with self.cache_lock:
+                cached_image = self.cache.get(file_path)
+                if cached_image is not None:
+                    self.cache.move_to_end(file_path)
+                    return cached_image
+        if os.path.splitext(file_path)[1].lower() not in self.raw_extensions:
+            return self._load_regular_image(file_path)
+
+        current_processing_method = strategy_override if strategy_override else self._raw_load_strategy
+        raw_loader = self._raw_loaders.get(current_processing_method)
+        if raw_loader is None:
+            logging.warning(f"ImageLoader: 알 수 없거나 설정되지 않은 _raw_load_strategy ('{current_processing_method}'). 'preview' 사용 ({Path(file_path).name})")
+            raw_loader = self._load_raw_preview
+        # reduced_resolution: half_size 디코딩 결과 등 원본 캐시에 넣지 않을 결과 여부
+        image, reduced_resolution = raw_loader(file_path, target_long_edge)
+
+        # strategy_override가 사용되지 않았고 원본 해상도인 경우에만 캐시에 저장
+        if image and not image.isNull():
+            if strategy_override is None and not reduced_resolution:
+                self._add_to_cache(file_path, image)
+            return image
+        logging.error(f"RAW 처리 최종 실패 ({Path(file_path).name}), 빈 QImage 반환됨.")
+        return QImage()
+
+    def load_thumbnail_with_orientation(self, file_path, max_size):
+        """긴 변이 max_size 이하인 축소 이미지를 방향을 적용해 로드합니다 (목록 미리보기 등 작게 표시할 때).
+
+        원본이 이미 캐시에 있으면 그것을 축소하고, 없으면 원본 해상도로 디코딩하지 않고
+        JPEG DCT 축소(QImageReader.setScaledSize / draft)로 필요한 크기만 디코딩합니다.
+        결과는 원본 캐시에 저장하지 않습니다. 실패 시 빈 QImage를 반환합니다.
+        """
+        cached_image = self.cache.get(file_path)
+        if cached_image is not None:
+            return cached_image.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            if os.path.splitext(file_path)[1].lower() in self.raw_extensions:
+                # RAW는 내장 미리보기 JPEG만 축소 디코딩
+                qimage, _, _ = self._load_raw_preview_with_orientation(file_path, max_size=max_size)
+                return qimage if qimage is not None else QImage()
+            reader = QImageReader(str(file_path))
+            reader.setAutoTransform(True)
+            # JPEG 축소 디코딩은 quality가 50 이상일 때만 DCT 축소 뒤 SmoothTransformation으로 마무리됨
+            # (미만이면 빠른 DCT + FastTransformation). 기본값에 기대지 않고 명시
+            reader.setQuality(self.THUMBNAIL_READ_QUALITY)
+            if reader.canRead():
+                source_size = reader.size()
+                # 회전 전 크기 기준이지만 정사각형 상한이므로 방향과 무관하게 max_size 이내가 됨
+                if source_size.isValid() and max(source_size.width(), source_size.height()) > max_size:
+                    reader.setScaledSize(source_size.scaled(max_size, max_size, Qt.KeepAspectRatio))
+                qimage = reader.read()
+                if not qimage.isNull():
+                    return display_qimage(qimage)
+            # HEIC 등 Qt가 지원하지 않는 형식은 PIL로 처리
+            image, orientation = load_jpeg_preview(file_path, max_size, max_size)
+            return qimage_from_pil(image, orientation)
+        except Exception as e:
+            logging.error(f"축소 이미지 로드 실패 ({Path(file_path).name}): {e}")
+            return QImage()
+
+    def _load_raw_preview(self, file_path, target_long_edge=None):
+        """RAW 'preview' 방식: 내장 미리보기를 로드합니다. 반환값: (QImage, 축소 결과 여부)"""
+        file_path_obj = Path(file_path)
+        logging.info(f"ImageLoader: 'preview' 방식으로 로드 시도 ({file_path_obj.name})")
+        preview_image, _, _ = self._load_raw_preview_with_orientation(file_path)
+        if preview_image and not preview_image.isNull():
+            return preview_image, False
+        logging.warning(f"'preview' 방식 실패, 미리보기 로드 불가 ({file_path_obj.name})")
+        return QImage(), False
+
+    def _load_raw_decode(self, file_path, target_long_edge=None):
+        """RAW 'decode' 방식: 스레드 풀 안에서 직접 디코딩합니다. 반환값: (QImage, 축소 결과 여부)"""
         file_path_obj = Path(file_path)
-        is_raw = file_path_obj.suffix.lower() in self.raw_extensions
-        pixmap = None
-        if is_raw:
-            current_processing_method = strategy_override if strategy_override else self._raw_load_strategy
-            logging.debug(f"ImageLoader ({id(self)}): RAW 파일 '{file_path_obj.name}' 처리 시작, 최종 방식: {current_processing_method}")
-            if current_processing_method == "preview":
-                logging.info(f"ImageLoader: 'preview' 방식으로 로드 시도 ({file_path_obj.name})")
-                preview_pixmap_result, _, _ = self._load_raw_preview_with_orientation(file_path)
-                if preview_pixmap_result and not preview_pixmap_result.isNull():
-                    pixmap = preview_pixmap_result
+        logging.info(f"ImageLoader: 'decode' 방식으로 *직접* 로드 시도 (스레드 풀 내) ({file_path_obj.name})")
+        current_time = time.time()
+        if file_path_obj.name in self.recently_decoded:
+            last_decode_time = self.recently_decoded[file_path_obj.name]
+            if current_time - last_decode_time < self.decoding_cooldown:
+                logging.debug(f"최근 디코딩한 파일(성공/실패 무관): {file_path_obj.name}, 플레이스홀더 반환")
+                return ImageLoader._DECODE_PENDING_PLACEHOLDER, True  # 플레이스홀더는 캐시하지 않음
+        image = QImage()
+        reduced_resolution = False
+        try:
+            if not ResourceManager.instance()._running:
+                return QImage(), False
+            with self._raw_decode_sem, load_raw_buffered(file_path) as raw:
+                # 절반 해상도 출력으로도 표시 크기를 채울 수 있으면 디모자이크를 생략하는 half_size 사용
+                quality = 'full'
+                if target_long_edge and max(raw.sizes.width, raw.sizes.height) // 2 >= target_long_edge:
+                    quality = 'thumbnail'
                 else:
-                    logging.warning(f"'preview' 방식 실패, 미리보기 로드 불가 ({file_path_obj.name})")
-                    pixmap = QPixmap()
-            elif current_processing_method == "decode":
-                logging.info(f"ImageLoader: 'decode' 방식으로 *직접* 로드 시도 (스레드 풀 내) ({file_path_obj.name})")
-                current_time = time.time()
-                if file_path_obj.name in self.recently_decoded:
-                    last_decode_time = self.recently_decoded[file_path_obj.name]
-                    if current_time - last_decode_time < self.decoding_cooldown:
-                        logging.debug(f"최근 디코딩한 파일(성공/실패 무관): {file_path_obj.name}, 플레이스홀더 반환")
-                        placeholder = QPixmap(100, 100); placeholder.fill(QColor(40, 40, 40))
-                        return placeholder
-                try:
-                    self.recently_decoded[file_path_obj.name] = current_time
-                    if not ResourceManager.instance()._running:
-                        return QPixmap()
-                    with rawpy.imread(file_path) as raw:
-                        rgb = raw.postprocess(use_camera_wb=True, output_bps=8, no_auto_bright=False)
-                        height, width, _ = rgb.shape
-                        rgb_contiguous = np.ascontiguousarray(rgb)
-                        qimage = QImage(rgb_contiguous.data, width, height, rgb_contiguous.strides[0], QImage.Format_RGB888)
-                        pixmap_result = QPixmap.fromImage(qimage)
-                        if pixmap_result and not pixmap_result.isNull():
-                            pixmap = pixmap_result
-                            logging.info(f"RAW 직접 디코딩 성공 (스레드 풀 내) ({file_path_obj.name})")
-                        else:
-                            logging.warning(f"RAW 직접 디코딩 후 QPixmap 변환 실패 ({file_path_obj.name})")
-                            pixmap = QPixmap()
-                            self.decodingFailedForFile.emit(file_path)
-                except Exception as e_raw_decode:
-                    logging.error(f"RAW 직접 디코딩 실패 (스레드 풀 내) ({file_path_obj.name}): {e_raw_decode}")
-                    pixmap = QPixmap()
-                    self.decodingFailedForFile.emit(file_path)
-                self._clean_old_decoding_history(current_time)
+                    self.recently_decoded[sys.intern(file_path_obj.name)] = current_time
+                    self.recently_decoded.move_to_end(file_path_obj.name)  # 시간 순서 유지
+                rgb = raw.postprocess(**raw_postprocess_options(quality))
+            reduced_resolution = quality == 'thumbnail'
+            # LibRaw 내부 버퍼와 파일 버퍼를 먼저 해제한 뒤 QImage를 만들어 최대 메모리 사용량을 낮춤
+            height, width, _ = rgb.shape
+            # postprocess() 결과는 이미 C 연속 배열이므로 복사 없이 그대로 감쌈 (비연속일 때만 복사)
+            rgb = np.ascontiguousarray(rgb)
+            rgb_image = QImage(rgb.data, width, height, rgb.strides[0], QImage.Format_RGB888)
+            image_result = display_qimage(rgb_image)  # 표시용 포맷 변환이 Qt 소유 메모리로의 복사를 겸함
+            del rgb_image, rgb  # 픽셀은 변환 결과로 복사되었으므로 원본 배열 즉시 해제
+            if not image_result.isNull():
+                image = image_result
+                logging.info(f"RAW 직접 디코딩 성공 (스레드 풀 내) ({file_path_obj.name})")
             else:
-                logging.warning(f"ImageLoader: 알 수 없거나 설정되지 않은 _raw_load_strategy ('{current_processing_method}'). 'preview' 사용 ({file_path_obj.name})")
-                preview_pixmap_result, _, _ = self._load_raw_preview_with_orientation(file_path)
-                if preview_pixmap_result and not preview_pixmap_result.isNull():
-                    pixmap = preview_pixmap_result
-                else:
-                    pixmap = QPixmap()
-            
-            # strategy_override가 사용되지 않은 경우에만 캐시에 저장
-            if pixmap and not pixmap.isNull():
-                if strategy_override is None:
-                    self._add_to_cache(file_path, pixmap)
-                return pixmap
+                logging.warning(f"RAW 직접 디코딩 후 QImage 변환 실패 ({file_path_obj.name})")
+                self.decodingFailedForFile.emit(file_path)
+        except Exception as e_raw_decode:
+            logging.error(f"RAW 직접 디코딩 실패 (스레드 풀 내) ({file_path_obj.name}): {e_raw_decode}")
+            self.decodingFailedForFile.emit(file_path)
+        self._clean_old_decoding_history(current_time)
+        return image, reduced_resolution
+
+    def _load_regular_image(self, file_path):
+        """RAW가 아닌 이미지(JPG/PNG/HEIC 등)를 로드하고 캐시에 저장합니다."""
+        file_path_obj = Path(file_path)
+        try:
+            if not ResourceManager.instance()._running:
+                return QImage()
+            # Qt가 읽을 수 있는 형식(JPG/PNG/TIFF 등)은 PIL 변환/복사 없이 바로 디코딩 (EXIF 방향도 Qt가 적용)
+            # 확대 보기에 원본 해상도가 필요하므로 축소 디코딩(setScaledSize)은 하지 않음
+            reader = QImageReader(str(file_path))
+            reader.setAutoTransform(True)
+            if reader.canRead():
+                qimage = reader.read()
+                if not qimage.isNull():
+                    qimage = display_qimage(qimage)
+                    self._add_to_cache(file_path, qimage)
+                    return qimage
+                logging.debug(f"QImageReader 디코딩 실패, PIL로 재시도 ({file_path_obj.name}): {reader.errorString()}")
+            # HEIC 등 Qt가 지원하지 않는 형식은 PIL로 처리
+            with open(file_path, 'rb') as f:
+                image = Image.open(f)
+                image.load()
+            qimage = qimage_from_pil(image, read_image_orientation(image))
+            if not qimage.isNull():
+                self._add_to_cache(file_path, qimage)
+                return qimage
             else:
-                logging.error(f"RAW 처리 최종 실패 ({file_path_obj.name}), 빈 QPixmap 반환됨.")
-                return QPixmap()
-        else:
+                logging.warning(f"JPG QImage 변환 실패 ({file_path_obj.name})")
+                return QImage()
+        except Exception as e_jpg:
+            logging.error(f"JPG 이미지 처리 오류 ({file_path_obj.name}): {e_jpg}")
             try:
-                if not ResourceManager.instance()._running:
-                    return QPixmap()
-                with open(file_path, 'rb') as f:
-                    image = Image.open(f)
-                    image.load()
-                orientation = 1
-                if hasattr(image, 'getexif'):
-                    exif = image.getexif()
-                    if exif and 0x0112 in exif:
-                        orientation = exif[0x0112]
-                if orientation > 1:
-                    if orientation == 2: image = image.transpose(Image.FLIP_LEFT_RIGHT)
-                    elif orientation == 3: image = image.transpose(Image.ROTATE_180)
-                    elif orientation == 4: image = image.transpose(Image.FLIP_TOP_BOTTOM)
-                    elif orientation == 5: image = image.transpose(Image.TRANSPOSE)
-                    elif orientation == 6: image = image.transpose(Image.ROTATE_270)
-                    elif orientation == 7: image = image.transpose(Image.TRANSVERSE)
-                    elif orientation == 8: image = image.transpose(Image.ROTATE_90)
-                if image.mode == 'P' or image.mode == 'RGBA': image = image.convert('RGBA')
-                elif image.mode != 'RGB': image = image.convert('RGB')
-                img_format = QImage.Format_RGBA8888 if image.mode == 'RGBA' else QImage.Format_RGB888
-                bytes_per_pixel = 4 if image.mode == 'RGBA' else 3
-                data = image.tobytes('raw', image.mode)
-                qimage = QImage(data, image.width, image.height, image.width * bytes_per_pixel, img_format)
-                pixmap = QPixmap.fromImage(qimage)
-                if pixmap and not pixmap.isNull():
-                    self._add_to_cache(file_path, pixmap)
-                    return pixmap
-                else:
-                    logging.warning(f"JPG QPixmap 변환 실패 ({file_path_obj.name})")
-                    return QPixmap()
-            except Exception as e_jpg:
-                logging.error(f"JPG 이미지 처리 오류 ({file_path_obj.name}): {e_jpg}")
-                try:
-                    pixmap = QPixmap(file_path)
-                    if not pixmap.isNull(): self._add_to_cache(file_path, pixmap); return pixmap
-                    else: return QPixmap()
-                except Exception: return QPixmap()
+                qimage = QImage(file_path)
+                if not qimage.isNull():
+                    qimage = display_qimage(qimage)
+                    self._add_to_cache(file_path, qimage); return qimage
+                else: return QImage()
+            except Exception: return QImage()
 
     def set_raw_load_strategy(self, strategy: str):
         """이 ImageLoader 인스턴스의 RAW 처리 방식을 설정합니다 ('preview' 또는 'decode')."""
-        if strategy in ["preview", "decode"]:
+        if strategy in self._raw_loaders:
             old_strategy = self._raw_load_strategy
             self._raw_load_strategy = strategy
             logging.info(f"ImageLoader ({id(self)}): RAW 처리 방식 변경됨: {old_strategy} -> {self._raw_load_strategy}")
@@ -3025,42 +4442,31 @@ class ImageLoader(QObject):
         if len(self.recently_decoded) <= max_entries:
             return
             
-        # 현재 시간으로부터 일정 시간이 지난 항목 제거
+        # 항목은 디코딩 시간 순서로 유지되므로 앞쪽(가장 오래된 항목)부터 확인하여 제거
         old_threshold = current_time - (self.decoding_cooldown * 2)
-        keys_to_remove = []
-        
-        for file_name, decode_time in self.recently_decoded.items():
-            if decode_time < old_threshold:
-                keys_to_remove.append(file_name)
-        
-        # 실제 항목 제거
-        for key in keys_to_remove:
-            del self.recently_decoded[key]
+        while self.recently_decoded and next(iter(self.recently_decoded.values())) < old_threshold:
+            self.recently_decoded.popitem(last=False)
             
         # 여전히 너무 많은 항목이 있으면 가장 오래된 것부터 제거
-        if len(self.recently_decoded) > max_entries:
-            items = sorted(self.recently_decoded.items(), key=lambda x: x[1])
-            to_remove = items[:len(items) - max_entries]
-            for file_name, _ in to_remove:
-                del self.recently_decoded[file_name]
-
-    def preload_page(self, image_files, page_start_index, cells_per_page, strategy_override=None):
-        """특정 페이지의 이미지를 미리 로딩"""
+        while len(self.recently_decoded) > max_entries:
+            self.recently_decoded.popitem(last=False)
+
+    def preload_page(self, image_files, page_start_index, cells_per_page, strategy_override=None, target_long_edge=None):
+        """특정 페이지의 이미지를 미리 로딩 (target_long_edge: 셀의 긴 변 픽셀 수, load_image_with_orientation 참고)"""
         self.last_requested_page = page_start_index // cells_per_page
-        for future in self.active_futures:
-            future.cancel()
-        self.active_futures.clear()
+        self._cancel_queued_loads()
         end_idx = min(page_start_index + cells_per_page, len(image_files))
         futures = []
         for i in range(page_start_index, end_idx):
             if i < 0 or i >= len(image_files):
                 continue
-            img_path = str(image_files[i])
-            if img_path in self.cache:
-                pixmap = self.cache[img_path]
-                self.imageLoaded.emit(i - page_start_index, pixmap, img_path)
+            img_path = sys.intern(str(image_files[i]))
+            cached_image = self.cache.get(img_path)
+            if cached_image is not None:
+                self.imageLoaded.emit(i - page_start_index, cached_image, img_path)
             else:
-                future = self.load_executor.submit(self._load_and_signal, i - page_start_index, img_path, strategy_override)
+                future = self._submit_load(img_path, strategy_override, target_long_edge)
+                future.add_done_callback(partial(self._emit_loaded, i - page_start_index, img_path))
                 futures.append(future)
         self.active_futures = futures
         next_page_start = page_start_index + cells_per_page
@@ -3069,28 +4475,44 @@ class ImageLoader(QObject):
             for i in range(next_page_start, next_end):
                 if i >= len(image_files):
                     break
-                img_path = str(image_files[i])
+                img_path = sys.intern(str(image_files[i]))
                 if img_path not in self.cache:
-                    future = self.load_executor.submit(self._preload_image, img_path, strategy_override)
+                    future = self._submit_load(img_path, strategy_override)
                     self.active_futures.append(future)
-    
-    def _load_and_signal(self, cell_index, img_path, strategy_override=None):
-        """이미지 로드 후 시그널 발생"""
+
+    def _submit_load(self, img_path, strategy_override=None, target_long_edge=None):
+        """이미지 로드 작업을 제출하되, 같은 조건으로 진행 중인 작업이 있으면 그 Future를 재사용"""
+        key = (img_path, strategy_override, target_long_edge)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None and not future.cancelled():
+                return future
+            future = self.load_executor.submit(self._load_image_task, img_path, strategy_override, target_long_edge)
+            self._inflight[key] = future
+        # 완료/취소되면 진행 중 목록에서 제거 (이미 끝났다면 즉시 호출됨)
+        future.add_done_callback(partial(self._forget_inflight, key))
+        return future
+
+    def _forget_inflight(self, key, future):
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _load_image_task(self, img_path, strategy_override=None, target_long_edge=None):
+        """[Worker Thread] 이미지 로드 (결과 QImage는 Future로 전달)"""
+        return self.load_image_with_orientation(img_path, strategy_override=strategy_override,
+                                                target_long_edge=target_long_edge)
+
+    def _emit_loaded(self, cell_index, img_path, future):
+        """로드 Future가 끝나면 해당 셀에 결과 시그널 발생"""
+        if future.cancelled():
+            return
         try:
-            pixmap = self.load_image_with_orientation(img_path, strategy_override=strategy_override)
-            self.imageLoaded.emit(cell_index, pixmap, img_path)
-            return True
+            image = future.result()
         except Exception as e:
             logging.error(f"이미지 로드 오류 (인덱스 {cell_index}): {e}")
-            return False
-    
-    def _preload_image(self, img_path, strategy_override=None):
-        """이미지 미리 로드 (시그널 없음)"""
-        try:
-            self.load_image_with_orientation(img_path, strategy_override=strategy_override)
-            return True
-        except:
-            return False
+            return
+        self.imageLoaded.emit(cell_index, image, img_path)
     
     def clear_cache(self):
         """캐시 초기화"""
@@ -3098,19 +4520,9 @@ class ImageLoader(QObject):
         logging.info(f"ImageLoader ({id(self)}): Cache cleared. RAW load strategy '{self._raw_load_strategy}' is preserved.") # 로그 수정
         
         # 활성 로딩 작업도 취소
-        for future in self.active_futures:
-            future.cancel()
-        self.active_futures.clear()
+        self._cancel_queued_loads()
         logging.info(f"ImageLoader ({id(self)}): Active loading futures cleared.")
 
-    def set_raw_load_strategy(self, strategy: str):
-        """이 ImageLoader 인스턴스의 RAW 처리 방식을 설정합니다 ('preview' 또는 'decode')."""
-        if strategy in ["preview", "decode"]:
-            self._raw_load_strategy = strategy
-            logging.info(f"ImageLoader: RAW 처리 방식 설정됨: {strategy}")
-        else:
-            logging.warning(f"ImageLoader: 알 수 없는 RAW 처리 방식 '{strategy}'. 변경 안 함.")
-
 class ThumbnailDelegate(QStyledItemDelegate):
     """썸네일 아이템의 렌더링을 담당하는 델리게이트"""
     
@@ -3123,7 +4535,7 @@ class ThumbnailDelegate(QStyledItemDelegate):
     
     def _create_placeholder(self):
         """플레이스홀더 이미지 생성"""
-        size = UIScaleManager.get("thumbnail_image_size")
+        size = UI.thumbnail_image_size
         pixmap = QPixmap(size, size)
         pixmap.fill(QColor("#222222"))
         return pixmap
@@ -3135,10 +4547,10 @@ class ThumbnailDelegate(QStyledItemDelegate):
         
         # --- 기본 변수 설정 ---
         rect = option.rect
-        image_size = UIScaleManager.get("thumbnail_image_size")
-        padding = UIScaleManager.get("thumbnail_padding")
-        text_height = UIScaleManager.get("thumbnail_text_height")
-        border_width = UIScaleManager.get("thumbnail_border_width")
+        image_size = UI.thumbnail_image_size
+        padding = UI.thumbnail_padding
+        text_height = UI.thumbnail_text_height
+        border_width = UI.thumbnail_border_width
         
         # --- 상태 확인 ---
         is_current = index.data(Qt.UserRole + 1)
@@ -3169,11 +4581,7 @@ class ThumbnailDelegate(QStyledItemDelegate):
             pixmap = index.data(Qt.DecorationRole)
             target_pixmap = pixmap if pixmap and not pixmap.isNull() else self._placeholder_pixmap
             
-            scaled_pixmap = target_pixmap.scaled(
-                image_size, image_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            scaled_pixmap = ScaledPixmapCache.get(target_pixmap, image_size, image_size)
             
             x_pos = rect.x() + (rect.width() - scaled_pixmap.width()) // 2
             image_area_height = rect.height() - text_height - (padding * 3)
@@ -3192,11 +4600,9 @@ class ThumbnailDelegate(QStyledItemDelegate):
             )
             
             painter.setPen(QColor(ThemeManager.get_color('text')))
-            font = QFont("Arial", UIScaleManager.get("font_size", 10))
-            font.setPointSize(UIScaleManager.get("font_size"))
-            painter.setFont(font)
+            painter.setFont(cached_font("Arial", UI.font_size))
             
-            metrics = painter.fontMetrics()
+            metrics = cached_font_metrics("Arial", UI.font_size)
             elided_text = metrics.elidedText(filename, Qt.ElideMiddle, text_rect.width())
             painter.drawText(text_rect, Qt.AlignHCenter | Qt.AlignTop, elided_text)
 
@@ -3206,7 +4612,7 @@ class ThumbnailDelegate(QStyledItemDelegate):
     
     def sizeHint(self, option, index):
         """아이템 크기 힌트"""
-        height = UIScaleManager.get("thumbnail_item_height")
+        height = UI.thumbnail_item_height
         return QSize(0, height)
 
 class DraggableThumbnailView(QListView):
@@ -3299,6 +4705,7 @@ class ThumbnailPanel(QWidget):
         self.list_view.setDragDropMode(QListView.DragOnly)           # 드래그 허용
         self.list_view.setDefaultDropAction(Qt.MoveAction)
         self.list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.list_view.setUniformItemSizes(True)  # 항목 높이는 델리게이트가 고정값(thumbnail_item_height)으로 반환
         self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.list_view.setSpacing(UIScaleManager.get("thumbnail_item_spacing"))
@@ -3485,9 +4892,28 @@ class ThumbnailPanel(QWidget):
 
 class FileListDialog(QDialog):
     """사진 목록과 미리보기를 보여주는 팝업 대화상자"""
+    PREVIEW_THROTTLE_MS = 120  # 선택 변경 중 미리보기 갱신 최소 간격
+    PREFETCH_IDLE_MS = 300  # 선택이 이 시간 동안 멈추면 주변 항목 미리보기를 미리 디코딩
+    PREFETCH_RADIUS = 2  # 현재 항목 앞뒤로 미리 디코딩할 항목 수
+    previewReady = Signal(str, QImage)  # 작업 스레드에서 미리보기 디코딩 완료 (파일 경로, 이미지)
+    # 미리보기 레이블 상태별 스타일 (상태가 바뀔 때만 setStyleSheet 호출하여 QSS 재파싱 방지)
+    PREVIEW_STYLES = {
+        "image": "background-color: black; border-radius: 4px;",
+        "message": "background-color: black; color: white; border-radius: 4px;",
+        "error": "background-color: black; color: red; border-radius: 4px;",
+    }
+
     def __init__(self, image_files, current_index, image_loader, parent=None):
         super().__init__(parent)
-        self.image_files = image_files
+        self._preview_request = None  # 진행 중인 미리보기 디코딩 (파일 경로, Future)
+        self._prefetch_requests = {}  # 진행 중인 주변 항목 미리 디코딩 {파일 경로: Future}
+        # 선택 변경마다 쓰는 안내 문구는 한 번만 번역 (모달 대화상자라 열려 있는 동안 언어가 바뀌지 않음)
+        self._preview_messages = {
+            "no_selection": LanguageManager.translate("선택된 파일 없음"),
+            "no_path": LanguageManager.translate("파일 경로 없음"),
+            "load_failed": LanguageManager.translate("미리보기 로드 실패"),
+        }
+        self.image_files = list(image_files)  # 목록 행 번호와 1:1로 대응 (다이얼로그가 열린 동안 고정)
         self.image_loader = image_loader
         self.preview_size = 750 # --- 미리보기 크기 750으로 변경 ---
 
@@ -3511,31 +4937,19 @@ class FileListDialog(QDialog):
 
         # --- 좌측: 파일 목록 (이전 코드 유지, 스타일 포함) ---
         self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                border: 1px solid {ThemeManager.get_color('border')};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QListWidget::item {{
-                padding: 2px 0px;
-            }}
-            QListWidget::item:selected {{
-                background-color: {ThemeManager.get_color('accent')};
-                color: {ThemeManager.get_color('bg_primary')};
-            }}
-        """)
+        # 모든 행이 같은 글꼴/여백의 파일명 한 줄이므로 항목 크기는 한 번만 계산
+        # (Batched 배치 모드는 초기 scrollToItem 위치를 맞추지 못하므로 사용하지 않음)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setStyleSheet(ThemeManager.get_stylesheet("file_list"))
         list_font = parent.default_font if parent and hasattr(parent, 'default_font') else QFont("Arial", UIScaleManager.get("font_size", 10))
         list_font.setPointSize(UIScaleManager.get("font_size") -1)
         self.list_widget.setFont(list_font)
 
-        # 파일 목록 채우기 (이전 코드 유지)
-        for i, file_path in enumerate(self.image_files):
-            item = QListWidgetItem(file_path.name)
-            item.setData(Qt.UserRole, str(file_path))
-            self.list_widget.addItem(item)
+        # 파일 목록 채우기: 이름만 한 번에 추가 (항목별 addItem/setData 대신 삽입 한 번)
+        # 파일 경로는 항목에 저장하지 않고 행 번호로 self.image_files에서 찾음 (_file_path_for_item)
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.addItems([file_path.name for file_path in self.image_files])
+        self.list_widget.setUpdatesEnabled(True)
 
         # 현재 항목 선택 및 스크롤 (이전 코드 유지)
         if 0 <= current_index < self.list_widget.count():
@@ -3546,115 +4960,227 @@ class FileListDialog(QDialog):
         self.preview_label = QLabel()
         self.preview_label.setFixedSize(self.preview_size, self.preview_size) # --- 크기 750 적용 ---
         self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setStyleSheet(f"background-color: black; border-radius: 4px;")
+        self._preview_style_state = None
+        self._set_preview_style("image")
 
         # --- 레이아웃에 위젯 추가 (이전 코드 유지) ---
         self.main_layout.addWidget(self.list_widget, 1)
         self.main_layout.addWidget(self.preview_label, 0)
 
-        # --- 미리보기 업데이트 지연 로딩을 위한 타이머 설정 ---
+        # --- 미리보기 업데이트 스로틀 타이머 설정 ---
+        # 선택이 연속으로 바뀌어도 타이머를 재시작하지 않으므로, 키를 누르고 있는 동안에도
+        # PREVIEW_THROTTLE_MS마다 그 시점의 선택 항목으로 미리보기가 갱신됨 (디바운스처럼 멈출 때까지 기다리지 않음)
         self.preview_timer = QTimer(self)
         self.preview_timer.setSingleShot(True) # 한 번만 실행
-        self.preview_timer.setInterval(200)  # 200ms 지연
+        self.preview_timer.setInterval(self.PREVIEW_THROTTLE_MS)
         self.preview_timer.timeout.connect(self.load_preview) # 타이머 만료 시 load_preview 호출
 
+        # 주변 항목 미리 디코딩 타이머: 선택이 바뀔 때마다 재시작하므로 방향키를 누르고 있는 동안에는
+        # 실행되지 않고, 선택이 멈춘 뒤(유휴 시)에만 앞뒤 PREFETCH_RADIUS개 항목을 낮은 우선순위로 디코딩
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.PREFETCH_IDLE_MS)
+        self.prefetch_timer.timeout.connect(self._prefetch_neighbours)
+
         self.list_widget.currentItemChanged.connect(self.on_selection_changed)
+        self.previewReady.connect(self._on_preview_ready)
         # --- 더블클릭 시그널 연결 추가 ---
         self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
 
-        # 초기 미리보기 로드 (즉시 로드)
-        self.update_preview(self.list_widget.currentItem())
+        # 초기 미리보기 로드 (즉시 로드) 후 주변 항목 미리 디코딩 예약
+        self.load_preview()
+        self.prefetch_timer.start()
 
     def on_selection_changed(self, current, previous):
-        """목록 선택 변경 시 호출되는 슬롯, 미리보기 타이머 시작/재시작"""
-        # 현재 선택된 항목이 유효할 때만 타이머 시작
+        """목록 선택 변경 시 호출되는 슬롯, 미리보기 스로틀 타이머 시작"""
+        # 현재 선택된 항목이 유효할 때만 타이머 시작. 이미 대기 중이면 그대로 두면
+        # 만료 시 load_preview가 그 시점의 currentItem()을 읽으므로 중간 선택은 자연히 건너뜀
         if current:
-            self.preview_timer.start() # 타이머 시작 (이미 실행 중이면 재시작)
+            if not self.preview_timer.isActive():
+                self.preview_timer.start()
+            self.prefetch_timer.start()
         else:
             # 선택된 항목이 없으면 미리보기 즉시 초기화하고 타이머 중지
             self.preview_timer.stop()
-            self.preview_label.clear()
-            self.preview_label.setText(LanguageManager.translate("선택된 파일 없음"))
-            self.preview_label.setStyleSheet(f"background-color: black; color: white; border-radius: 4px;")
+            self.prefetch_timer.stop()
+            self._show_preview_message(self._preview_messages["no_selection"])
 
 
     def load_preview(self):
         """타이머 만료 시 실제 미리보기 로딩 수행"""
         current_item = self.list_widget.currentItem()
+        if current_item is None:
+            self._show_preview_message(self._preview_messages["no_selection"])
+            return
         self.update_preview(current_item)
 
 
-    def update_preview(self, current_item): # current_item 인자 유지
-        """선택된 항목의 미리보기 업데이트 (실제 로직)"""
-        if not current_item:
-            # load_preview 에서 currentItem()을 가져오므로, 여기서 다시 체크할 필요는 적지만 안전하게 둠
-            self.preview_label.clear()
-            self.preview_label.setText(LanguageManager.translate("선택된 파일 없음"))
-            self.preview_label.setStyleSheet(f"background-color: black; color: white; border-radius: 4px;")
+    def update_preview(self, current_item):
+        """선택된 항목의 미리보기 업데이트 (실제 로직, current_item은 None이 아님)"""
+        file_path = self._file_path_for_item(current_item)
+        if not file_path:
+            self._show_preview_message(self._preview_messages["no_path"])
             return
 
-        file_path = current_item.data(Qt.UserRole)
-        if not file_path:
-            self.preview_label.clear()
-            self.preview_label.setText(LanguageManager.translate("파일 경로 없음"))
-            self.preview_label.setStyleSheet(f"background-color: black; color: white; border-radius: 4px;")
+        # 축소된 미리보기는 QPixmapCache에 보관하여, 같은 항목을 다시 선택하면 디코딩을 생략
+        scaled_pixmap = QPixmapCache.find(self._preview_cache_key(file_path))
+        if scaled_pixmap is not None:
+            self._cancel_preview_request()
+            self._show_preview(scaled_pixmap)
             return
+        if self._preview_request and self._preview_request[0] == file_path:
+            return  # 같은 파일을 이미 디코딩 중
+        # 디코딩은 작업 스레드에서 수행 (RAW 미리보기 추출이 느려도 대화상자가 멈추지 않음).
+        # 완료될 때까지는 이전 미리보기를 그대로 둠
+        self._cancel_preview_request()
+        prefetch_future = self._prefetch_requests.pop(file_path, None)
+        if prefetch_future is not None and not prefetch_future.cancel():
+            # 미리 디코딩이 이미 실행 중이면 다시 제출하지 않고 그 결과를 기다림
+            self._preview_request = (file_path, prefetch_future)
+            return
+        future = self._submit_preview_decode('high', file_path)
+        if future is not None:
+            self._preview_request = (file_path, future)
+
+    def _submit_preview_decode(self, priority, file_path):
+        """미리보기 디코딩을 작업 스레드에 제출하고, 완료 시 previewReady로 결과를 받도록 연결"""
+        future = ResourceManager.instance().submit_imaging_task_with_priority(
+            priority, self.image_loader.load_thumbnail_with_orientation, file_path, self.preview_size)
+        if future is not None:
+            future.add_done_callback(partial(self._emit_preview_ready, file_path))
+        return future
 
-        # 이미지 로더를 통해 이미지 로드 (캐시 활용)
-        pixmap = self.image_loader.load_image_with_orientation(file_path)
+    def _prefetch_neighbours(self):
+        """현재 항목 앞뒤 PREFETCH_RADIUS개 중 캐시에 없는 미리보기를 낮은 우선순위로 미리 디코딩
 
+        선택이 옮겨가 범위를 벗어난 이전 미리 디코딩은 아직 시작 전이면 취소합니다.
+        """
+        row = self.list_widget.currentRow()
+        if row < 0:
+            return
+        wanted = [str(self.image_files[i])
+                  for i in range(max(0, row - self.PREFETCH_RADIUS), min(len(self.image_files), row + self.PREFETCH_RADIUS + 1))
+                  if i != row]
+        for file_path in [path for path in self._prefetch_requests if path not in wanted]:
+            self._prefetch_requests.pop(file_path).cancel()
+        for file_path in wanted:
+            if file_path in self._prefetch_requests or QPixmapCache.find(self._preview_cache_key(file_path)) is not None:
+                continue
+            future = self._submit_preview_decode('medium', file_path)
+            if future is not None:
+                self._prefetch_requests[file_path] = future
+
+    def _preview_cache_key(self, file_path):
+        return f"preview|{file_path}|{self.preview_size}"
+
+    def _cancel_preview_request(self):
+        """아직 시작하지 않은 미리보기 디코딩 취소 (이미 실행 중이면 결과만 무시됨)"""
+        if self._preview_request:
+            self._preview_request[1].cancel()
+            self._preview_request = None
+
+    def _emit_preview_ready(self, file_path, future):
+        """[작업 스레드] 디코딩 결과를 시그널로 GUI 스레드에 전달"""
+        if future.cancelled():
+            return
+        try:
+            image = future.result()
+            self.previewReady.emit(file_path, image if image is not None else QImage())
+        except RuntimeError:
+            pass  # 대화상자가 이미 닫혀 삭제됨
+        except Exception as e:
+            logging.error(f"미리보기 디코딩 실패 ({Path(file_path).name}): {e}")
+
+    def _on_preview_ready(self, file_path, image):
+        """미리보기 디코딩 완료 시 QPixmap으로 변환해 캐시에 저장하고, 여전히 선택된 파일이면 표시"""
+        if self._preview_request and self._preview_request[0] == file_path:
+            self._preview_request = None
+        self._prefetch_requests.pop(file_path, None)
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            QPixmapCache.insert(self._preview_cache_key(file_path), pixmap)
+        current_item = self.list_widget.currentItem()
+        if current_item is None or self._file_path_for_item(current_item) != file_path:
+            return  # 그 사이 다른 항목이 선택됨
         if pixmap.isNull():
-            self.preview_label.clear()
-            self.preview_label.setText(LanguageManager.translate("미리보기 로드 실패"))
-            self.preview_label.setStyleSheet(f"background-color: black; color: red; border-radius: 4px;")
+            self._show_preview_message(self._preview_messages["load_failed"], "error")
         else:
-            # 스케일링 속도 개선 (FastTransformation 유지)
-            scaled_pixmap = pixmap.scaled(self.preview_size, self.preview_size, Qt.KeepAspectRatio, Qt.FastTransformation)
-            self.preview_label.setPixmap(scaled_pixmap)
-            # 텍스트 제거를 위해 스타일 초기화
-            self.preview_label.setStyleSheet(f"background-color: black; border-radius: 4px;")
+            self._show_preview(pixmap)
+
+    def _show_preview(self, pixmap):
+        self.preview_label.setPixmap(pixmap)
+        self._set_preview_style("image")
+
+    def _show_preview_message(self, text, state="message"):
+        """미리보기 대신 안내 문구 표시 (state: PREVIEW_STYLES 키)"""
+        self.preview_label.clear()
+        self.preview_label.setText(text)
+        self._set_preview_style(state)
+
+    def _set_preview_style(self, state):
+        """미리보기 레이블 스타일을 상태가 바뀐 경우에만 적용"""
+        if self._preview_style_state != state:
+            self._preview_style_state = state
+            self.preview_label.setStyleSheet(self.PREVIEW_STYLES[state])
+
+    def done(self, result):
+        """대화상자를 닫을 때 대기 중인 미리보기 디코딩 취소"""
+        self.preview_timer.stop()
+        self.prefetch_timer.stop()
+        self._cancel_preview_request()
+        for future in self._prefetch_requests.values():
+            future.cancel()
+        self._prefetch_requests.clear()
+        super().done(result)
+
+    def _file_path_for_item(self, item):
+        """목록 항목에 대응하는 파일 경로 문자열 반환 (없으면 None)"""
+        row = self.list_widget.row(item)
+        if 0 <= row < len(self.image_files):
+            return str(self.image_files[row])
+        return None
 
     # --- 더블클릭 처리 메서드 추가 ---
     def on_item_double_clicked(self, item):
         """리스트 항목 더블클릭 시 호출되는 슬롯"""
-        file_path_str = item.data(Qt.UserRole)
-        if not file_path_str:
+        row = self.list_widget.row(item)
+        if not 0 <= row < len(self.image_files):
             return
 
-        file_path = Path(file_path_str)
+        file_path = self.image_files[row]  # 메인 목록과 같은 Path 객체 (문자열 변환/재생성 없음)
         parent_app = self.parent() # PhotoSortApp 인스턴스 가져오기
 
         # 부모가 PhotoSortApp 인스턴스이고 필요한 속성/메서드가 있는지 확인
         if parent_app and hasattr(parent_app, 'image_files') and hasattr(parent_app, 'set_current_image_from_dialog'):
             try:
-                # PhotoSortApp의 image_files 리스트에서 해당 Path 객체의 인덱스 찾기
-                index = parent_app.image_files.index(file_path)
+                # 목록은 image_files 순서 그대로이므로 보통은 행 번호가 곧 인덱스 (O(1)).
+                # 다이얼로그가 열린 뒤 메인 목록이 바뀐 경우에만 전체 검색
+                index = row
+                if not (0 <= index < len(parent_app.image_files) and parent_app.image_files[index] == file_path):
+                    index = parent_app.image_files.index(file_path)
                 parent_app.set_current_image_from_dialog(index) # 부모 앱의 메서드 호출
                 self.accept() # 다이얼로그 닫기 (성공적으로 처리되면)
             except ValueError:
                 logging.error(f"오류: 더블클릭된 파일을 메인 목록에서 찾을 수 없습니다: {file_path}")
-                # 사용자를 위한 메시지 박스 표시 등 추가 가능
-                # 수정: LanguageManager 적용
-                QMessageBox.warning(self, 
-                                    LanguageManager.translate("오류"), 
-                                    LanguageManager.translate("선택한 파일을 현재 목록에서 찾을 수 없습니다.\n목록이 변경되었을 수 있습니다."))
+                self._show_error(LanguageManager.translate("선택한 파일을 현재 목록에서 찾을 수 없습니다.\n목록이 변경되었을 수 있습니다."), QMessageBox.warning)
             except Exception as e:
                 logging.error(f"더블클릭 처리 중 오류 발생: {e}")
-                # 수정: LanguageManager 적용
-                QMessageBox.critical(self, 
-                                     LanguageManager.translate("오류"), 
-                                     f"{LanguageManager.translate('이미지 이동 중 오류가 발생했습니다')}:\n{e}")
+                self._show_error(f"{LanguageManager.translate('이미지 이동 중 오류가 발생했습니다')}:\n{e}")
         else:
             logging.error("오류: 부모 위젯 또는 필요한 속성/메서드를 찾을 수 없습니다.")
-            # 수정: LanguageManager 적용
-            QMessageBox.critical(self, 
-                                 LanguageManager.translate("오류"), 
-                                 LanguageManager.translate("내부 오류로 인해 이미지로 이동할 수 없습니다."))
+            self._show_error(LanguageManager.translate("내부 오류로 인해 이미지로 이동할 수 없습니다."))
+
+    def _show_error(self, text, show_box=QMessageBox.critical):
+        """번역된 '오류' 제목으로 메시지 상자 표시 (show_box: QMessageBox.critical 또는 warning)"""
+        show_box(self, LanguageManager.translate("오류"), text)
 
 class SessionManagementDialog(QDialog):
     def __init__(self, parent_widget: QWidget, main_app_logic: 'PhotoSortApp'): # 부모 위젯과 로직 객체를 분리
         super().__init__(parent_widget) # QDialog의 부모 설정
         self.parent_app = main_app_logic # PhotoSortApp의 메서드 호출을 위해 저장
+        # 생성 시점의 테마/언어 (스타일과 문구가 생성 시 고정되므로, 같을 때만 다시 열 때 재사용)
+        self.built_for = SessionManagementDialog.current_ui_state()
+        self._session_list_signature = None  # 마지막으로 목록을 채운 세션 (이름, 저장 시각) 목록
 
         self.setWindowTitle(LanguageManager.translate("세션 관리"))
         self.setMinimumSize(500, 400) # 팝업창 최소 크기
@@ -3671,41 +5197,30 @@ class SessionManagementDialog(QDialog):
 
         # --- 1. 현재 세션 저장 버튼 ---
         self.save_current_button = QPushButton(LanguageManager.translate("현재 세션 저장"))
-        self.save_current_button.setStyleSheet(self.parent_app.load_button.styleSheet()) # PhotoSortApp의 버튼 스타일 재활용
+        ThemeManager.set_theme_role(self.save_current_button, "dynamicButton") # PhotoSortApp 불러오기 버튼과 같은 전역 스타일 사용
         self.save_current_button.clicked.connect(self.prompt_and_save_session)
         main_layout.addWidget(self.save_current_button)
 
         # --- 2. 저장된 세션 목록 ---
-        list_label = QLabel(LanguageManager.translate("저장된 세션 목록 (최대 20개):"))
-        list_label.setStyleSheet(f"color: {ThemeManager.get_color('text')}; margin-top: 10px;")
-        main_layout.addWidget(list_label)
-
-        self.session_list_widget = QListWidget()
-        self.session_list_widget.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                border: 1px solid {ThemeManager.get_color('border')};
-                border-radius: 3px; padding: 5px;
-            }}
-            QListWidget::item {{ padding: 3px 2px; }}
-            QListWidget::item:selected {{
-                background-color: {ThemeManager.get_color('accent')};
-                color: white; /* 선택 시 텍스트 색상 */
-            }}
-        """)
+        list_label = QLabel(LanguageManager.translate("저장된 세션 목록 (최대 20개):"))
+        list_label.setStyleSheet(ThemeManager.get_stylesheet("section_label"))
+        main_layout.addWidget(list_label)
+
+        self.session_list_widget = QListWidget()
+        self.session_list_widget.setUniformItemSizes(True)
+        self.session_list_widget.setStyleSheet(ThemeManager.get_stylesheet("session_list"))
         self.session_list_widget.currentItemChanged.connect(self.update_all_button_states) # 시그널 연결 확인
         main_layout.addWidget(self.session_list_widget, 1) # 목록이 남은 공간 차지
 
         # --- 3. 불러오기 및 삭제 버튼 ---
         buttons_layout = QHBoxLayout()
         self.load_button = QPushButton(LanguageManager.translate("선택 세션 불러오기"))
-        self.load_button.setStyleSheet(self.parent_app.load_button.styleSheet())
+        ThemeManager.set_theme_role(self.load_button, "dynamicButton")
         self.load_button.clicked.connect(self.load_selected_session)
         self.load_button.setEnabled(False) # 초기에는 비활성화
 
         self.delete_button = QPushButton(LanguageManager.translate("선택 세션 삭제"))
-        self.delete_button.setStyleSheet(self.parent_app.load_button.styleSheet())
+        ThemeManager.set_theme_role(self.delete_button, "dynamicButton")
         self.delete_button.clicked.connect(self.delete_selected_session)
         self.delete_button.setEnabled(False) # 초기에는 비활성화
 
@@ -3714,29 +5229,39 @@ class SessionManagementDialog(QDialog):
         buttons_layout.addWidget(self.delete_button)
         buttons_layout.addStretch(1)
         main_layout.addLayout(buttons_layout)
-        
-        self.populate_session_list() # 처음 열릴 때 목록 채우기
-        self.update_all_button_states() # 초기 버튼 상태 설정
+        # 목록 채우기와 버튼 상태 설정은 표시 직전에 show_session_management_popup에서 수행
+
+    @staticmethod
+    def _format_legacy_timestamp(timestamp):
+        """display_ts가 없는 이전 버전 세션의 "YYYY-MM-DD HH:MM:SS"를 "YY/MM/DD HH:MM"으로 변환 (형식이 다르면 빈 문자열)"""
+        if (len(timestamp) == 19 and timestamp[4] == '-' and timestamp[7] == '-'
+                and timestamp[10] == ' ' and timestamp[13] == ':'):
+            return f"{timestamp[2:4]}/{timestamp[5:7]}/{timestamp[8:10]} {timestamp[11:16]}"
+        return ""
+
+    @staticmethod
+    def current_ui_state():
+        return (ThemeManager.get_current_theme_name(), LanguageManager.get_current_language())
 
     def populate_session_list(self):
         """PhotoSortApp의 saved_sessions를 가져와 목록 위젯을 채웁니다."""
-        self.session_list_widget.clear()
+        saved_sessions = self.parent_app.saved_sessions
         # 저장된 세션을 타임스탬프(또는 이름) 역순으로 정렬하여 최신 항목이 위로 오도록
         # 세션 이름에 날짜시간이 포함되므로, 이름 자체로 역순 정렬하면 어느 정도 최신순이 됨
-        sorted_session_names = sorted(self.parent_app.saved_sessions.keys(), reverse=True)
+        sorted_session_names = sorted(saved_sessions.keys(), reverse=True)
+        # 세션 추가/삭제/덮어쓰기가 없었다면 목록을 다시 만들지 않음 (선택 상태도 유지)
+        signature = tuple((name, saved_sessions[name].get("timestamp", "")) for name in sorted_session_names)
+        if signature == self._session_list_signature:
+            self.update_all_button_states()
+            return
+        self._session_list_signature = signature
+        self.session_list_widget.clear()
         
         for session_name in sorted_session_names:
             # 세션 정보에서 타임스탬프를 가져와 함께 표시 (선택 사항)
             session_data = self.parent_app.saved_sessions.get(session_name, {})
-            timestamp = session_data.get("timestamp", "")
-            display_text = session_name
-            if timestamp:
-                try: # 저장된 타임스탬프 형식에 맞춰 파싱 및 재포맷
-                    dt_obj = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    formatted_ts = dt_obj.strftime("%y/%m/%d %H:%M") # 예: 23/05/24 10:30
-                    display_text = f"{session_name} ({formatted_ts})"
-                except ValueError:
-                    pass # 파싱 실패 시 이름만 표시
+            formatted_ts = session_data.get("display_ts") or self._format_legacy_timestamp(session_data.get("timestamp", ""))
+            display_text = f"{session_name} ({formatted_ts})" if formatted_ts else session_name
             
             item = QListWidgetItem(display_text)
             item.setData(Qt.UserRole, session_name) # 실제 세션 이름(키)을 데이터로 저장
@@ -3818,6 +5343,32 @@ def format_camera_name(make, model):
         return model_str
     return f"{make_str} {model_str}".strip()
 
+class StateSaver(QObject):
+    """photosort_data.json 쓰기를 백그라운드 스레드에서 수행하는 워커
+
+    임시 파일(.tmp)에 먼저 쓴 뒤 os.replace로 교체하므로, 쓰는 도중 종료되어도 기존 파일이 손상되지 않습니다.
+    """
+    requestWrite = Signal(str, str)  # (저장 경로, 직렬화된 JSON 문자열)
+
+    def __init__(self):
+        super().__init__()
+        self.requestWrite.connect(self.write)
+
+    @Slot(str, str)
+    def write(self, path, text):
+        self.write_atomic(path, text)
+
+    @staticmethod
+    def write_atomic(path, text):
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            logging.info(f"상태 저장 완료: {path}")
+        except OSError as e:
+            logging.error(f"상태 저장 실패: {e}")
+
 class FolderLoaderWorker(QObject):
     """백그라운드 스레드에서 폴더 스캔, 파일 매칭, 정렬 작업을 수행하는 워커"""
     startProcessing = Signal(str, str, str, list, list)
@@ -3826,10 +5377,11 @@ class FolderLoaderWorker(QObject):
     progress = Signal(str)
     error = Signal(str, str)
 
-    def __init__(self, raw_extensions, get_datetime_func):
+    def __init__(self, raw_extensions, get_datetime_func, exif_batch_reader=None):
         super().__init__()
         self.raw_extensions = raw_extensions
         self.get_datetime_from_file_fast = get_datetime_func
+        self.exif_batch_reader = exif_batch_reader
         self._is_running = True
         
         self.startProcessing.connect(self.process_folders)
@@ -3838,6 +5390,48 @@ class FolderLoaderWorker(QObject):
     def stop(self):
         self._is_running = False
 
+    def _sort_by_datetime(self, files):
+        """촬영 시간 순으로 파일을 정렬합니다.
+        파일별 촬영 시간 추출은 I/O 위주 작업이므로 스레드 풀에서 병렬로 수행합니다.
+        중단 요청 시 None을 반환합니다.
+        """
+        files = list(files)
+        if len(files) < 2:
+            return files
+        datetimes = [None] * len(files)
+
+        # ExifTool이 있으면 상주 프로세스로 전체 촬영 시간을 한 번에 읽음
+        if self.exif_batch_reader is not None:
+            batch_results = self.exif_batch_reader.read_many(files, ("-DateTimeOriginal",))
+            for i, f in enumerate(files):
+                date_str = batch_results.get(str(f), {}).get("DateTimeOriginal")
+                if isinstance(date_str, str):
+                    try:
+                        datetimes[i] = parse_exif_datetime(date_str[:19])
+                    except ValueError:
+                        pass
+            if not self._is_running:
+                return None
+
+        # 나머지 파일은 piexif/파일 시간으로 병렬 추출
+        pending = [i for i, dt in enumerate(datetimes) if dt is None]
+        with ThreadPoolExecutor(max_workers=min(32, cpu_count() * 2)) as executor:
+            futures = {executor.submit(self.get_datetime_from_file_fast, files[i]): i for i in pending}
+            for future in as_completed(futures):
+                if not self._is_running:
+                    for f in futures:
+                        f.cancel()
+                    return None
+                i = futures[future]
+                try:
+                    datetimes[i] = future.result()
+                except Exception as e:
+                    logging.warning(f"촬영 시간 추출 실패 ({Path(files[i]).name}): {e}")
+                    datetimes[i] = datetime.fromtimestamp(0)
+        # 인덱스 기반 안정 정렬 (동일 시간이면 원래 순서 유지)
+        order = sorted(range(len(files)), key=datetimes.__getitem__)
+        return [files[i] for i in order]
+
     @Slot(str, str, str, list, list)
     def process_folders(self, jpg_folder_path, raw_folder_path, mode, raw_file_list_from_main, supported_extensions):
         """메인 처리 함수 (mode에 따라 분기)"""
@@ -3848,32 +5442,33 @@ class FolderLoaderWorker(QObject):
 
             if mode == 'raw_only':
                 self.progress.emit(LanguageManager.translate("RAW 파일 정렬 중..."))
-                image_files = sorted(raw_file_list_from_main, key=self.get_datetime_from_file_fast)
+                image_files = self._sort_by_datetime(raw_file_list_from_main)
+                if image_files is None: return
             
             else: # 'jpg_with_raw' or 'jpg_only'
                 self.progress.emit(LanguageManager.translate("이미지 파일 스캔 중..."))
                 target_path = Path(jpg_folder_path)
                 temp_image_files = []
-                for file_path in target_path.iterdir():
+                for entry in iter_photos(target_path, supported_extensions):
                     if not self._is_running: return
-                    if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                        temp_image_files.append(file_path)
+                    temp_image_files.append(Path(entry.path))
                 
                 if not temp_image_files:
                     self.error.emit(LanguageManager.translate("선택한 폴더에 지원하는 이미지 파일이 없습니다."), LanguageManager.translate("경고"))
                     return
 
                 self.progress.emit(LanguageManager.translate("파일 정렬 중..."))
-                image_files = sorted(temp_image_files, key=self.get_datetime_from_file_fast)
+                image_files = self._sort_by_datetime(temp_image_files)
+                if image_files is None: return
 
                 if mode == 'jpg_with_raw' and raw_folder_path:
                     self.progress.emit(LanguageManager.translate("RAW 파일 매칭 중..."))
                     jpg_filenames = {f.stem: f for f in image_files}
-                    for file_path in Path(raw_folder_path).iterdir():
+                    for entry in iter_photos(raw_folder_path, self.raw_extensions):
                         if not self._is_running: return
-                        if file_path.is_file() and file_path.suffix.lower() in self.raw_extensions:
-                            if file_path.stem in jpg_filenames:
-                                raw_files[file_path.stem] = file_path
+                        stem = os.path.splitext(entry.name)[0]
+                        if stem in jpg_filenames:
+                            raw_files[stem] = entry.path # 문자열 경로로 저장 (세션 저장/복원 시 변환 불필요)
             
             if not self._is_running: return
             self.finished.emit(image_files, raw_files, jpg_folder_path, raw_folder_path, mode)
@@ -3884,6 +5479,17 @@ class FolderLoaderWorker(QObject):
 
 class PhotoSortApp(QMainWindow):
     STATE_FILE = "photosort_data.json" # 상태 저장 파일 이름 정의
+    PIXMAP_CACHE_LIMIT_KB = 256 * 1024  # QPixmapCache 용량 (KB). 기본 10MB로는 화면 크기 Fit 이미지 하나도 담기 어려움
+    # 뷰포트 이동 키 상태 비트 (눌린 방향키를 정수 비트마스크로 관리)
+    VIEWPORT_KEY_LEFT, VIEWPORT_KEY_RIGHT, VIEWPORT_KEY_UP, VIEWPORT_KEY_DOWN = 1, 2, 4, 8
+    VIEWPORT_ARROW_KEY_BITS = {Qt.Key_Left: VIEWPORT_KEY_LEFT, Qt.Key_Right: VIEWPORT_KEY_RIGHT,
+                               Qt.Key_Up: VIEWPORT_KEY_UP, Qt.Key_Down: VIEWPORT_KEY_DOWN}
+    VIEWPORT_WASD_KEY_BITS = {Qt.Key_A: VIEWPORT_KEY_LEFT, Qt.Key_D: VIEWPORT_KEY_RIGHT,  # Shift+WASD는 방향키와 같은 비트 사용
+                              Qt.Key_W: VIEWPORT_KEY_UP, Qt.Key_S: VIEWPORT_KEY_DOWN}
+    # 방향 비트 조합(0~15) -> (dx, dy) 단위 벡터 테이블. 반대 방향이 동시에 눌리면 상쇄됨
+    VIEWPORT_MASK_DIRECTIONS = tuple(
+        ((m & 1) - ((m >> 1) & 1), ((m >> 2) & 1) - ((m >> 3) & 1)) for m in range(16)
+    )
     
     # 단축키 정의 (두 함수에서 공통으로 사용)
     SHORTCUT_DEFINITIONS = [
@@ -3928,7 +5534,7 @@ class PhotoSortApp(QMainWindow):
         self.supported_image_extensions = {
             '.jpg', '.jpeg'
         }
-        self.raw_files = {}  # 키: 기본 파일명, 값: RAW 파일 경로
+        self.raw_files = {}  # 키: 기본 파일명, 값: RAW 파일 경로 (str)
         self.is_raw_only_mode = False # RAW 단독 로드 모드인지 나타내는 플래그
         self.raw_extensions = {'.arw', '.crw', '.dng', '.cr2', '.cr3', '.nef', 
                              '.nrw', '.raf', '.srw', '.srf', '.sr2', '.rw2', 
@@ -3949,6 +5555,7 @@ class PhotoSortApp(QMainWindow):
         self.control_panel_on_right = False # 기본값: 왼쪽 (False)
 
         self.viewport_move_speed = 5 # 뷰포트 이동 속도 (1~10), 기본값 5
+        self.viewport_move_amount = self.viewport_move_speed * 12 # 타이머 1회당 이동 픽셀 (속도 변경 시에만 재계산)
         self.mouse_wheel_action = "photo_navigation"  # 마우스 휠 동작: "photo_navigation" 또는 "none"
 
         self.mouse_wheel_sensitivity = 1 # 휠 민감도 (1, 2, 3)
@@ -3957,6 +5564,7 @@ class PhotoSortApp(QMainWindow):
         self.wheel_reset_timer = QTimer(self)
         self.wheel_reset_timer.setSingleShot(True)  # 한 번만 실행
         self.wheel_reset_timer.setInterval(1000)    # 1초 (1000ms)
+        self.wheel_reset_timer.setTimerType(Qt.CoarseTimer) # 정밀도 불필요 → 다른 타이머와 깨어남 병합
         self.wheel_reset_timer.timeout.connect(self._reset_wheel_accumulator)
 
         self.mouse_pan_sensitivity = 1.5  # 마우스 패닝 감도 (1.0, 1.5, 2.0 등)
@@ -3973,12 +5581,16 @@ class PhotoSortApp(QMainWindow):
         
         # 세션 관리 팝업 인스턴스 (중복 생성 방지용)
         self.session_management_popup = None
+        self._compare_filenames_dirty = False # update_compare_filenames 예약 여부
+        # 설정 팝업 인스턴스 (첫 사용 시 _lazy로 생성)
+        self.settings_popup = None
 
         # --- 뷰포트 부드러운 이동을 위한 변수 ---
         self.viewport_move_timer = QTimer(self)
         self.viewport_move_timer.setInterval(16) # 약 60 FPS (1000ms / 60 ~= 16ms)
+        self.viewport_move_timer.setTimerType(Qt.PreciseTimer) # 프레임 간격이 흔들리지 않도록 정밀 타이머 사용
         self.viewport_move_timer.timeout.connect(self.smooth_viewport_move)
-        self.pressed_keys_for_viewport = set() # 현재 뷰포트 이동을 위해 눌린 키 저장
+        self.viewport_key_mask = 0 # 현재 뷰포트 이동을 위해 눌린 방향 비트 (VIEWPORT_KEY_*)
 
         # 뷰포트 저장 및 복구를 위한 변수
         self.viewport_focus_by_orientation = {
@@ -3999,6 +5611,7 @@ class PhotoSortApp(QMainWindow):
         # 메모리 모니터링 및 자동 조정을 위한 타이머
         self.memory_monitor_timer = QTimer(self)
         self.memory_monitor_timer.setInterval(10000)  # 10초마다 확인
+        self.memory_monitor_timer.setTimerType(Qt.VeryCoarseTimer) # 초 단위 정밀도로 충분 (불필요한 깨어남 방지)
         self.memory_monitor_timer.timeout.connect(self.check_memory_usage)
         self.memory_monitor_timer.start()
 
@@ -4006,8 +5619,20 @@ class PhotoSortApp(QMainWindow):
         self.state_save_timer = QTimer(self)
         self.state_save_timer.setSingleShot(True) # 한 번만 실행되도록 설정
         self.state_save_timer.setInterval(5000)  # 5초 (5000ms)
+        self.state_save_timer.setTimerType(Qt.VeryCoarseTimer)
         self.state_save_timer.timeout.connect(self._trigger_state_save_for_index) # 새 슬롯 연결
 
+        # save_state 요청을 모아 한 번만 쓰기 위한 디바운스 타이머와 백그라운드 저장 스레드
+        self.state_write_timer = QTimer(self)
+        self.state_write_timer.setSingleShot(True)
+        self.state_write_timer.setInterval(250)
+        self.state_write_timer.setTimerType(Qt.CoarseTimer)
+        self.state_write_timer.timeout.connect(self._write_pending_state)
+        self.state_saver_thread = QThread()
+        self.state_saver = StateSaver()
+        self.state_saver.moveToThread(self.state_saver_thread)
+        self.state_saver_thread.start()
+
         # 시스템 사양 검사
         self.system_memory_gb = self.get_system_memory_gb()
         self.system_cores = cpu_count()
@@ -4033,10 +5658,13 @@ class PhotoSortApp(QMainWindow):
 
         # 리소스 매니저 초기화
         self.resource_manager = ResourceManager.instance()
+        # 썸네일 디스크 캐시 용량 정리 (낮은 우선순위 백그라운드 작업)
+        self.resource_manager.submit_imaging_task_with_priority('low', ThumbnailCache.prune)
 
         # === 유휴 프리로더(Idle Preloader) 타이머 추가 ===
         self.idle_preload_timer = QTimer(self)
         self.idle_preload_timer.setSingleShot(True)
+        self.idle_preload_timer.setTimerType(Qt.CoarseTimer)
         # HardwareProfileManager에서 유휴 로딩 관련 설정 가져오기
         self.idle_preload_enabled = HardwareProfileManager.get("idle_preload_enabled")
         if self.idle_preload_enabled:
@@ -4048,15 +5676,7 @@ class PhotoSortApp(QMainWindow):
         else:
             logging.info("유휴 프리로더 비활성화 (Conservative 프로필)")
 
-        # RAW 디코더 결과 처리 타이머 
-        if not hasattr(self, 'raw_result_processor_timer'): # 중복 생성 방지
-            self.raw_result_processor_timer = QTimer(self)
-            self.raw_result_processor_timer.setInterval(100)  # 0.1초마다 결과 확인 (조정 가능)
-            self.raw_result_processor_timer.timeout.connect(self.process_pending_raw_results)
-            self.raw_result_processor_timer.start()
-
         # --- 그리드 썸네일 사전 생성을 위한 변수 추가 ---
-        self.grid_thumbnail_cache = {"2x2": {}, "3x3": {}, "4x4": {}}
         self.active_thumbnail_futures = [] # 현재 실행 중인 백그라운드 썸네일 작업 추적
         self.grid_thumbnail_executor = ThreadPoolExecutor(
         max_workers=2, 
@@ -4088,7 +5708,9 @@ class PhotoSortApp(QMainWindow):
         }
         
         # 이미지 캐싱 관련 변수 추가
-        self.fit_pixmap_cache = {}  # 크기별로 Fit 이미지 캐싱
+        # Fit 이미지와 미리보기 축소본은 QPixmapCache(전역, 용량 제한 LRU)에 보관. 키에 원본 pixmap의
+        # cacheKey를 넣으므로 이미지가 바뀌면 자동으로 다른 항목이 되고, 오래된 항목은 용량 초과 시 밀려남
+        QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
         self.last_fit_size = (0, 0)
         
         # 이미지 로더/캐시 추가
@@ -4178,7 +5800,7 @@ class PhotoSortApp(QMainWindow):
 
         # 3. 기존 control_layout을 이 새로운 위젯에 설정
         self.control_layout = QVBoxLayout(scroll_content_widget)
-        self.control_layout.setContentsMargins(*UIScaleManager.get_margins())
+        self.control_layout.setContentsMargins(UI.control_panel_qmargins)
         self.control_layout.setSpacing(UIScaleManager.get("control_layout_spacing"))
 
         # 4. QScrollArea(self.control_panel)에 콘텐츠 위젯을 설정
@@ -4337,7 +5959,7 @@ class PhotoSortApp(QMainWindow):
 
         # JPG 폴더 클리어 버튼 (X) 추가 (레이블 높이에 맞춰짐)
         self.jpg_clear_button = QPushButton("✕")
-        self.jpg_clear_button.setStyleSheet(ThemeManager.generate_action_button_style())
+        ThemeManager.set_theme_role(self.jpg_clear_button, "actionButton")
         # InfoFolderPathLabel은 내부적으로 이미 높이가 고정되었으므로, 그 값을 바로 사용합니다.
         label_fixed_height = self.folder_path_label.height()
         self.jpg_clear_button.setFixedHeight(label_fixed_height)
@@ -4350,7 +5972,7 @@ class PhotoSortApp(QMainWindow):
         jpg_folder_layout.addWidget(self.jpg_clear_button)
         
         self.load_button = QPushButton(LanguageManager.translate("이미지 불러오기"))
-        self.load_button.setStyleSheet(ThemeManager.generate_main_button_style())
+        ThemeManager.set_theme_role(self.load_button, "dynamicButton")
         
         # 레이블 높이의 0.x배로 버튼 높이를 고정합니다.
         button_height = int(self.folder_path_label.height() * 0.72)
@@ -4378,7 +6000,7 @@ class PhotoSortApp(QMainWindow):
 
         # RAW 폴더 클리어 버튼 (X) 추가
         self.raw_clear_button = QPushButton("✕")
-        self.raw_clear_button.setStyleSheet(ThemeManager.generate_action_button_style())
+        ThemeManager.set_theme_role(self.raw_clear_button, "actionButton")
         raw_label_fixed_height = self.raw_folder_path_label.height()
         self.raw_clear_button.setFixedHeight(raw_label_fixed_height)
         self.raw_clear_button.setFixedWidth(UIScaleManager.get("delete_button_width"))
@@ -4390,7 +6012,7 @@ class PhotoSortApp(QMainWindow):
         raw_folder_layout.addWidget(self.raw_clear_button)
         
         self.match_raw_button = QPushButton(LanguageManager.translate("JPG - RAW 연결"))
-        self.match_raw_button.setStyleSheet(ThemeManager.generate_main_button_style())
+        ThemeManager.set_theme_role(self.match_raw_button, "dynamicButton")
         
         # raw_folder_path_label 높이의 0.x배로 버튼 높이를 고정합니다.
         match_button_height = int(self.raw_folder_path_label.height() * 0.72)
@@ -4410,7 +6032,7 @@ class PhotoSortApp(QMainWindow):
         self.raw_toggle_button = QCheckBox(LanguageManager.translate("JPG + RAW 이동"))
         self.raw_toggle_button.setChecked(True)  # 기본적으로 활성화 상태로 시작
         self.raw_toggle_button.toggled.connect(self.on_raw_toggle_changed) # 자동 상태 관리로 변경
-        self.raw_toggle_button.setStyleSheet(ThemeManager.generate_checkbox_style())
+        ThemeManager.set_theme_role(self.raw_toggle_button, "toggle")
         
         # 토글 버튼을 레이아웃에 가운데 정렬로 추가
         self.toggle_layout.addStretch()
@@ -4465,28 +6087,12 @@ class PhotoSortApp(QMainWindow):
         settings_button_size = UIScaleManager.get("settings_button_size")
         self.settings_button.setFixedSize(settings_button_size, settings_button_size)
         self.settings_button.setCursor(Qt.PointingHandCursor)
-        settings_font_size_style = settings_button_size - 15 # 폰트 크기는 UIScaleManager에 별도 정의하거나 버튼 크기에 비례하여 조정 가능
-        self.settings_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                border: none;
-                border-radius: 3px;
-                font-size: {settings_font_size_style}px;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {ThemeManager.get_color('accent_hover')};
-            }}
-            QPushButton:pressed {{
-                background-color: {ThemeManager.get_color('accent_pressed')};
-            }}
-        """)
+        self.settings_button.setObjectName("settingsButton") # 스타일은 전역 스타일시트(#settingsButton)에서 적용
         self.settings_button.clicked.connect(self.show_settings_popup)
 
         # 이미지/페이지 카운트 레이블 추가
         self.image_count_label = QLabel("- / -")
-        self.image_count_label.setStyleSheet(f"color: {ThemeManager.get_color('text')};")
+        ThemeManager.set_theme_role(self.image_count_label, "infoLabel")
 
         # 초기 레이아웃 설정 (현재 grid_mode에 맞게)
         self.update_counter_layout()
@@ -4535,9 +6141,8 @@ class PhotoSortApp(QMainWindow):
             # 화면 정보를 가져올 수 없는 경우 기본 크기로 설정
             self.resize(1200, 800)
 
-        # 초기 레이아웃 설정
-        QApplication.processEvents()
-        self.adjust_layout()
+        # 초기 레이아웃 설정 (이벤트 루프 첫 순회에서 실행되도록 큐에 등록)
+        QTimer.singleShot(0, self.adjust_layout)
         
         # 키보드 포커스 설정
         self.setFocusPolicy(Qt.StrongFocus)
@@ -4570,35 +6175,31 @@ class PhotoSortApp(QMainWindow):
         LanguageManager.register_language_change_callback(self.update_mouse_pan_sensitivity_combo_text)
         DateFormatManager.register_format_change_callback(self.update_date_formats)
 
-        # ExifTool 가용성 확인
+        # ExifTool 가용성 확인은 시작 화면을 막지 않도록 EXIF 워커 스레드에서 수행 (_on_exiftool_probed)
         self.exiftool_available = False
         #self.exiftool_path = self.get_bundled_exiftool_path()  # 인스턴스 변수로 저장 
         self.exiftool_path = self.get_exiftool_path()  #수정 추가
-        try:
-            if Path(self.exiftool_path).exists():
-                result = subprocess.run([self.exiftool_path, "-ver"], capture_output=True, text=True, check=False)
-                if result.returncode == 0:
-                    version = result.stdout.strip()
-                    logging.info(f"ExifTool 버전 {version} 사용 가능")
-                    self.exiftool_available = True
-                else:
-                    logging.warning("ExifTool을 찾았지만 실행할 수 없습니다. 제한된 메타데이터 추출만 사용됩니다.")
-            else:
-                logging.warning(f"ExifTool을 찾을 수 없습니다: {self.exiftool_path}")
-        except Exception as e:
-            logging.error(f"ExifTool 확인 중 오류: {e}")
+
+        # 대량 메타데이터 읽기용 ExifTool 상주 프로세스 (Popen은 실행 완료를 기다리지 않으므로 바로 준비하고,
+        # 확인 결과 실행할 수 없으면 _on_exiftool_probed에서 닫음)
+        self.exif_tool_pool = None
+        if Path(self.exiftool_path).exists():
+            self.exif_tool_pool = ExifToolPool(self.exiftool_path)
+            self.exif_tool_pool.start()
 
         # === EXIF 병렬 처리를 위한 스레드 및 워커 설정 ===
         self.exif_thread = QThread(self)
-        self.exif_worker = ExifWorker(self.raw_extensions, self.exiftool_path, self.exiftool_available)
+        self.exif_worker = ExifWorker(self.raw_extensions, self.exiftool_path, False, self.exif_tool_pool)
         self.exif_worker.moveToThread(self.exif_thread)
 
         # 시그널-슬롯 연결
         self.exif_worker.finished.connect(self.on_exif_info_ready)
         self.exif_worker.error.connect(self.on_exif_info_error)
+        self.exif_worker.exiftoolProbed.connect(self._on_exiftool_probed)
 
-        # 스레드 시작
+        # 스레드 시작 후 가장 먼저 ExifTool 확인 요청 (이후 EXIF 요청은 같은 큐에서 확인 뒤에 처리됨)
         self.exif_thread.start()
+        self.exif_worker.request_probe.emit()
 
         # EXIF 캐시
         self.exif_cache = {}  # 파일 경로 -> EXIF 데이터 딕셔너리
@@ -4624,7 +6225,7 @@ class PhotoSortApp(QMainWindow):
         # --- 백그라운드 폴더 로더 설정 ---
         self.folder_loader_thread = QThread()
         self.folder_loader_worker = FolderLoaderWorker(
-            self.raw_extensions, self.get_datetime_from_file_fast
+            self.raw_extensions, self.get_datetime_from_file_fast, self.exif_tool_pool
         )
         self.folder_loader_worker.moveToThread(self.folder_loader_thread)
 
@@ -4761,7 +6362,7 @@ class PhotoSortApp(QMainWindow):
         # Compare 모드 B 캔버스 복원
         if self._is_silent_load and self.compare_mode_active and self.image_B_path:
             def restore_b_canvas():
-                self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+                self.original_pixmap_B = self.load_image_with_orientation(str(self.image_B_path))
                 self._apply_zoom_to_canvas('B')
                 self._sync_viewports()
                 self.update_compare_filenames()
@@ -4773,12 +6374,21 @@ class PhotoSortApp(QMainWindow):
             self.thumbnail_panel.set_current_index(final_index_to_show)
 
         self.update_thumbnail_panel_style()
+
+        # 폴더 전체 EXIF를 배치로 미리 읽어 캐시에 채움 (이미지 이동 시 개별 ExifTool 호출 방지)
+        self._prefetch_folder_exif()
         
         if not self._is_silent_load:
             self.save_state()
 
         self._is_silent_load = False
 
+    def _prefetch_folder_exif(self):
+        """현재 폴더 이미지들의 EXIF를 낮은 우선순위 배치 작업으로 추출합니다 (디스크 캐시 우선)."""
+        paths = [str(p) for p in self.image_files if str(p) not in self.exif_cache]
+        if paths:
+            self.resource_manager.submit_imaging_task_with_priority('low', self.exif_worker.process_batch, paths)
+
     def _reset_workspace_after_load_fail(self):
         """로드 실패 후 UI를 안전한 상태로 초기화합니다."""
         self.image_files = []
@@ -4809,12 +6419,12 @@ class PhotoSortApp(QMainWindow):
 
         if reply == QMessageBox.Yes:
             logging.info("사용자가 프로그램 설정 초기화를 승인했습니다.")
-            
+
             state_file_path = self.get_script_dir() / self.STATE_FILE
             
             try:
-                if state_file_path.exists():
-                    state_file_path.unlink()
+                # 예약되었거나 진행 중인 상태 저장이 삭제 후 파일을 다시 만들지 않도록 저장 스레드를 먼저 정리
+                if self._delete_state_file():
                     logging.info(f"설정 파일 삭제 성공: {state_file_path}")
             except Exception as e:
                 logging.error(f"설정 파일 삭제 실패: {e}")
@@ -4837,14 +6447,13 @@ class PhotoSortApp(QMainWindow):
             # 활성 타이머 중지
             if hasattr(self, 'memory_monitor_timer') and self.memory_monitor_timer.isActive():
                 self.memory_monitor_timer.stop()
-            if hasattr(self, 'raw_result_processor_timer') and self.raw_result_processor_timer.isActive():
-                self.raw_result_processor_timer.stop()
                 
             # 리소스 매니저 종료
             if hasattr(self, 'resource_manager'):
                 self.resource_manager.shutdown()
             
-            # 로그 핸들러 닫기
+            # 로그 핸들러 닫기 (대기 중인 로그를 먼저 파일에 기록)
+            stop_log_listener()
             for handler in logging.root.handlers[:]:
                 handler.close()
                 logging.root.removeHandler(handler)
@@ -4871,7 +6480,8 @@ class PhotoSortApp(QMainWindow):
             return
 
         # 현재 캐시된 파일들의 set과 로딩 중인 파일들의 set을 만듭니다.
-        cached_paths = set(self.image_loader.cache.keys())
+        with self.image_loader.cache_lock:
+            cached_paths = set(self.image_loader.cache.keys())
         # ResourceManager를 통해 현재 활성/대기 중인 작업 경로를 가져오는 기능이 필요할 수 있으나,
         # 여기서는 간단하게 캐시된 경로만 확인합니다.
 
@@ -4881,7 +6491,7 @@ class PhotoSortApp(QMainWindow):
         total_files = len(self.image_files)
         
         # 캐시가 꽉 찼는지 먼저 확인
-        if len(cached_paths) >= self.image_loader.cache_limit:
+        if self.image_loader.cache.total_bytes >= self.image_loader.cache_byte_limit:
             logging.info("유휴 프리로더: 캐시가 이미 가득 차서 실행하지 않습니다.")
             return
 
@@ -4907,28 +6517,16 @@ class PhotoSortApp(QMainWindow):
         logging.info(f"유휴 프리로더: {len(files_to_preload)}개의 이미지를 낮은 우선순위로 로딩 시작합니다.")
         self.is_idle_preloading_active = True
 
-        # ResourceManager를 통해 'low' 우선순위로 작업을 제출합니다.
-        for path in files_to_preload:
-            # 매번 루프를 돌 때마다 중단 플래그와 캐시 상태를 확인합니다.
-            if not self.is_idle_preloading_active:
-                logging.info("유휴 프리로더: 사용자 입력으로 인해 로딩이 중단되었습니다.")
-                break
-            
-            if len(self.image_loader.cache) >= self.image_loader.cache_limit:
-                logging.info("유휴 프리로더: 캐시가 가득 차서 로딩을 중단합니다.")
-                break
-            
-            # 이미 캐시되었거나 다른 작업에서 로딩 중일 수 있으므로 다시 확인
-            if path in self.image_loader.cache:
-                continue
-            
+        # 캐시의 남은 자리만큼만 작업을 만들어 'low' 우선순위로 한 번에 제출합니다.
+        remaining_slots = self.image_loader.cache_limit - len(self.image_loader.cache)
+        if remaining_slots <= 0:
+            logging.info("유휴 프리로더: 캐시가 가득 차서 로딩을 중단합니다.")
+        else:
             # _preload_image_for_grid 함수는 내부적으로 ImageLoader 캐시를 채우므로 재사용합니다.
             # 이 함수는 RAW 파일의 경우 preview만 로드하므로, 유휴 로딩 시에도 시스템 부하가 적습니다.
-            self.resource_manager.submit_imaging_task_with_priority(
-                'low',
-                self._preload_image_for_grid,
-                path
-            )
+            tasks = [(self._preload_image_for_grid, (path,), {})
+                     for path in files_to_preload[:remaining_slots]]
+            self.resource_manager.submit_imaging_tasks_batch('low', tasks)
 
         # 모든 작업 제출이 끝나면 플래그를 리셋합니다.
         # 실제 작업은 백그라운드에서 계속됩니다.
@@ -5036,7 +6634,7 @@ class PhotoSortApp(QMainWindow):
             if self.move_raw_files:
                 base_name = image_to_move_path.stem
                 if base_name in self.raw_files:
-                    raw_path_before_move = self.raw_files[base_name]
+                    raw_path_before_move = Path(self.raw_files[base_name])
                     moved_raw_path = self.move_file(raw_path_before_move, target_folder)
                     if moved_raw_path:
                         del self.raw_files[base_name]
@@ -5168,7 +6766,7 @@ class PhotoSortApp(QMainWindow):
                 index = int(mime_text.split(":")[1])
                 if 0 <= index < len(self.image_files):
                     self.image_B_path = self.image_files[index]
-                    self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+                    self.original_pixmap_B = self.load_image_with_orientation(str(self.image_B_path))
                     if self.original_pixmap_B and not self.original_pixmap_B.isNull():
                         self.image_label_B.setText("") # 안내 문구 제거
                         self._apply_zoom_to_canvas('B') # B 캔버스에 줌/뷰포트 적용
@@ -5252,12 +6850,8 @@ class PhotoSortApp(QMainWindow):
 
         if self.is_raw_only_mode:
             if self.raw_folder and Path(self.raw_folder).is_dir():
-                raw_path = Path(self.raw_folder)
-                scanned_files = []
-                for ext in self.raw_extensions:
-                    scanned_files.extend(raw_path.glob(f'*{ext}'))
-                    scanned_files.extend(raw_path.glob(f'*{ext.upper()}'))
-                new_image_files = sorted(list(set(scanned_files)), key=self.get_datetime_from_file_fast)
+                scanned_files = [Path(entry.path) for entry in iter_photos(self.raw_folder, self.raw_extensions)]
+                new_image_files = sorted(scanned_files, key=self.get_datetime_from_file_fast)
             
             if not new_image_files:
                 logging.warning("새로고침 결과: RAW 폴더에 파일이 더 이상 없습니다. 초기화합니다.")
@@ -5266,11 +6860,7 @@ class PhotoSortApp(QMainWindow):
 
         else: # JPG 모드
             if self.current_folder and Path(self.current_folder).is_dir():
-                jpg_path = Path(self.current_folder)
-                scanned_files = []
-                for file_path in jpg_path.iterdir():
-                    if file_path.is_file() and file_path.suffix.lower() in self.supported_image_extensions:
-                        scanned_files.append(file_path)
+                scanned_files = [Path(entry.path) for entry in iter_photos(self.current_folder, self.supported_image_extensions)]
                 new_image_files = sorted(scanned_files, key=self.get_datetime_from_file_fast)
 
             if not new_image_files:
@@ -5362,7 +6952,6 @@ class PhotoSortApp(QMainWindow):
             # Fit 모드인 경우 기존 캐시 무효화
             if self.zoom_mode == "Fit":
                 self.last_fit_size = (0, 0)
-                self.fit_pixmap_cache.clear()
             
             # 이미지 표시
             self.display_current_image()
@@ -5375,28 +6964,37 @@ class PhotoSortApp(QMainWindow):
         [Worker Thread] QImageReader를 사용하여 썸네일용 QImage를 생성합니다.
         스레드에 안전하며, 메인 스레드에서 QPixmap으로 변환됩니다.
         """
+        cached, cache_path = ThumbnailCache.lookup(file_path, size)
+        if cached is not None:
+            return cached
+        qimage = self._create_thumbnail_image(file_path, size)
+        ThumbnailCache.store(cache_path, qimage)
+        return qimage
+
+    def _create_thumbnail_image(self, file_path, size):
+        """[Worker Thread] 원본 파일을 디코딩하여 썸네일용 QImage를 생성합니다."""
         try:
             is_raw = Path(file_path).suffix.lower() in self.raw_extensions
             if is_raw:
-                preview_pixmap, _, _ = self.image_loader._load_raw_preview_with_orientation(file_path)
+                preview_pixmap, _, _ = self.image_loader._load_raw_preview_with_orientation(file_path, max_size=size)
                 if preview_pixmap and not preview_pixmap.isNull():
                     return preview_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation).toImage()
-                else:
-                    logging.warning(f"썸네일 패널용 프리뷰 없음: {file_path}")
+                # 내장 미리보기가 없으면 half_size 디코딩으로 썸네일 생성
+                logging.warning(f"썸네일 패널용 프리뷰 없음, half_size 디코딩 시도: {file_path}")
+                try:
+                    pil_image = decode_raw_preview(file_path)
+                    pil_image.thumbnail((size, size), Image.Resampling.BICUBIC)
+                    return qimage_from_pil(pil_image)
+                except Exception as e:
+                    logging.error(f"썸네일용 RAW half_size 디코딩 실패 ({Path(file_path).name}): {e}")
                     return QImage()
             reader = QImageReader(str(file_path))
             if not reader.canRead():
                 logging.warning(f"썸네일 생성을 위해 파일을 읽을 수 없음: {file_path}")
                 if Path(file_path).suffix.lower() in ['.heic', '.heif']:
                     try:
-                        from PIL import Image
-                        pil_image = Image.open(file_path)
-                        pil_image.thumbnail((size, size), Image.Resampling.LANCZOS)
-                        if pil_image.mode != 'RGB':
-                            pil_image = pil_image.convert('RGB')
-                        width, height = pil_image.size
-                        rgb_data = pil_image.tobytes('raw', 'RGB')
-                        qimage = QImage(rgb_data, width, height, QImage.Format_RGB888)
+                        pil_image, _ = load_jpeg_preview(file_path, size, size)
+                        qimage = qimage_from_pil(pil_image)
                         logging.info(f"PIL로 HEIC 썸네일 생성 성공: {file_path}")
                         return qimage
                     except Exception as e:
@@ -5411,14 +7009,8 @@ class PhotoSortApp(QMainWindow):
                 logging.error(f"QImageReader로 썸네일 읽기 실패: {file_path}")
                 if Path(file_path).suffix.lower() in ['.heic', '.heif']:
                     try:
-                        from PIL import Image
-                        pil_image = Image.open(file_path)
-                        pil_image.thumbnail((size, size), Image.Resampling.LANCZOS)
-                        if pil_image.mode != 'RGB':
-                            pil_image = pil_image.convert('RGB')
-                        width, height = pil_image.size
-                        rgb_data = pil_image.tobytes('raw', 'RGB')
-                        qimage = QImage(rgb_data, width, height, QImage.Format_RGB888)
+                        pil_image, _ = load_jpeg_preview(file_path, size, size)
+                        qimage = qimage_from_pil(pil_image)
                         logging.info(f"PIL로 HEIC 썸네일 생성 성공 (QImageReader 실패 후): {file_path}")
                         return qimage
                     except Exception as e:
@@ -5733,10 +7325,7 @@ class PhotoSortApp(QMainWindow):
     def _has_supported_image_files(self, folder_path):
         """폴더에 지원하는 이미지 파일이 있는지 확인"""
         try:
-            for file_path in folder_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.supported_image_extensions:
-                    return True
-            return False
+            return next(iter_photos(folder_path, self.supported_image_extensions), None) is not None
         except Exception as e:
             logging.debug(f"이미지 파일 확인 오류: {e}")
             return False
@@ -5744,10 +7333,7 @@ class PhotoSortApp(QMainWindow):
     def _has_raw_files(self, folder_path):
         """폴더에 RAW 파일이 있는지 확인"""
         try:
-            for file_path in folder_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.raw_extensions:
-                    return True
-            return False
+            return next(iter_photos(folder_path, self.raw_extensions), None) is not None
         except Exception as e:
             logging.debug(f"RAW 파일 확인 오류: {e}")
             return False
@@ -5869,13 +7455,7 @@ class PhotoSortApp(QMainWindow):
             return None, None
         
         # [빠른 작업] 파일 목록 스캔
-        target_path = Path(folder_path)
-        temp_raw_file_list = []
-        for ext in self.raw_extensions:
-            temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-            temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}'))
-        
-        unique_raw_files = list(set(temp_raw_file_list))
+        unique_raw_files = [Path(entry.path) for entry in iter_photos(folder_path, self.raw_extensions)]
         if not unique_raw_files:
             self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), LanguageManager.translate("선택한 폴더에 RAW 파일이 없습니다."))
             return None, None
@@ -5938,6 +7518,7 @@ class PhotoSortApp(QMainWindow):
         exiftool_available = Path(exiftool_path).exists() and Path(exiftool_path).is_file()
 
         try:
+            # 호환성 확인은 헤더만 읽으면 되므로 파일 전체를 버퍼로 읽지 않고 경로로 엽니다
             with rawpy.imread(first_raw_file_path_str) as raw:
                 is_raw_compatible = True
                 original_width = raw.sizes.width
@@ -6105,14 +7686,12 @@ class PhotoSortApp(QMainWindow):
             raw_files = []
             image_files = []
             
-            for file_path in folder_path_obj.iterdir():
-                if not file_path.is_file():
-                    continue
-                
+            for entry in iter_photos(folder_path_obj, self.raw_extensions | self.supported_image_extensions):
+                file_path = Path(entry.path)
                 ext = file_path.suffix.lower()
                 if ext in self.raw_extensions:
                     raw_files.append(file_path)
-                elif ext in self.supported_image_extensions:
+                else:
                     image_files.append(file_path)
             
             # 매칭 파일 확인 (이름이 같은 파일)
@@ -6512,7 +8091,7 @@ class PhotoSortApp(QMainWindow):
         session_data = {
             "current_folder": str(self.current_folder) if self.current_folder else "",
             "raw_folder": str(self.raw_folder) if self.raw_folder else "",
-            "raw_files": {k: str(v) for k, v in self.raw_files.items()}, # Path를 str로
+            "raw_files": dict(self.raw_files), # 값이 이미 str이므로 그대로 복사
             "move_raw_files": self.move_raw_files,
             "target_folders": [str(f) if f else "" for f in self.target_folders],
             "folder_count": self.folder_count,  # 분류 폴더 개수 저장 추가
@@ -6526,8 +8105,10 @@ class PhotoSortApp(QMainWindow):
             "zoom_mode": self.zoom_mode,
             "grid_mode": self.grid_mode,
             "previous_grid_mode": self.previous_grid_mode,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
+        now = datetime.now()
+        session_data["timestamp"] = now.strftime("%Y-%m-%d %H:%M:%S")
+        session_data["display_ts"] = now.strftime("%y/%m/%d %H:%M")  # 세션 목록 표시용 (예: 23/05/24 10:30)
         return session_data
 
     def save_current_session(self, session_name: str):
@@ -6575,10 +8156,7 @@ class PhotoSortApp(QMainWindow):
         # 0. 모든 백그라운드 작업 중지 및 캐시 클리어 (새로운 환경 로드 준비)
         self.resource_manager.cancel_all_tasks() # 중요
         if hasattr(self, 'image_loader'): self.image_loader.clear_cache()
-        self.fit_pixmap_cache.clear()
-        if hasattr(self, 'grid_thumbnail_cache'):
-            for key in self.grid_thumbnail_cache:
-                self.grid_thumbnail_cache[key].clear()
+        QPixmapCache.clear()
         self.original_pixmap = None
 
         # 1. 분류 폴더 개수 설정 먼저 복원 (UI 재구성 전에)
@@ -6598,7 +8176,7 @@ class PhotoSortApp(QMainWindow):
         self.current_folder = session_data.get("current_folder", "")
         self.raw_folder = session_data.get("raw_folder", "")
         raw_files_str_dict = session_data.get("raw_files", {})
-        self.raw_files = {k: Path(v) for k, v in raw_files_str_dict.items() if v} # Path 객체로
+        self.raw_files = {k: v for k, v in raw_files_str_dict.items() if v} # str 경로 그대로 사용 (빈 경로는 제외)
         self.move_raw_files = session_data.get("move_raw_files", True)
         
         # target_folders 복원 (folder_count 기반으로 크기 조정)
@@ -6764,10 +8342,11 @@ class PhotoSortApp(QMainWindow):
                  # 여기서는 settings_popup이 아니면 메인 윈도우를 부모로 유지.
                  logging.debug(f"활성 모달 위젯({type(current_active_popup)})이 settings_popup이 아니므로, SessionManagementDialog의 부모를 메인 윈도우로 설정합니다.")
         
-        # SessionManagementDialog가 이미 존재하고 부모가 다른 경우 문제가 될 수 있으므로,
-        # 부모가 바뀔 가능성이 있다면 새로 생성하는 것이 안전할 수 있음.
-        # 여기서는 일단 기존 인스턴스를 재활용하되, 부모가 의도와 다른지 확인.
-        if self.session_management_popup is None or not self.session_management_popup.isVisible():
+        # 닫힌 팝업도 부모와 테마/언어가 같으면 위젯을 다시 만들지 않고 재사용 (목록/버튼 상태만 아래에서 갱신).
+        # 부모가 바뀌었거나 생성 후 테마/언어가 바뀐 경우에만 새로 생성
+        if self.session_management_popup is None or (
+                not self.session_management_popup.isVisible()
+                and self.session_management_popup.built_for != SessionManagementDialog.current_ui_state()):
             # 생성 시 올바른 부모 전달
             self.session_management_popup = SessionManagementDialog(parent_widget, self) 
             logging.debug(f"새 SessionManagementDialog 생성. 부모: {type(parent_widget)}")
@@ -6805,29 +8384,19 @@ class PhotoSortApp(QMainWindow):
 
     def smooth_viewport_move(self):
         """타이머에 의해 호출되어 뷰포트를 부드럽게 이동시킵니다."""
-        if not (self.grid_mode == "Off" and self.zoom_mode in ["100%", "Spin"] and self.original_pixmap and self.pressed_keys_for_viewport):
+        if not (self.grid_mode == "Off" and self.zoom_mode in ["100%", "Spin"] and self.original_pixmap and self.viewport_key_mask):
             self.viewport_move_timer.stop() # 조건 안 맞으면 타이머 중지
             return
 
-        move_step_base = getattr(self, 'viewport_move_speed', 5) 
-        # 실제 이동량은 setInterval에 따라 조금씩 움직이므로, move_step_base는 한 번의 timeout당 이동량의 기준으로 사용
-        # 예를 들어, 속도 5, interval 16ms이면, 초당 약 5 * (1000/16) = 약 300px 이동 효과.
-        # 실제로는 방향키 조합에 따라 대각선 이동 시 속도 보정 필요할 수 있음.
-        # 여기서는 단순하게 각 방향 이동량을 move_step_base로 사용.
-        # 더 부드럽게 하려면 move_step_base 값을 작게, interval도 작게 조절.
-        # 여기서는 단계별 이동량이므로, *10은 제거하고, viewport_move_speed 값을 직접 사용하거나 약간의 배율만 적용.
-        move_amount = move_step_base * 12 # 한 번의 timeout당 이동 픽셀 (조절 가능)
-
-        dx, dy = 0, 0
+        # 한 번의 timeout당 이동 픽셀은 viewport_move_speed * 12 (속도 변경 시 viewport_move_amount로 미리 계산)
+        # 예를 들어, 속도 5, interval 16ms이면, 초당 약 60 * (1000/16) = 약 3750px 이동 효과.
+        move_amount = self.viewport_move_amount
 
-        # 8방향 이동 로직 (눌린 키 조합 확인)
-        if Qt.Key_Left in self.pressed_keys_for_viewport: dx += move_amount
-        if Qt.Key_Right in self.pressed_keys_for_viewport: dx -= move_amount
-        if Qt.Key_Up in self.pressed_keys_for_viewport: dy += move_amount
-        if Qt.Key_Down in self.pressed_keys_for_viewport: dy -= move_amount
-        
-        # Shift+WASD 에 대한 처리도 여기에 추가
-        # (eventFilter에서 pressed_keys_for_viewport에 WASD도 Arrow Key처럼 매핑해서 넣어줌)
+        # 8방향 이동 로직: 눌린 방향 비트 조합으로 방향 테이블을 바로 조회
+        # (eventFilter에서 Shift+WASD도 방향키와 같은 비트로 기록함)
+        ux, uy = self.VIEWPORT_MASK_DIRECTIONS[self.viewport_key_mask]
+        dx = move_amount * ux
+        dy = move_amount * uy
 
         if dx == 0 and dy == 0: # 이동할 방향이 없으면
             self.viewport_move_timer.stop()
@@ -7004,44 +8573,40 @@ class PhotoSortApp(QMainWindow):
         """메모리 사용량이 위험 수준일 때 수행할 긴급 정리 작업"""
         # 1. 이미지 캐시 대폭 축소
         if hasattr(self.image_loader, 'cache'):
-            cache_size = len(self.image_loader.cache)
-            items_to_keep = min(10, cache_size)  # 최대 10개만 유지
-            
             # 현재 표시 중인 이미지는 유지
             current_path = None
             if self.current_image_index >= 0 and self.current_image_index < len(self.image_files):
                 current_path = str(self.image_files[self.current_image_index])
-            
-            # 불필요한 캐시 항목 제거
-            keys_to_remove = []
-            keep_count = 0
-            
-            for key in list(self.image_loader.cache.keys()):
-                # 현재 표시 중인 이미지는 유지
-                if key == current_path:
-                    continue
-                    
-                keys_to_remove.append(key)
-                keep_count += 1
-                
-                if keep_count >= cache_size - items_to_keep:
-                    break
-            
-            # 실제 항목 제거
-            for key in keys_to_remove:
-                del self.image_loader.cache[key]
+
+            with self.image_loader.cache_lock:
+                cache_size = len(self.image_loader.cache)
+                items_to_keep = min(10, cache_size)  # 최대 10개만 유지
+
+                # 불필요한 캐시 항목 제거
+                keys_to_remove = []
+                keep_count = 0
+
+                for key in list(self.image_loader.cache.keys()):
+                    # 현재 표시 중인 이미지는 유지
+                    if key == current_path:
+                        continue
+
+                    keys_to_remove.append(key)
+                    keep_count += 1
+
+                    if keep_count >= cache_size - items_to_keep:
+                        break
+
+                # 실제 항목 제거
+                for key in keys_to_remove:
+                    self.image_loader.cache.pop(key, None)
             
             logging.info(f"메모리 확보: 이미지 캐시에서 {len(keys_to_remove)}개 항목 제거")
         
-        # 2. Fit 모드 캐시 초기화
-        self.fit_pixmap_cache.clear()
+        # 2. Fit 이미지/미리보기 축소본 캐시(QPixmapCache) 비우기
+        QPixmapCache.clear()
         self.last_fit_size = (0, 0)
         
-        # 3. 그리드 썸네일 캐시 정리
-        if hasattr(self, 'grid_thumbnail_cache'):
-            for key in self.grid_thumbnail_cache:
-                self.grid_thumbnail_cache[key].clear()
-        
         # 4. 백그라운드 작업 일부 취소
         for future in self.active_thumbnail_futures:
             future.cancel()
@@ -7055,16 +8620,19 @@ class PhotoSortApp(QMainWindow):
         """메모리 사용량이 경고 수준일 때 캐시 크기 축소"""
         # 이미지 캐시 일부 축소
         if hasattr(self.image_loader, 'cache'):
-            cache_size = len(self.image_loader.cache)
-            if cache_size > 20:  # 최소 크기 이상일 때만 축소
-                items_to_remove = max(5, int(cache_size * 0.15))  # 약 15% 축소
-                
-                # 최근 사용된 항목 제외하고 제거
-                keys_to_remove = list(self.image_loader.cache.keys())[:items_to_remove]
-                
-                for key in keys_to_remove:
-                    del self.image_loader.cache[key]
-                
+            with self.image_loader.cache_lock:
+                cache_size = len(self.image_loader.cache)
+                keys_to_remove = []
+                if cache_size > 20:  # 최소 크기 이상일 때만 축소
+                    items_to_remove = max(5, int(cache_size * 0.15))  # 약 15% 축소
+
+                    # 최근 사용된 항목 제외하고 제거
+                    keys_to_remove = list(self.image_loader.cache.keys())[:items_to_remove]
+
+                    for key in keys_to_remove:
+                        self.image_loader.cache.pop(key, None)
+
+            if keys_to_remove:
                 logging.info(f"메모리 관리: 이미지 캐시에서 {len(keys_to_remove)}개 항목 제거")
 
 
@@ -7164,14 +8732,11 @@ class PhotoSortApp(QMainWindow):
             logging.info("PhotoSortApp: 첫 실행 설정이 완료되지 않아 앱을 종료합니다.")
             
             # 🎯 추가 검증: photosort_data.json 파일이 생성되지 않았는지 확인
-            state_file_path = self.get_script_dir() / self.STATE_FILE
-            if state_file_path.exists():
-                logging.warning("PhotoSortApp: 첫 실행 설정 취소했으나 상태 파일이 존재함. 삭제합니다.")
-                try:
-                    state_file_path.unlink()
-                    logging.info("PhotoSortApp: 상태 파일 삭제 완료.")
-                except Exception as e:
-                    logging.error(f"PhotoSortApp: 상태 파일 삭제 실패: {e}")
+            try:
+                if self._delete_state_file():
+                    logging.warning("PhotoSortApp: 첫 실행 설정 취소했으나 상태 파일이 존재하여 삭제했습니다.")
+            except Exception as e:
+                logging.error(f"PhotoSortApp: 상태 파일 삭제 실패: {e}")
             
             QApplication.quit()
             return
@@ -7410,29 +8975,16 @@ class PhotoSortApp(QMainWindow):
             logging.info("마우스 휠 동작: 없음으로 변경됨")
 
     def _create_settings_controls(self):
-        """설정 창에 사용될 모든 UI 컨트롤들을 미리 생성하고 초기화합니다."""
-        # --- 공통 스타일 ---
-        radio_style = f"""
-            QRadioButton {{ color: {ThemeManager.get_color('text')}; padding: 5px 10px; }}
-            QRadioButton::indicator {{ width: {UIScaleManager.get("radiobutton_size")}px; height: {UIScaleManager.get("radiobutton_size")}px; }}
-            QRadioButton::indicator:checked {{ background-color: {ThemeManager.get_color('accent')}; border: {UIScaleManager.get("radiobutton_border")}px solid {ThemeManager.get_color('accent')}; border-radius: {UIScaleManager.get("radiobutton_border_radius")}px; }}
-            QRadioButton::indicator:unchecked {{ background-color: {ThemeManager.get_color('bg_primary')}; border: {UIScaleManager.get("radiobutton_border")}px solid {ThemeManager.get_color('border')}; border-radius: {UIScaleManager.get("radiobutton_border_radius")}px; }}
-            QRadioButton::indicator:unchecked:hover {{ border: {UIScaleManager.get("radiobutton_border")}px solid {ThemeManager.get_color('text_disabled')}; }}
-        """
-        checkbox_style = f"""
-            QCheckBox {{ color: {ThemeManager.get_color('text')}; padding: 3px 5px; }}
-            QCheckBox::indicator {{ width: {UIScaleManager.get("checkbox_size")}px; height: {UIScaleManager.get("checkbox_size")}px; }}
-            QCheckBox::indicator:checked {{ background-color: {ThemeManager.get_color('accent')}; border: {UIScaleManager.get("checkbox_border")}px solid {ThemeManager.get_color('accent')}; border-radius: {UIScaleManager.get("checkbox_border_radius")}px; }}
-            QCheckBox::indicator:unchecked {{ background-color: {ThemeManager.get_color('bg_primary')}; border: {UIScaleManager.get("checkbox_border")}px solid {ThemeManager.get_color('border')}; border-radius: {UIScaleManager.get("checkbox_border_radius")}px; }}
-            QCheckBox::indicator:unchecked:hover {{ border: {UIScaleManager.get("checkbox_border")}px solid {ThemeManager.get_color('text_disabled')}; }}
-        """
+        """설정 창에 사용될 모든 UI 컨트롤들을 미리 생성하고 초기화합니다.
+        스타일은 위젯별 setStyleSheet 대신 themeRole로 지정하여 전역 스타일시트에서 받습니다
+        (settingsRadio, settingsToggle, settingsAction, combo)."""
 
         # --- 언어 설정 ---
         self.language_group = QButtonGroup(self)
         self.english_radio = QRadioButton("English")
         self.korean_radio = QRadioButton("한국어")
-        self.english_radio.setStyleSheet(radio_style)
-        self.korean_radio.setStyleSheet(radio_style)
+        ThemeManager.set_theme_role(self.english_radio, "settingsRadio")
+        ThemeManager.set_theme_role(self.korean_radio, "settingsRadio")
         self.language_group.addButton(self.english_radio, 0)
         self.language_group.addButton(self.korean_radio, 1)
         self.language_group.buttonClicked.connect(self.on_language_radio_changed)
@@ -7446,15 +8998,15 @@ class PhotoSortApp(QMainWindow):
                 display_text = theme_name.upper()
             self.theme_combo.addItem(display_text, userData=theme_name)
             
-        self.theme_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.theme_combo, "combo")
         self.theme_combo.currentIndexChanged.connect(self.on_theme_changed)
 
         # --- 컨트롤 패널 위치 설정 ---
         self.panel_position_group = QButtonGroup(self)
         self.panel_pos_left_radio = QRadioButton() # 텍스트 제거
         self.panel_pos_right_radio = QRadioButton() # 텍스트 제거
-        self.panel_pos_left_radio.setStyleSheet(radio_style)
-        self.panel_pos_right_radio.setStyleSheet(radio_style)
+        ThemeManager.set_theme_role(self.panel_pos_left_radio, "settingsRadio")
+        ThemeManager.set_theme_role(self.panel_pos_right_radio, "settingsRadio")
         self.panel_position_group.addButton(self.panel_pos_left_radio, 0)
         self.panel_position_group.addButton(self.panel_pos_right_radio, 1)
         self.panel_position_group.buttonClicked.connect(self._on_panel_position_changed)
@@ -7464,7 +9016,7 @@ class PhotoSortApp(QMainWindow):
         for format_code in DateFormatManager.get_available_formats():
             display_name = DateFormatManager.get_format_display_name(format_code)
             self.date_format_combo.addItem(display_name, format_code)
-        self.date_format_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.date_format_combo, "combo")
         self.date_format_combo.currentIndexChanged.connect(self.on_date_format_changed)
 
         # --- 불러올 이미지 형식 설정 ---
@@ -7472,7 +9024,7 @@ class PhotoSortApp(QMainWindow):
         extension_groups = {"JPG": ['.jpg', '.jpeg'], "PNG": ['.png'], "WebP": ['.webp'], "HEIC": ['.heic', '.heif'], "BMP": ['.bmp'], "TIFF": ['.tif', '.tiff']}
         for name, exts in extension_groups.items():
             checkbox = QCheckBox(name)
-            checkbox.setStyleSheet(checkbox_style)
+            ThemeManager.set_theme_role(checkbox, "settingsToggle")
             checkbox.stateChanged.connect(self.on_extension_checkbox_changed)
             self.ext_checkboxes[name] = checkbox
     
@@ -7480,7 +9032,7 @@ class PhotoSortApp(QMainWindow):
         self.folder_count_combo = QComboBox()
         for i in range(1, 10):
             self.folder_count_combo.addItem(str(i), i)
-        self.folder_count_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.folder_count_combo, "combo")
         self.folder_count_combo.setMinimumWidth(80)
         self.folder_count_combo.currentIndexChanged.connect(self.on_folder_count_changed)
 
@@ -7488,7 +9040,7 @@ class PhotoSortApp(QMainWindow):
         self.viewport_speed_combo = QComboBox()
         for i in range(1, 11):
             self.viewport_speed_combo.addItem(str(i), i)
-        self.viewport_speed_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.viewport_speed_combo, "combo")
         self.viewport_speed_combo.setMinimumWidth(80)
         self.viewport_speed_combo.currentIndexChanged.connect(self.on_viewport_speed_changed)
 
@@ -7496,8 +9048,8 @@ class PhotoSortApp(QMainWindow):
         self.mouse_wheel_group = QButtonGroup(self)
         self.mouse_wheel_photo_radio = QRadioButton() # 텍스트 제거
         self.mouse_wheel_none_radio = QRadioButton() # 텍스트 제거
-        self.mouse_wheel_photo_radio.setStyleSheet(radio_style)
-        self.mouse_wheel_none_radio.setStyleSheet(radio_style)
+        ThemeManager.set_theme_role(self.mouse_wheel_photo_radio, "settingsRadio")
+        ThemeManager.set_theme_role(self.mouse_wheel_none_radio, "settingsRadio")
         self.mouse_wheel_group.addButton(self.mouse_wheel_photo_radio, 0)
         self.mouse_wheel_group.addButton(self.mouse_wheel_none_radio, 1)
         self.mouse_wheel_group.buttonClicked.connect(self.on_mouse_wheel_action_changed)
@@ -7505,47 +9057,39 @@ class PhotoSortApp(QMainWindow):
         # --- 마우스 휠 민감도 설정 ---
         self.mouse_wheel_sensitivity_combo = QComboBox()
         self.update_mouse_wheel_sensitivity_combo_text() # 텍스트 채우는 함수 호출
-        self.mouse_wheel_sensitivity_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.mouse_wheel_sensitivity_combo, "combo")
         self.mouse_wheel_sensitivity_combo.currentIndexChanged.connect(self.on_mouse_wheel_sensitivity_changed)
 
         # --- 마우스 패닝 감도 설정 ---
         self.mouse_pan_sensitivity_combo = QComboBox()
         self.update_mouse_pan_sensitivity_combo_text() # 텍스트 채우는 함수 호출
-        self.mouse_pan_sensitivity_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.mouse_pan_sensitivity_combo, "combo")
         self.mouse_pan_sensitivity_combo.currentIndexChanged.connect(self.on_mouse_pan_sensitivity_changed)
 
         # --- 저장된 RAW 처리 방식 초기화 버튼 ---
-        button_style = f"""
-            QPushButton {{
-                background-color: {ThemeManager.get_color('bg_secondary')}; color: {ThemeManager.get_color('text')};
-                border: none; padding: 8px 12px; border-radius: 4px;
-            }}
-            QPushButton:hover {{ background-color: {ThemeManager.get_color('bg_hover')}; }}
-            QPushButton:pressed {{ background-color: {ThemeManager.get_color('bg_pressed')}; }}
-        """
         self.reset_camera_settings_button = QPushButton() # 텍스트 제거
-        self.reset_camera_settings_button.setStyleSheet(button_style)
+        ThemeManager.set_theme_role(self.reset_camera_settings_button, "settingsAction")
         self.reset_camera_settings_button.clicked.connect(self.reset_all_camera_raw_settings)
 
         # --- 프로그램 초기화 버튼 ---
         self.reset_app_settings_button = QPushButton(LanguageManager.translate("프로그램 설정 초기화"))
-        self.reset_app_settings_button.setStyleSheet(button_style)
+        ThemeManager.set_theme_role(self.reset_app_settings_button, "settingsAction")
         self.reset_app_settings_button.clicked.connect(self.reset_application_settings)
 
         # --- 세션 관리 및 단축키 버튼 생성 ---
         self.session_management_button = QPushButton() # 텍스트 제거
-        self.session_management_button.setStyleSheet(button_style)
+        ThemeManager.set_theme_role(self.session_management_button, "settingsAction")
         self.session_management_button.clicked.connect(self.show_session_management_popup)
 
         self.shortcuts_button = QPushButton() # 텍스트 제거
-        self.shortcuts_button.setStyleSheet(button_style)
+        ThemeManager.set_theme_role(self.shortcuts_button, "settingsAction")
         self.shortcuts_button.clicked.connect(self.show_shortcuts_popup)
 
         # --- 성능 프로필 설정 ---
         self.performance_profile_combo = QComboBox()
         # 아이템 추가 로직을 전용 업데이트 함수로 이전
         self.update_performance_profile_combo_text()
-        self.performance_profile_combo.setStyleSheet(self.generate_combobox_style())
+        ThemeManager.set_theme_role(self.performance_profile_combo, "combo")
         self.performance_profile_combo.currentIndexChanged.connect(self.on_performance_profile_changed)
 
     def update_mouse_pan_sensitivity_combo_text(self):
@@ -8004,6 +9548,7 @@ class PhotoSortApp(QMainWindow):
         selected_speed = self.viewport_speed_combo.itemData(index)
         if selected_speed is not None:
             self.viewport_move_speed = int(selected_speed)
+            self.viewport_move_amount = self.viewport_move_speed * 12
             logging.info(f"뷰포트 이동 속도 변경됨: {self.viewport_move_speed}")
             # self.save_state() # 즉시 저장하려면 호출 (set_camera_raw_setting처럼)
 
@@ -8076,80 +9621,25 @@ class PhotoSortApp(QMainWindow):
         """테마 변경 시 모든 UI 요소의 색상을 업데이트"""
         # 모든 UI 요소의 스타일시트를 다시 설정
         self.update_button_styles() # 여기서 수정된 함수가 호출됨
-        self.update_label_styles()
         self.update_folder_styles()
         self.update_scrollbar_style()
         self.update_thumbnail_panel_style()
-        
-        # 설정 버튼 스타일 업데이트
-        self.settings_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                border: none;
-                border-radius: 3px;
-                font-size: 20px;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {ThemeManager.get_color('accent_hover')};
-            }}
-            QPushButton:pressed {{
-                background-color: {ThemeManager.get_color('accent_pressed')};
-            }}
-        """)
+        # 설정 버튼/토글/라디오, 카운트 라벨 등 역할 기반 위젯은 ThemeManager.set_theme()의 전역 스타일시트로 갱신됨
         
         # 메시지 표시
         print(f"테마가 변경되었습니다: {ThemeManager.get_current_theme_name()}")
 
     def update_button_styles(self):
-        """버튼 스타일을 현재 테마에 맞게 업데이트"""
-        # 기본 버튼 스타일
-        button_style = ThemeManager.generate_main_button_style()
-        # 동적 높이 버튼을 위한 새 스타일
-        dynamic_button_style = ThemeManager.generate_dynamic_height_button_style()
-        # 삭제 버튼 스타일
-        delete_button_style = ThemeManager.generate_action_button_style()
-        # 라디오 버튼 스타일
-        radio_style = ThemeManager.generate_radio_button_style()
-
+        """버튼 크기를 현재 레이블 높이에 맞게 갱신 (색상은 전역 스타일시트에서 적용)"""
         if hasattr(self, 'load_button') and hasattr(self, 'folder_path_label'):
-            # 1. 수직 패딩이 없는 스타일 적용
-            self.load_button.setStyleSheet(dynamic_button_style)
-            # 2. 전체 높이를 강제 설정 (이제 패딩과 충돌하지 않음)
+            # 수직 패딩이 없는 dynamicButton 스타일이므로 전체 높이를 강제 설정
             button_height = int(self.folder_path_label.height() * 0.72) # 레이블 높이의 0.x배로 버튼 높이를 고정
             self.load_button.setFixedHeight(button_height)
 
         if hasattr(self, 'match_raw_button') and hasattr(self, 'raw_folder_path_label'):
-            # 1. 수직 패딩이 없는 스타일 적용
-            self.match_raw_button.setStyleSheet(dynamic_button_style)
-            # 2. 전체 높이를 강제 설정
             button_height = int(self.raw_folder_path_label.height() * 0.72) # 레이블 높이의 0.x배로 버튼 높이를 고정
             self.match_raw_button.setFixedHeight(button_height)
-            
-        # 삭제 버튼 스타일 적용
-        if hasattr(self, 'jpg_clear_button'):
-            self.jpg_clear_button.setStyleSheet(delete_button_style)
-        if hasattr(self, 'raw_clear_button'):
-            self.raw_clear_button.setStyleSheet(delete_button_style)
-            
-        # 폴더 버튼과 삭제 버튼 스타일 적용 (이 버튼들은 고정 높이가 아니므로 기존 스타일 사용)
-        if hasattr(self, 'folder_buttons'):
-            for button in self.folder_buttons:
-                button.setStyleSheet(button_style)
-        if hasattr(self, 'folder_action_buttons'):
-            for button in self.folder_action_buttons:
-                button.setStyleSheet(delete_button_style)
-                
-        # 줌 라디오 버튼 스타일 적용
-        if hasattr(self, 'zoom_group'):
-            for button in self.zoom_group.buttons():
-                button.setStyleSheet(radio_style)
-                
-        if hasattr(self, 'grid_mode_group'):
-            for button in self.grid_mode_group.buttons():
-                button.setStyleSheet(radio_style)
-                
+
     def resource_path(self, relative_path: str) -> str:
         """개발 환경과 PyInstaller 번들 환경 모두에서 리소스 경로 반환"""
         try:
@@ -8158,29 +9648,6 @@ class PhotoSortApp(QMainWindow):
             base = Path(__file__).parent
         return str(base / relative_path)
 
-    def update_label_styles(self):
-        """라벨 스타일을 현재 테마에 맞게 업데이트"""
-        # 기본 라벨 스타일
-        label_style = f"color: {ThemeManager.get_color('text')};"
-        
-        # 카운트 라벨 스타일 적용
-        if hasattr(self, 'image_count_label'):
-            self.image_count_label.setStyleSheet(label_style)
-            
-        # 파일 정보 라벨들 스타일 적용
-        if hasattr(self, 'file_info_labels'):
-            for label in self.file_info_labels:
-                label.setStyleSheet(label_style)
-
-        # 미니맵 토글 및 RAW 토글 체크박스 스타일 업데이트
-        if hasattr(self, 'minimap_toggle'):
-            self.minimap_toggle.setStyleSheet(ThemeManager.generate_checkbox_style())
-        if hasattr(self, 'raw_toggle_button'):
-            self.raw_toggle_button.setStyleSheet(ThemeManager.generate_checkbox_style())
-        if hasattr(self, 'filename_toggle_grid'):
-            self.filename_toggle_grid.setStyleSheet(ThemeManager.generate_checkbox_style())
-        
-    
     def update_folder_styles(self):
         """폴더 관련 UI 요소의 스타일을 업데이트 (테마 변경 시 호출됨)"""
         # 1. JPG/RAW 폴더 UI 상태 업데이트 (내부적으로 InfoFolderPathLabel의 스타일 재설정)
@@ -8193,20 +9660,20 @@ class PhotoSortApp(QMainWindow):
         if hasattr(self, 'folder_path_labels'):
             self.update_all_folder_labels_state()
     
-    def _create_settings_popup(self):
-        """설정 팝업창을 최초 한 번만 생성하고 레이아웃을 구성합니다."""
-        self.settings_popup = QDialog(self)
-        self.settings_popup.setWindowTitle(LanguageManager.translate("설정 및 정보"))
+    def _build_settings_popup(self):
+        """설정 팝업창을 생성하고 레이아웃을 구성하여 반환합니다. (_lazy를 통해 최초 한 번만 호출)"""
+        popup = QDialog(self)
+        popup.setWindowTitle(LanguageManager.translate("설정 및 정보"))
         popup_width = UIScaleManager.get("settings_popup_width", 785)
         popup_height = UIScaleManager.get("settings_popup_height", 910)
-        self.settings_popup.setMinimumSize(popup_width, popup_height)
+        popup.setMinimumSize(popup_width, popup_height)
         palette = QPalette()
         palette.setColor(QPalette.Window, QColor(ThemeManager.get_color('bg_primary')))
-        self.settings_popup.setPalette(palette)
-        self.settings_popup.setAutoFillBackground(True)
+        popup.setPalette(palette)
+        popup.setAutoFillBackground(True)
 
         # --- 메인 레이아웃 (수평 2컬럼) ---
-        main_layout = QHBoxLayout(self.settings_popup)
+        main_layout = QHBoxLayout(popup)
         main_layout.setContentsMargins(25, 20, 25, 20)
         main_layout.setSpacing(30)
 
@@ -8250,11 +9717,19 @@ class PhotoSortApp(QMainWindow):
         main_layout.addWidget(left_column, 6)
         main_layout.addWidget(separator_vertical)
         main_layout.addWidget(right_column, 4)
+        return popup
+
+    def _lazy(self, attr, factory):
+        """attr에 저장된 위젯을 반환하고, 아직 없으면(None) factory로 생성하여 저장합니다."""
+        widget = getattr(self, attr, None)
+        if widget is None:
+            widget = factory()
+            setattr(self, attr, widget)
+        return widget
 
     def show_settings_popup(self):
         """설정 버튼 클릭 시 호출, 팝업을 생성하거나 기존 팝업을 보여줍니다."""
-        if not hasattr(self, 'settings_popup') or self.settings_popup is None:
-            self._create_settings_popup()
+        settings_popup = self._lazy('settings_popup', self._build_settings_popup)
 
         # 팝업을 보여주기 전에 현재 상태를 UI 컨트롤에 반영
         current_theme_name = ThemeManager.get_current_theme_name()
@@ -8277,10 +9752,10 @@ class PhotoSortApp(QMainWindow):
             self.korean_radio.setChecked(True)
 
         # 팝업의 모든 텍스트를 현재 언어에 맞게 업데이트
-        self.update_settings_labels_texts(self.settings_popup)
+        self.update_settings_labels_texts(settings_popup)
 
-        apply_dark_title_bar(self.settings_popup)
-        self.settings_popup.exec()
+        apply_dark_title_bar(settings_popup)
+        settings_popup.exec()
 
 
     def _build_info_section(self):
@@ -8634,35 +10109,6 @@ class PhotoSortApp(QMainWindow):
         # 팝업 표시
         licenses_popup.exec()
 
-    def generate_combobox_style(self):
-        """현재 테마에 맞는 콤보박스 스타일 생성"""
-        return f"""
-            QComboBox {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                border: none;
-                padding: {UIScaleManager.get("combobox_padding")}px;
-                border-radius: 1px;
-            }}
-            QComboBox:hover {{
-                background-color: #555555;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                color: {ThemeManager.get_color('text')};
-                selection-background-color: #505050;
-                selection-color: {ThemeManager.get_color('text')};
-                border: 1px solid {ThemeManager.get_color('border')};
-                padding: 0px; /* 메뉴 자체의 내부 여백 */
-            }}
-            /* [핵심 수정] 드롭다운 메뉴의 각 항목(item)에 대한 스타일 */
-            QComboBox QAbstractItemView::item {{
-                /* padding-top과 padding-bottom으로 상하 간격을 조절합니다. */
-                padding: 6px 10px; /* 8px 상하, 10px 좌우 여백 */
-                min-height: 25px; /* 최소 높이를 지정하여 너무 좁아지지 않게 함 (선택 사항) */
-            }}
-        """
-
     def setup_dark_theme(self):
         """다크 테마 설정"""
         app = QApplication.instance()
@@ -8692,20 +10138,8 @@ class PhotoSortApp(QMainWindow):
         # 팔레트 적용
         app.setPalette(dark_palette)
         
-        # 스타일시트 추가 설정
-        app.setStyleSheet(f"""
-            QToolTip {{
-                color: {ThemeManager.get_color('text')};
-                background-color: {ThemeManager.get_color('bg_secondary')};
-                border: 1px solid {ThemeManager.get_color('border')};
-            }}
-            QSplitter::handle {{
-                background-color: {ThemeManager.get_color('bg_primary')};
-            }}
-            QSplitter::handle:horizontal {{
-                width: 1px;
-            }}
-        """)
+        # 스타일시트 추가 설정 (툴팁/스플리터 및 역할 기반 위젯 스타일 포함)
+        ThemeManager.apply_global_stylesheet()
     
     def adjust_layout(self):
         """
@@ -8856,7 +10290,7 @@ class PhotoSortApp(QMainWindow):
                 # 캐시된 값이 문자열이면 datetime 객체로 변환
                 if isinstance(cached_value, str):
                     try:
-                        return datetime.strptime(cached_value, '%Y:%m:%d %H:%M:%S')
+                        return parse_exif_datetime(cached_value)
                     except:
                         pass
                 elif isinstance(cached_value, datetime):
@@ -8866,6 +10300,7 @@ class PhotoSortApp(QMainWindow):
         if file_path.suffix.lower() in self.raw_extensions:
             try:
                 import rawpy
+                # 메타데이터만 확인하므로 파일 전체를 버퍼로 읽지 않고 경로로 엽니다
                 with rawpy.imread(str(file_path)) as raw:
                     # rawpy는 exiftool보다 훨씬 빠름
                     if hasattr(raw, 'metadata') and 'DateTimeOriginal' in raw.metadata:
@@ -8877,10 +10312,10 @@ class PhotoSortApp(QMainWindow):
         # 3. JPG/HEIC의 경우 piexif 사용 (이미 구현됨)
         try:
             import piexif
-            exif_data = piexif.load(str(file_path))
+            exif_data = load_exif_fast(file_path)
             if piexif.ExifIFD.DateTimeOriginal in exif_data['Exif']:
                 datetime_str = exif_data['Exif'][piexif.ExifIFD.DateTimeOriginal].decode()
-                return datetime.strptime(datetime_str, '%Y:%m:%d %H:%M:%S')
+                return parse_exif_datetime(datetime_str)
         except:
             pass
         
@@ -8952,20 +10387,21 @@ class PhotoSortApp(QMainWindow):
         """그리드 뷰를 강제로 리프레시"""
         if self.grid_mode != "Off":
             # 이미지 로더의 활성 작업 취소
-            for future in self.image_loader.active_futures:
-                future.cancel()
-            self.image_loader.active_futures.clear()
+            self.image_loader.cancel_loading()
             
-            # 페이지 다시 로드 요청
+            # 페이지 다시 로드 요청 (셀 크기만큼만 필요하므로 RAW는 절반 해상도 디코딩 허용)
             cells_per_page = 4 if self.grid_mode == "2x2" else 9
-            self.image_loader.preload_page(self.image_files, self.grid_page_start_index, cells_per_page)
+            cell_long_edge = max((max(cell.width(), cell.height()) for cell in self.grid_labels), default=0)
+            target_long_edge = round(cell_long_edge * self.devicePixelRatioF()) or None
+            self.image_loader.preload_page(self.image_files, self.grid_page_start_index, cells_per_page,
+                                           target_long_edge=target_long_edge)
             
             # 그리드 UI 업데이트
             self.update_grid_view()    
 
     def load_image_with_orientation(self, file_path):
-        """EXIF 방향 정보를 고려하여 이미지를 올바른 방향으로 로드 (캐시 활용)"""
-        return self.image_loader.load_image_with_orientation(file_path)
+        """[Main Thread] EXIF 방향 정보를 고려하여 이미지를 올바른 방향으로 로드해 QPixmap으로 반환 (캐시 활용)"""
+        return QPixmap.fromImage(self.image_loader.load_image_with_orientation(file_path))
 
     def _apply_zoom_to_canvas(self, canvas_id):
         """지정된 캔버스(A 또는 B)에 현재 줌 모드와 뷰포트를 적용합니다."""
@@ -9119,11 +10555,14 @@ class PhotoSortApp(QMainWindow):
             if panel_width <= 0 or panel_height <= 0:
                 return pixmap
                 
-            # 크기가 같다면 캐시 확인 (캐시 키는 이제 튜플 (너비, 높이) 사용)
+            # 같은 원본/같은 패널 크기의 결과가 있으면 재사용
             current_size = (panel_width, panel_height)
+            fit_key = f"fit|{pixmap.cacheKey()}|{panel_width}x{panel_height}"
             # Fit 캐시는 A 패널 전용으로 유지하는 것이 간단합니다. B는 A의 결과를 따르기 때문입니다.
-            if target_widget is self.scroll_area and self.last_fit_size == current_size and current_size in self.fit_pixmap_cache:
-                return self.fit_pixmap_cache[current_size]
+            if target_widget is self.scroll_area:
+                cached_pixmap = QPixmapCache.find(fit_key)
+                if cached_pixmap is not None:
+                    return cached_pixmap
                 
             # 이미지 크기
             img_width = pixmap.width()
@@ -9194,7 +10633,7 @@ class PhotoSortApp(QMainWindow):
                     )
                 # 캐시 업데이트 (A 패널에 대해서만)
                 if target_widget is self.scroll_area:
-                    self.fit_pixmap_cache[current_size] = result_pixmap
+                    QPixmapCache.insert(fit_key, result_pixmap)
                     self.last_fit_size = current_size
                 return result_pixmap
                 
@@ -9291,7 +10730,8 @@ class PhotoSortApp(QMainWindow):
                     return
                 
                 drag_image_path = self.image_files[drag_image_index]
-                drag_pixmap_source = self.image_loader.cache.get(str(drag_image_path))
+                drag_image_source = self.image_loader.cache.get(str(drag_image_path))
+                drag_pixmap_source = QPixmap.fromImage(drag_image_source) if drag_image_source is not None else None
 
                 # 다중 선택 여부 확인
                 if (hasattr(self, 'selected_grid_indices') and self.selected_grid_indices and 
@@ -9535,16 +10975,8 @@ class PhotoSortApp(QMainWindow):
         )
 
         if folder_path:
-            target_path = Path(folder_path)
-            temp_raw_file_list = []
-
-            # RAW 파일 검색
-            for ext in self.raw_extensions:
-                temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-                temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}')) # 대문자 확장자도 고려
-
-            # 중복 제거 및 정렬
-            unique_raw_files = sorted(list(set(temp_raw_file_list)))
+            # RAW 파일 검색 (대소문자 구분 없이 한 번만 스캔) 및 정렬
+            unique_raw_files = sorted(Path(entry.path) for entry in iter_photos(folder_path, self.raw_extensions))
 
             if not unique_raw_files:
                 self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), LanguageManager.translate("선택한 폴더에 RAW 파일이 없습니다."))
@@ -9585,6 +11017,7 @@ class PhotoSortApp(QMainWindow):
             # 1.1. {RAW 호환 여부} 및 {원본 해상도 (rawpy 시도)}, {카메라 모델명 (rawpy 시도)}
             rawpy_exif_data = {} # rawpy에서 얻은 부분적 EXIF 저장용
             try:
+                # 호환성 확인은 헤더만 읽으면 되므로 파일 전체를 버퍼로 읽지 않고 경로로 엽니다
                 with rawpy.imread(first_raw_file_path_str) as raw:
                     is_raw_compatible = True
                     original_width = raw.sizes.width # postprocess 후 크기 (raw_width는 센서 크기)
@@ -9822,7 +11255,7 @@ class PhotoSortApp(QMainWindow):
         dont_ask_checkbox.setStyleSheet(checkbox_style) # checkbox_style은 이미 정의되어 있다고 가정
 
         confirm_button = QPushButton(LanguageManager.translate("확인"))
-        confirm_button.setStyleSheet(self.load_button.styleSheet()) # 기존 버튼 스타일 재활용
+        ThemeManager.set_theme_role(confirm_button, "dynamicButton") # 불러오기 버튼과 같은 전역 스타일 사용
         confirm_button.clicked.connect(dialog.accept)
         
         chosen_method_on_accept = None # 확인 버튼 클릭 시 선택된 메소드 저장용
@@ -10212,10 +11645,6 @@ class PhotoSortApp(QMainWindow):
         delete_button_width = UIScaleManager.get("delete_button_width")
         folder_container_spacing = UIScaleManager.get("folder_container_spacing", 5)
 
-        # 버튼 스타일 미리 정의
-        number_button_style = ThemeManager.generate_main_button_style()
-        action_button_style = ThemeManager.generate_action_button_style()
-        
         for i in range(self.folder_count):
             folder_container = QWidget()
             folder_layout = QHBoxLayout(folder_container)
@@ -10223,7 +11652,7 @@ class PhotoSortApp(QMainWindow):
             folder_layout.setSpacing(folder_container_spacing)
 
             folder_button = QPushButton(f"{i+1}")
-            folder_button.setStyleSheet(number_button_style)
+            ThemeManager.set_theme_role(folder_button, "mainButton")
             folder_button.clicked.connect(lambda checked=False, idx=i: self.select_category_folder(idx))
 
             folder_path_label = EditableFolderPathLabel()
@@ -10235,15 +11664,12 @@ class PhotoSortApp(QMainWindow):
             folder_path_label.returnPressed.connect(lambda idx=i: self.confirm_subfolder_creation(idx))
 
             action_button = QPushButton("✕")
-            action_button.setStyleSheet(action_button_style)
+            ThemeManager.set_theme_role(action_button, "actionButton")
 
             action_button.clicked.connect(lambda checked=False, idx=i: self.on_folder_action_button_clicked(idx))
             
-            # 버튼 높이 밑 너비 동기화
-            fm_label = QFontMetrics(folder_path_label.font())
-            label_line_height = fm_label.height()
-            padding = UIScaleManager.get("sort_folder_label_padding")
-            fixed_height = label_line_height + padding
+            # 버튼 높이 밑 너비 동기화 (레이블 높이는 set_folder_index에서 글꼴 높이 + 여백으로 이미 고정됨)
+            fixed_height = folder_path_label.height()
             folder_button.setFixedHeight(fixed_height)
             action_button.setFixedHeight(fixed_height)
             folder_button.setFixedWidth(delete_button_width)
@@ -10535,7 +11961,7 @@ class PhotoSortApp(QMainWindow):
             if self.move_raw_files:
                 base_name = current_image_path.stem
                 if base_name in self.raw_files:
-                    raw_path_before_move = self.raw_files[base_name] # 이동 전 경로 저장
+                    raw_path_before_move = Path(self.raw_files[base_name]) # 이동 전 경로 저장
                     moved_raw_path = self.move_file(raw_path_before_move, target_folder)
                     if moved_raw_path is None:
                         # RAW 이동 실패 시 사용자에게 알리고 계속 진행할지, 아니면 JPG 이동을 취소할지 결정해야 함
@@ -10760,12 +12186,9 @@ class PhotoSortApp(QMainWindow):
         # 기본값: Fit
         self.fit_radio.setChecked(True)
         
-        # 버튼 스타일 설정 (기존 코드 재사용)
-        radio_style = ThemeManager.generate_radio_button_style()
-
-        self.fit_radio.setStyleSheet(radio_style)
-        self.zoom_100_radio.setStyleSheet(radio_style)
-        self.zoom_spin_btn.setStyleSheet(radio_style)
+        # 버튼 스타일 설정 (전역 스타일시트의 radio 역할)
+        for radio in (self.fit_radio, self.zoom_100_radio, self.zoom_spin_btn):
+            ThemeManager.set_theme_role(radio, "radio")
         
         # 이벤트 연결
         self.zoom_group.buttonClicked.connect(self.on_zoom_changed)
@@ -10790,7 +12213,7 @@ class PhotoSortApp(QMainWindow):
         self.minimap_toggle = QCheckBox(LanguageManager.translate("미니맵"))
         self.minimap_toggle.setChecked(True)  # 기본값 체크(ON)
         self.minimap_toggle.toggled.connect(self.toggle_minimap)
-        self.minimap_toggle.setStyleSheet(ThemeManager.generate_checkbox_style())
+        ThemeManager.set_theme_role(self.minimap_toggle, "toggle")
         
         # 미니맵 토글을 중앙에 배치
         minimap_container = QWidget()
@@ -10980,12 +12403,7 @@ class PhotoSortApp(QMainWindow):
         
         try:
             # 미니맵 이미지 생성 (원본 이미지 축소)
-            scaled_pixmap = self.original_pixmap.scaled(
-                self.minimap_width, 
-                self.minimap_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            scaled_pixmap = ScaledPixmapCache.get(self.original_pixmap, self.minimap_width, self.minimap_height)
             
             # 미니맵 크기에 맞게 배경 이미지 조정
             background_pixmap = QPixmap(self.minimap_width, self.minimap_height)
@@ -11354,11 +12772,9 @@ class PhotoSortApp(QMainWindow):
         self.grid_off_radio.setChecked(True)
         self.grid_size_combo.setEnabled(False) # 초기에는 콤보박스 비활성화
 
-        # 스타일 설정
-        radio_style = ThemeManager.generate_radio_button_style()
-
-        self.grid_off_radio.setStyleSheet(radio_style)
-        self.grid_on_radio.setStyleSheet(radio_style)
+        # 스타일 설정 (전역 스타일시트의 radio 역할)
+        ThemeManager.set_theme_role(self.grid_off_radio, "radio")
+        ThemeManager.set_theme_role(self.grid_on_radio, "radio")
 
         # --- 이벤트 연결 ---
         self.grid_mode_group.buttonClicked.connect(self._on_grid_mode_toggled)
@@ -11375,7 +12791,7 @@ class PhotoSortApp(QMainWindow):
         grid_on_container.addWidget(self.grid_size_combo)
         grid_layout_h.addLayout(grid_on_container)
         self.compare_radio = QRadioButton("A | B")
-        self.compare_radio.setStyleSheet(radio_style)
+        ThemeManager.set_theme_role(self.compare_radio, "radio")
         self.grid_mode_group.addButton(self.compare_radio, 2) # ID 2: 비교 모드 
         grid_layout_h.addWidget(self.compare_radio) 
         grid_layout_h.addStretch()
@@ -11386,7 +12802,7 @@ class PhotoSortApp(QMainWindow):
         self.filename_toggle_grid = QCheckBox(LanguageManager.translate("파일명"))
         self.filename_toggle_grid.setChecked(self.show_grid_filenames)
         self.filename_toggle_grid.toggled.connect(self.on_filename_toggle_changed)
-        self.filename_toggle_grid.setStyleSheet(ThemeManager.generate_checkbox_style())
+        ThemeManager.set_theme_role(self.filename_toggle_grid, "toggle")
         filename_toggle_container = QWidget()
         filename_toggle_layout = QHBoxLayout(filename_toggle_container)
         filename_toggle_layout.setContentsMargins(0, 10, 0, 0)
@@ -11503,14 +12919,23 @@ class PhotoSortApp(QMainWindow):
         self.update_compare_filenames()
 
     def update_compare_filenames(self):
+        """Compare 모드 파일명 라벨 갱신을 예약합니다.
+        한 번의 사용자 동작 중 여러 곳에서 호출되어도 setText/adjustSize는 이벤트 루프에서 한 번만 수행됩니다."""
+        if self._compare_filenames_dirty:
+            return
+        self._compare_filenames_dirty = True
+        QTimer.singleShot(0, self._flush_compare_filenames)
+
+    def _flush_compare_filenames(self):
         """Compare 모드에서 A, B 캔버스의 파일명 라벨을 업데이트합니다."""
+        self._compare_filenames_dirty = False
         # 1. Compare 모드가 아니거나, 파일명 표시 옵션이 꺼져있으면 라벨을 숨기고 종료합니다.
         if not self.compare_mode_active or not self.show_grid_filenames:
             self.filename_label_A.hide()
             self.filename_label_B.hide()
             return
 
-        padding = UIScaleManager.get("compare_filename_padding", 10)
+        padding = UI.compare_filename_padding
 
         # 2. A 캔버스 파일명 라벨 업데이트
         # A 캔버스에 유효한 이미지가 표시되고 있는지 확인합니다.
@@ -11554,29 +12979,7 @@ class PhotoSortApp(QMainWindow):
             # 그리드 모드에서 100%, spin 비활성화
             self.zoom_100_radio.setEnabled(False)
             self.zoom_spin_btn.setEnabled(False)
-            # 비활성화 스타일 적용
-            disabled_radio_style = f"""
-                QRadioButton {{
-                    color: {ThemeManager.get_color('text_disabled')};
-                    padding: {UIScaleManager.get("radiobutton_padding")}px;
-                }}
-                QRadioButton::indicator {{
-                    width: {UIScaleManager.get("radiobutton_size")}px;
-                    height: {UIScaleManager.get("radiobutton_size")}px;
-                }}
-                QRadioButton::indicator:checked {{
-                    background-color: {ThemeManager.get_color('accent')};
-                    border: {UIScaleManager.get("radiobutton_border")}px solid {ThemeManager.get_color('accent')};
-                    border-radius: {UIScaleManager.get("radiobutton_border_radius")}px;
-                }}
-                QRadioButton::indicator:unchecked {{
-                    background-color: {ThemeManager.get_color('bg_primary')};
-                    border: {UIScaleManager.get("radiobutton_border")}px solid {ThemeManager.get_color('border')};
-                    border-radius: {UIScaleManager.get("radiobutton_border_radius")}px;
-                }}
-            """
-            self.zoom_100_radio.setStyleSheet(disabled_radio_style)
-            self.zoom_spin_btn.setStyleSheet(disabled_radio_style)
+            # 라디오 버튼의 비활성화 색상은 전역 스타일시트의 :disabled 규칙으로 적용됨
             
             # SpinBox 비활성화 스타일 적용
             disabled_spinbox_style = f"""
@@ -11607,11 +13010,6 @@ class PhotoSortApp(QMainWindow):
             # 그리드 모드가 아닐 때 모든 버튼 활성화
             self.zoom_100_radio.setEnabled(True)
             self.zoom_spin_btn.setEnabled(True)
-            # 활성화 스타일 복원
-            radio_style = ThemeManager.generate_radio_button_style()
-            self.zoom_100_radio.setStyleSheet(radio_style)
-            self.zoom_spin_btn.setStyleSheet(radio_style)
-            
             # SpinBox 활성화 스타일 복원
             active_spinbox_style = f"""
                 QSpinBox {{
@@ -11849,8 +13247,8 @@ class PhotoSortApp(QMainWindow):
         # 별도의 즉각적인 뷰 업데이트는 필요하지 않습니다.
         # (다음에 Grid On으로 전환될 때 self.show_grid_filenames 상태가 반영됩니다.)
 
-    def on_image_loaded(self, cell_index, pixmap, img_path):
-            """비동기 이미지 로딩 완료 시 호출되는 슬롯"""
+    def on_image_loaded(self, cell_index, image, img_path):
+            """비동기 이미지 로딩 완료 시 호출되는 슬롯 (작업 스레드가 만든 QImage를 여기서 QPixmap으로 변환)"""
             if self.grid_mode == "Off" or not self.grid_labels:
                 return
                 
@@ -11858,6 +13256,7 @@ class PhotoSortApp(QMainWindow):
                 cell_widget = self.grid_labels[cell_index] # 이제 GridCellWidget
                 # GridCellWidget의 경로와 일치하는지 확인
                 if cell_widget.property("image_path") == img_path:
+                    pixmap = QPixmap.fromImage(image)
                     cell_widget.setProperty("original_pixmap_ref", pixmap) # 원본 참조 저장
                     cell_widget.setPixmap(pixmap) # setPixmap 호출 (내부에서 update 트리거)
                     cell_widget.setProperty("loaded", True)
@@ -12214,7 +13613,7 @@ class PhotoSortApp(QMainWindow):
                     if self.move_raw_files:
                         base_name = current_image_path.stem
                         if base_name in self.raw_files:
-                            raw_path_before_move = self.raw_files[base_name]
+                            raw_path_before_move = Path(self.raw_files[base_name])
                             moved_raw_path = self.move_file(raw_path_before_move, target_folder)
                             if moved_raw_path is None:
                                 logging.warning(f"RAW 파일 이동 실패: {raw_path_before_move.name}")
@@ -12443,9 +13842,7 @@ class PhotoSortApp(QMainWindow):
         logging.info("작업 공간 초기화 시작...")
         # 1. 백그라운드 작업 취소
         self.resource_manager.cancel_all_tasks()
-        for future in self.image_loader.active_futures:
-            future.cancel()
-        self.image_loader.active_futures.clear()
+        self.image_loader.cancel_loading()
         for future in self.active_thumbnail_futures:
             future.cancel()
         self.active_thumbnail_futures.clear()
@@ -12463,11 +13860,8 @@ class PhotoSortApp(QMainWindow):
         # 4. 캐시 및 원본 이미지 초기화
         self.original_pixmap = None
         self.image_loader.clear_cache()
-        self.fit_pixmap_cache.clear()
+        QPixmapCache.clear()
         self.thumbnail_panel.model.set_image_files([])
-        if hasattr(self, 'grid_thumbnail_cache'):
-            for key in self.grid_thumbnail_cache:
-                self.grid_thumbnail_cache[key].clear()
         # 5. 뷰 및 UI 상태 초기화 (grid_mode를 먼저 Off로 설정)
         self.grid_mode = "Off" # update_grid_view가 참조할 상태를 먼저 설정합니다.
         self.grid_page_start_index = 0
@@ -12618,6 +14012,17 @@ class PhotoSortApp(QMainWindow):
         
         self.exif_worker.request_process.emit(image_path)
 
+    def _on_exiftool_probed(self, available):
+        """ExifWorker의 ExifTool 확인 결과 반영. 실행할 수 없으면 미리 준비한 상주 프로세스 풀을 닫음"""
+        self.exiftool_available = available
+        if available or self.exif_tool_pool is None:
+            return
+        self.exif_tool_pool.close()  # 진행 중인 배치 읽기가 있으면 그 스레드에서 읽기가 끝난 뒤 종료됨
+        self.exif_tool_pool = None
+        self.exif_worker.batch_reader = None
+        if hasattr(self, 'folder_loader_worker'):
+            self.folder_loader_worker.exif_batch_reader = None
+
     def on_exif_info_ready(self, exif_data, image_path):
         """ExifWorker에서 정보 추출 완료 시 호출"""
         # 캐시에 저장
@@ -12834,7 +14239,6 @@ class PhotoSortApp(QMainWindow):
         force_refresh = getattr(self, 'force_refresh', False)
         if force_refresh:
             self.last_fit_size = (0, 0)
-            self.fit_pixmap_cache.clear()
             self.force_refresh = False
 
         if self.grid_mode != "Off":
@@ -12866,13 +14270,13 @@ class PhotoSortApp(QMainWindow):
             self.setWindowTitle(f"PhotoSort - {image_path.name}")
             
             # --- 캐시 확인 및 즉시 적용 로직 (수정됨) ---
-            if image_path_str in self.image_loader.cache:
-                cached_pixmap = self.image_loader.cache[image_path_str]
-                if cached_pixmap and not cached_pixmap.isNull():
+            cached_image = self.image_loader.cache.get(image_path_str)
+            if cached_image is not None:
+                if not cached_image.isNull():
                     logging.info(f"display_current_image: 캐시된 이미지 즉시 적용 - '{image_path.name}'")
                     # _on_image_loaded_for_display와 동일한 로직을 사용하여 뷰를 업데이트합니다.
                     # 이 부분이 누락되어 화면이 갱신되지 않았습니다.
-                    self._on_image_loaded_for_display(cached_pixmap, image_path_str, current_index)
+                    self._on_image_loaded_for_display(cached_image, image_path_str, current_index)
                     return # 캐시를 사용했으므로 비동기 로딩 없이 함수 종료
 
             # --- 캐시에 없으면 비동기 로딩 요청 ---
@@ -13011,7 +14415,7 @@ class PhotoSortApp(QMainWindow):
             else:
                 # JPG 또는 RAW (preview 모드)는 기존 ImageLoader.load_image_with_orientation 직접 호출
                 logging.info(f"_load_image_task: '{file_path_obj.name}' 직접 로드 시도 (JPG 또는 RAW-preview).")
-                pixmap = self.image_loader.load_image_with_orientation(image_path)
+                image = self.image_loader.load_image_with_orientation(image_path)
 
                 if not resource_manager._running: # 로드 후 다시 확인
                     if hasattr(self, 'image_loader'):
@@ -13023,7 +14427,7 @@ class PhotoSortApp(QMainWindow):
                 
                 if hasattr(self, 'image_loader'):
                     QMetaObject.invokeMethod(self.image_loader, "loadCompleted", Qt.QueuedConnection,
-                                             Q_ARG(QPixmap, pixmap),
+                                             Q_ARG(QImage, image),
                                              Q_ARG(str, image_path),
                                              Q_ARG(int, requested_index))
                 return True
@@ -13043,9 +14447,10 @@ class PhotoSortApp(QMainWindow):
             return False
 
 
-    def _on_image_loaded_for_display(self, pixmap, image_path_str_loaded, requested_index):
+    def _on_image_loaded_for_display(self, image, image_path_str_loaded, requested_index):
         if self.current_image_index != requested_index:
             return
+        pixmap = QPixmap.fromImage(image)  # QPixmap은 GUI 스레드에서만 생성
         if hasattr(self, 'loading_indicator_timer'): self.loading_indicator_timer.stop()
         if pixmap.isNull():
             self.image_label.setText(f"{LanguageManager.translate('이미지 로드 실패')}")
@@ -13126,19 +14531,14 @@ class PhotoSortApp(QMainWindow):
 
         # 2. 디코딩에 성공했으면, 먼저 QPixmap을 만들고 즉시 캐시에 저장
         try:
-            data_bytes = result.get('data')
-            shape = result.get('shape')
-            if not data_bytes or not shape:
-                raise ValueError("디코딩 결과 데이터 또는 형태 정보 누락")
-            height, width, _ = shape
-            qimage = QImage(data_bytes, width, height, width * 3, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
-            if pixmap.isNull():
-                raise ValueError("디코딩된 데이터로 QPixmap 생성 실패")
+            image = qimage_from_decoded_rgb(result)
+            if image.isNull():
+                raise ValueError("디코딩된 데이터로 QImage 생성 실패")
+            pixmap = QPixmap.fromImage(image)
 
             # *** 핵심 수정: 성공한 모든 결과를 캐시에 저장 ***
             if hasattr(self, 'image_loader'):
-                self.image_loader._add_to_cache(file_path, pixmap)
+                self.image_loader._add_to_cache(file_path, image)
             logging.info(f"  _on_raw_decoded_for_display: RAW 이미지 캐싱 성공: '{Path(file_path).name}'")
 
         except Exception as e:
@@ -13172,17 +14572,6 @@ class PhotoSortApp(QMainWindow):
 
         logging.info(f"_on_raw_decoded_for_display 종료: 파일='{Path(file_path).name if file_path else 'N/A'}'")
 
-    def process_pending_raw_results(self):
-        """ResourceManager를 통해 RawDecoderPool의 완료된 결과들을 처리합니다."""
-        if hasattr(self, 'resource_manager') and self.resource_manager:
-            # 한 번에 최대 5개의 결과를 처리하도록 시도 (조정 가능)
-            processed_count = self.resource_manager.process_raw_results(max_results=5)
-            if processed_count > 0:
-                logging.debug(f"process_pending_raw_results: {processed_count}개의 RAW 디코딩 결과 처리됨.")
-        # else: # ResourceManager가 없는 예외적인 경우
-            # logging.warning("process_pending_raw_results: ResourceManager 인스턴스가 없습니다.")
-
-
     def _on_image_load_failed(self, image_path, error_message, requested_index):
         """이미지 로드 실패 시 UI 스레드에서 실행"""
         # 요청 시점의 인덱스와 현재 인덱스 비교 (이미지 변경 여부 확인)
@@ -13219,7 +14608,8 @@ class PhotoSortApp(QMainWindow):
         self.previous_image_index = current_index
 
         # 캐시된 이미지와 현재 로딩 요청된 이미지 확인
-        cached_images = set(self.image_loader.cache.keys())
+        with self.image_loader.cache_lock:
+            cached_images = set(self.image_loader.cache.keys())
         # (이하 로직은 기존과 거의 동일하나, 범위 변수를 프로필에서 가져온 값으로 사용)
         
         to_preload = []
@@ -13246,15 +14636,14 @@ class PhotoSortApp(QMainWindow):
                     priority = 'medium' if offset <= priority_close_threshold else 'low'
                     to_preload.append((idx, priority))
 
-        # 로드 요청 제출
+        # 로드 요청 제출 (우선순위별로 묶어 한 번에 제출, 우선순위 내 순서는 유지)
+        # 여기서는 _preload_image_for_grid를 사용하여 preview만 로드하는 것으로 단순화
+        tasks_by_priority = {}
         for idx, priority in to_preload:
-            img_path = str(self.image_files[idx])
-            # 여기서는 _preload_image_for_grid를 사용하여 preview만 로드하는 것으로 단순화
-            self.resource_manager.submit_imaging_task_with_priority(
-                priority,
-                self._preload_image_for_grid, 
-                img_path
-            )
+            tasks_by_priority.setdefault(priority, []).append(
+                (self._preload_image_for_grid, (str(self.image_files[idx]),), {}))
+        for priority, tasks in tasks_by_priority.items():
+            self.resource_manager.submit_imaging_tasks_batch(priority, tasks)
 
 
     def on_grid_cell_clicked(self, clicked_widget, clicked_index):
@@ -13399,12 +14788,58 @@ class PhotoSortApp(QMainWindow):
             return Path(__file__).parent
 
     def save_state(self):
-        """현재 애플리케이션 상태를 JSON 파일에 저장"""
+        """현재 애플리케이션 상태 저장을 예약합니다.
+        짧은 시간 안에 여러 번 호출되면 한 번의 직렬화와 디스크 쓰기로 합쳐집니다 (_write_pending_state)."""
+        self.state_write_timer.start()
+
+    def _write_pending_state(self):
+        """디바운스 타이머 만료 시 호출, 현재 상태를 직렬화하여 저장 스레드로 넘깁니다."""
+        text = self._serialize_state()
+        if text is None:
+            return
+        save_path = str(self.get_script_dir() / self.STATE_FILE)
+        if self.state_saver_thread.isRunning():
+            self.state_saver.requestWrite.emit(save_path, text)
+        else:
+            StateSaver.write_atomic(save_path, text)
+
+    def _shutdown_state_saver(self, flush=True):
+        """대기 중인 상태 저장을 정리하고 저장 스레드를 종료합니다.
+        flush=True이면 스레드의 남은 쓰기를 마친 뒤 현재 상태를 동기적으로 한 번 더 기록합니다.
+        반환값: 저장 스레드가 종료되었으면 True, 제한 시간 안에 종료되지 않았으면 False"""
+        self.state_write_timer.stop()
+        if self.state_saver_thread.isRunning():
+            self.state_saver_thread.quit()
+            if not self.state_saver_thread.wait(2000):
+                # 저장 스레드가 아직 같은 .tmp 파일에 쓰는 중이므로 동시에 쓰지 않도록 최종 저장을 건너뜀
+                logging.warning("상태 저장 스레드가 제때 종료되지 않아 최종 상태 저장을 건너뜁니다.")
+                return False
+        if flush:
+            text = self._serialize_state()
+            if text is not None:
+                StateSaver.write_atomic(str(self.get_script_dir() / self.STATE_FILE), text)
+        return True
+
+    def _delete_state_file(self):
+        """저장 스레드를 멈춘 뒤 상태 파일과 임시(.tmp) 파일을 삭제합니다.
+        진행 중인 쓰기가 삭제 후 os.replace로 파일을 되살리지 않도록, 스레드가 끝날 때까지 기다린 뒤 삭제합니다.
+        삭제 실패 시 OSError를 그대로 전달합니다."""
+        if not self._shutdown_state_saver(flush=False):
+            self.state_saver_thread.wait()  # 작은 JSON 한 번 쓰기이므로 제한 없이 완료를 기다림
+        state_file_path = self.get_script_dir() / self.STATE_FILE
+        Path(f"{state_file_path}.tmp").unlink(missing_ok=True)
+        if state_file_path.exists():
+            state_file_path.unlink()
+            return True
+        return False
+
+    def _serialize_state(self):
+        """현재 애플리케이션 상태를 JSON 문자열로 직렬화합니다. 저장하지 않아야 하면 None 반환"""
 
         #첫 실행 중에는 상태를 저장하지 않음
         if hasattr(self, 'is_first_run') and self.is_first_run:
             logging.debug("save_state: 첫 실행 중이므로 상태 저장을 건너뜀")
-            return
+            return None
         
         # --- 현재 실제로 선택/표시된 이미지의 '전체 리스트' 인덱스 계산 ---
         actual_current_image_list_index = -1
@@ -13419,7 +14854,7 @@ class PhotoSortApp(QMainWindow):
         state_data = {
             "current_folder": str(self.current_folder) if self.current_folder else "",
             "raw_folder": str(self.raw_folder) if self.raw_folder else "",
-            "raw_files": {k: str(v) for k, v in self.raw_files.items()},
+            "raw_files": dict(self.raw_files),
             "move_raw_files": self.move_raw_files,
             "target_folders": [str(f) if f else "" for f in self.target_folders],
             "zoom_mode": self.zoom_mode,
@@ -13451,13 +14886,11 @@ class PhotoSortApp(QMainWindow):
             "image_B_path": str(self.image_B_path) if self.image_B_path else "",
         }
 
-        save_path = self.get_script_dir() / self.STATE_FILE
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=4, ensure_ascii=False)
-            logging.info(f"상태 저장 완료: {save_path}")
+            return json.dumps(state_data, separators=(',', ':'), ensure_ascii=False)
         except Exception as e:
-            logging.error(f"상태 저장 실패: {e}")
+            logging.error(f"상태 직렬화 실패: {e}")
+            return None
 
     def load_state(self):
         """JSON 파일에서 애플리케이션 상태 불러오기"""
@@ -13509,6 +14942,7 @@ class PhotoSortApp(QMainWindow):
             self.control_panel_on_right = loaded_data.get("control_panel_on_right", False)
             self.show_grid_filenames = loaded_data.get("show_grid_filenames", False)
             self.viewport_move_speed = loaded_data.get("viewport_move_speed", 5)
+            self.viewport_move_amount = self.viewport_move_speed * 12
             self.mouse_wheel_action = loaded_data.get("mouse_wheel_action", "photo_navigation")
             self.mouse_wheel_sensitivity = loaded_data.get("mouse_wheel_sensitivity", 1)
             self.mouse_pan_sensitivity = loaded_data.get("mouse_pan_sensitivity", 1.5)
@@ -13573,7 +15007,7 @@ class PhotoSortApp(QMainWindow):
             self.current_folder = loaded_data.get("current_folder", "")
             self.raw_folder = loaded_data.get("raw_folder", "")
             raw_files_str = loaded_data.get("raw_files", {})
-            self.raw_files = {k: Path(v) for k, v in raw_files_str.items() if v and Path(v).exists()}
+            self.raw_files = {k: v for k, v in raw_files_str.items() if v and os.path.exists(v)}
             self.is_raw_only_mode = loaded_data.get("is_raw_only_mode", False)
             self.last_loaded_raw_method_from_state = loaded_data.get("last_used_raw_method", "preview")
 
@@ -13700,7 +15134,7 @@ class PhotoSortApp(QMainWindow):
             self.idle_preload_timer.stop()
         if hasattr(self, 'wheel_reset_timer') and self.wheel_reset_timer.isActive():
             self.wheel_reset_timer.stop()
-        # raw_result_processor_timer와 memory_monitor_timer는 앱 전역에서 계속 실행되어야 하므로 중지하지 않습니다.
+        # memory_monitor_timer는 앱 전역에서 계속 실행되어야 하므로 중지하지 않습니다.
 
         # --- 2. 상태 변수 초기화 ---
         logging.debug("  -> 상태 변수 초기화...")
@@ -13732,18 +15166,19 @@ class PhotoSortApp(QMainWindow):
         if hasattr(self, 'image_loader'):
             self.image_loader.clear_cache()
             self.image_loader.set_raw_load_strategy("preview")
-        self.fit_pixmap_cache.clear()
+        QPixmapCache.clear()
         self.last_fit_size = (0,0)
 
         # 기타 UI 및 상호작용 관련 상태
         self.last_processed_camera_model = None
         self.viewport_move_speed = 5
+        self.viewport_move_amount = self.viewport_move_speed * 12
         self.show_grid_filenames = False
         self.mouse_wheel_sensitivity = 1
         self.mouse_wheel_accumulator = 0
         self.last_wheel_direction = 0
         self.control_panel_on_right = False
-        self.pressed_keys_for_viewport.clear()
+        self.viewport_key_mask = 0
         self.pressed_number_keys.clear()
         self.is_potential_drag = False
         self.is_idle_preloading_active = False
@@ -13779,16 +15214,9 @@ class PhotoSortApp(QMainWindow):
 
     def reload_raw_files_from_state(self, folder_path):
         """ 저장된 RAW 폴더 경로에서 파일 목록을 다시 로드하고 리스트를 반환 """
-        target_path = Path(folder_path)
-        temp_raw_file_list = []
         try:
-            # RAW 파일 검색
-            for ext in self.raw_extensions:
-                temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-                temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}'))
-
-            # 중복 제거 및 정렬
-            unique_raw_files = sorted(list(set(temp_raw_file_list)))
+            # RAW 파일 검색 (대소문자 구분 없이 한 번만 스캔) 및 정렬
+            unique_raw_files = sorted(Path(entry.path) for entry in iter_photos(folder_path, self.raw_extensions))
 
             if unique_raw_files:
                 logging.info(f"RAW 파일 목록 복원됨: {len(unique_raw_files)}개")
@@ -13907,7 +15335,7 @@ class PhotoSortApp(QMainWindow):
         # 4. RAW 파일 딕셔너리 복원 (중복 검사 추가)
         if raw_source_path:
             if jpg_source_path.stem not in self.raw_files:
-                self.raw_files[jpg_source_path.stem] = raw_source_path
+                self.raw_files[jpg_source_path.stem] = str(raw_source_path)
                 logging.debug(f"Undo: Restored RAW file mapping for {jpg_source_path.stem}")
             else:
                 logging.warning(f"Undo: Skipped duplicate RAW file mapping for {jpg_source_path.stem}")
@@ -13916,7 +15344,7 @@ class PhotoSortApp(QMainWindow):
             jpg_source_path = Path(move_info["jpg_source"])
             self.image_B_path = jpg_source_path
             # B 캔버스용 pixmap도 다시 로드
-            self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+            self.original_pixmap_B = self.load_image_with_orientation(str(self.image_B_path))
             self.update_compare_filenames()
             logging.debug(f"Undo: Restored image to Canvas B: {self.image_B_path.name}")
 
@@ -14012,7 +15440,6 @@ class PhotoSortApp(QMainWindow):
                 self.update_counter_layout()
             if self.zoom_mode == "Fit":
                 self.last_fit_size = (0, 0)
-                self.fit_pixmap_cache.clear()
             self.display_current_image()
         else: # Grid 모드 복원
             self.grid_page_start_index = target_page_start_index
@@ -14129,7 +15556,6 @@ class PhotoSortApp(QMainWindow):
                     self.update_counter_layout()
                 if self.zoom_mode == "Fit":
                     self.last_fit_size = (0, 0)
-                    self.fit_pixmap_cache.clear()
                 self.display_current_image()
             else:
                 # Grid 모드
@@ -14181,7 +15607,6 @@ class PhotoSortApp(QMainWindow):
                     self.update_zoom_radio_buttons_state()
                 if self.zoom_mode == "Fit":
                     self.last_fit_size = (0, 0)
-                    self.fit_pixmap_cache.clear()
                 self.display_current_image()
             else:
                 # Grid 모드
@@ -14223,16 +15648,13 @@ class PhotoSortApp(QMainWindow):
         if hasattr(self, 'file_list_dialog') and self.file_list_dialog and self.file_list_dialog.isVisible():
             self.file_list_dialog.close()  # 다이얼로그 닫기 요청
 
-        self.save_state()  # 상태 저장
+        self._shutdown_state_saver()  # 대기 중인 저장을 마치고 최종 상태를 동기적으로 저장
 
         # 메모리 집약적인 객체 명시적 해제
         logging.info("메모리 해제: 이미지 캐시 정리...")
         if hasattr(self, 'image_loader') and hasattr(self.image_loader, 'cache'):
             self.image_loader.cache.clear()
-        self.fit_pixmap_cache.clear()
-        if hasattr(self, 'grid_thumbnail_cache'):
-            for key in self.grid_thumbnail_cache:
-                self.grid_thumbnail_cache[key].clear()
+        QPixmapCache.clear()
         self.original_pixmap = None
         
         # 모든 백그라운드 작업 취소
@@ -14265,6 +15687,8 @@ class PhotoSortApp(QMainWindow):
             if not self.exif_thread.wait(1000):  # 1초 대기
                 self.exif_thread.terminate()  # 강제 종료
             logging.info("EXIF 워커 스레드 종료 완료")
+        if getattr(self, 'exif_tool_pool', None):
+            self.exif_tool_pool.close()
         # === EXIF 스레드 정리 끝 ===
 
         # grid_thumbnail_executor 종료 추가
@@ -14280,7 +15704,8 @@ class PhotoSortApp(QMainWindow):
         
         logging.info("앱 종료 중: 리소스 정리 완료")
 
-        # 로그 핸들러 정리
+        # 로그 핸들러 정리 (대기 중인 로그를 먼저 파일에 기록)
+        stop_log_listener()
         for handler in logging.root.handlers[:]:
             handler.close()
             logging.root.removeHandler(handler)
@@ -14312,18 +15737,17 @@ class PhotoSortApp(QMainWindow):
             # Fit 모드인 경우 기존 캐시 무효화
             if self.zoom_mode == "Fit":
                 self.last_fit_size = (0, 0)
-                self.fit_pixmap_cache.clear()
             
             # 이미지 표시
             self.display_current_image()
             
             # 이미지 로더의 캐시 확인하여 이미 메모리에 있으면 즉시 적용을 시도
             image_path = str(self.image_files[index])
-            if image_path in self.image_loader.cache:
-                cached_pixmap = self.image_loader.cache[image_path]
-                if cached_pixmap and not cached_pixmap.isNull():
+            cached_image = self.image_loader.cache.get(image_path)
+            if cached_image is not None:
+                if not cached_image.isNull():
                     # 캐시된 이미지가 있으면 즉시 적용 시도
-                    self.original_pixmap = cached_pixmap
+                    self.original_pixmap = QPixmap.fromImage(cached_image)
                     if self.zoom_mode == "Fit":
                         self.apply_zoom_to_image()
 
@@ -14591,22 +16015,15 @@ class PhotoSortApp(QMainWindow):
                 return True
 
             is_viewport_move_condition = (self.grid_mode == "Off" and self.zoom_mode in ["100%", "Spin"] and self.original_pixmap)
-            key_to_add_for_viewport = None
+            viewport_key_bit = 0
             if is_viewport_move_condition:
                 if modifiers & Qt.ShiftModifier:
-                    if key == Qt.Key_A: key_to_add_for_viewport = Qt.Key_Left
-                    elif key == Qt.Key_D: key_to_add_for_viewport = Qt.Key_Right
-                    elif key == Qt.Key_W: key_to_add_for_viewport = Qt.Key_Up
-                    elif key == Qt.Key_S: key_to_add_for_viewport = Qt.Key_Down
-                elif not (modifiers & Qt.ShiftModifier):
-                    if key == Qt.Key_Left: key_to_add_for_viewport = Qt.Key_Left
-                    elif key == Qt.Key_Right: key_to_add_for_viewport = Qt.Key_Right
-                    elif key == Qt.Key_Up: key_to_add_for_viewport = Qt.Key_Up
-                    elif key == Qt.Key_Down: key_to_add_for_viewport = Qt.Key_Down
-            if key_to_add_for_viewport:
+                    viewport_key_bit = self.VIEWPORT_WASD_KEY_BITS.get(key, 0)
+                else:
+                    viewport_key_bit = self.VIEWPORT_ARROW_KEY_BITS.get(key, 0)
+            if viewport_key_bit:
                 if not event.isAutoRepeat():
-                    if key_to_add_for_viewport not in self.pressed_keys_for_viewport:
-                        self.pressed_keys_for_viewport.add(key_to_add_for_viewport)
+                    self.viewport_key_mask |= viewport_key_bit
                     if not self.viewport_move_timer.isActive():
                         self.viewport_move_timer.start()
                 return True
@@ -14648,22 +16065,15 @@ class PhotoSortApp(QMainWindow):
                         self.move_current_image_to_folder(folder_index)
                     self.image_processing = False
                 return True
-            key_to_remove_from_viewport = None
-            if key == Qt.Key_Shift:
-                if self.pressed_keys_for_viewport: self.pressed_keys_for_viewport.clear()
-            elif key == Qt.Key_Left: key_to_remove_from_viewport = Qt.Key_Left
-            elif key == Qt.Key_Right: key_to_remove_from_viewport = Qt.Key_Right
-            elif key == Qt.Key_Up: key_to_remove_from_viewport = Qt.Key_Up
-            elif key == Qt.Key_Down: key_to_remove_from_viewport = Qt.Key_Down
-            elif key == Qt.Key_A: key_to_remove_from_viewport = Qt.Key_Left
-            elif key == Qt.Key_D: key_to_remove_from_viewport = Qt.Key_Right
-            elif key == Qt.Key_W: key_to_remove_from_viewport = Qt.Key_Up
-            elif key == Qt.Key_S: key_to_remove_from_viewport = Qt.Key_Down
             action_taken = False
-            if key_to_remove_from_viewport and key_to_remove_from_viewport in self.pressed_keys_for_viewport:
-                self.pressed_keys_for_viewport.remove(key_to_remove_from_viewport)
-                action_taken = True
-            if not self.pressed_keys_for_viewport and self.viewport_move_timer.isActive():
+            if key == Qt.Key_Shift:
+                self.viewport_key_mask = 0
+            else:
+                viewport_key_bit = self.VIEWPORT_ARROW_KEY_BITS.get(key) or self.VIEWPORT_WASD_KEY_BITS.get(key, 0)
+                if self.viewport_key_mask & viewport_key_bit:
+                    self.viewport_key_mask &= ~viewport_key_bit
+                    action_taken = True
+            if not self.viewport_key_mask and self.viewport_move_timer.isActive():
                 self.viewport_move_timer.stop()
                 if self.grid_mode == "Off" and self.zoom_mode in ["100%", "Spin"] and self.original_pixmap:
                     final_rel_center = self._get_current_view_relative_center()